@@ -0,0 +1 @@
+"""Core helpers for the ResumeSmartX ATS app (parsing, caching, LLM access)."""
@@ -0,0 +1,137 @@
+"""HTTP API over ``ats.service`` (FastAPI, see requirements-optional.txt).
+
+    uvicorn ats.api:app --workers 4
+    python -m ats.api --port 8000 --workers 4
+
+Handlers are async; the blocking work runs on the same fair worker pool as
+the app (``LLM_MAX_WORKERS`` per process). Requests are scheduled per client
+(``X-Client-Id`` header, else the client address), so one caller's large
+batch doesn't queue everyone else behind it. ``/batch`` streams NDJSON, one
+line per resume as it finishes.
+
+Endpoints take multipart forms: ``job_description`` as a field, resumes as
+PDF files. ``format=pdf`` on the generation endpoints returns the rendered
+PDF instead of JSON.
+"""
+import asyncio
+import json
+from dataclasses import asdict
+from typing import List
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from fastapi import FastAPI, File, Form, Request, UploadFile  # noqa: E402
+from fastapi.responses import JSONResponse, Response, StreamingResponse  # noqa: E402
+
+from ats import service  # noqa: E402
+from ats.concurrency import get_executor, set_session  # noqa: E402
+
+app = FastAPI(title="ATS", description="Resume parsing, matching and generation without the Streamlit UI.")
+
+
+@app.exception_handler(service.ServiceError)
+async def service_error(request, error):
+    return JSONResponse(status_code=422, content={"detail": str(error)})
+
+
+def _set_client(request):
+    # Per-client session, so the fair pool takes turns between callers
+    set_session(request.headers.get("x-client-id") or (request.client.host if request.client else "anonymous"))
+
+
+async def _offload(request, fn, *args, **kwargs):
+    _set_client(request)
+    return await asyncio.wrap_future(get_executor().submit(fn, *args, **kwargs))
+
+
+async def _resume(request, upload):
+    return await _offload(request, service.load_resume, await upload.read())
+
+
+def _text_or_pdf(text, output, title, filename):
+    if output == "pdf":
+        return Response(service.to_pdf(text, title=title), media_type="application/pdf",
+                        headers={"Content-Disposition": f'attachment; filename="{filename}"'})
+    return {"text": text}
+
+
+@app.get("/health")
+async def health():
+    return {"status": "ok"}
+
+
+@app.post("/parse")
+async def parse(request: Request, resume: UploadFile = File(...)):
+    parsed = await _resume(request, resume)
+    return {"digest": parsed.digest, "pages": parsed.page_count, "ocr_pages": list(parsed.ocr_pages),
+            "text": service.compact_resume(parsed)}
+
+
+@app.post("/match")
+async def match(request: Request, job_description: str = Form(...), resume: UploadFile = File(...),
+                summary: bool = Form(True)):
+    parsed = await _resume(request, resume)
+    return asdict(await _offload(request, service.match, job_description, parsed, summary=summary))
+
+
+@app.post("/score")
+async def score(request: Request, job_description: str = Form(...), resume: UploadFile = File(...)):
+    parsed = await _resume(request, resume)
+    return asdict(await _offload(request, service.score, job_description, parsed))
+
+
+@app.post("/learning-path")
+async def learning_path(request: Request, job_description: str = Form(...), resume: UploadFile = File(...),
+                        duration: str = Form(service.LEARNING_PATH_DURATIONS[0]), format: str = Form("json")):
+    parsed = await _resume(request, resume)
+    text = await _offload(request, service.learning_path, job_description, parsed, duration)
+    return _text_or_pdf(text, format, f"Personalized Learning Path ({duration})", "learning_path.pdf")
+
+
+@app.post("/updated-resume")
+async def updated_resume(request: Request, resume: UploadFile = File(...), format: str = Form("json")):
+    parsed = await _resume(request, resume)
+    text = await _offload(request, service.updated_resume, parsed)
+    return _text_or_pdf(text, format, None, "Updated_Resume.pdf")
+
+
+@app.post("/interview-questions")
+async def interview_questions(request: Request, job_description: str = Form(...)):
+    return {"text": await _offload(request, service.interview_questions, job_description)}
+
+
+@app.post("/batch")
+async def batch(request: Request, job_description: str = Form(...), files: List[UploadFile] = File(...),
+                ops: str = Form("match"), duration: str = Form(service.LEARNING_PATH_DURATIONS[0])):
+    from ats.batch import collect_pdfs
+
+    # Set on this request's context, which the streaming below runs in
+    _set_client(request)
+    operations = [op.strip() for op in ops.split(",") if op.strip()]
+
+    def items():
+        for upload in files:
+            yield from collect_pdfs([(upload.filename, upload.file.read())])
+
+    results = service.process_resumes(items(), job_description, operations, duration=duration)
+    return StreamingResponse((json.dumps(result.to_dict()) + "\n" for result in results),
+                             media_type="application/x-ndjson")
+
+
+def main():
+    import argparse
+
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Serve the ATS HTTP API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1, help="server processes")
+    args = parser.parse_args()
+    uvicorn.run("ats.api:app", host=args.host, port=args.port, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
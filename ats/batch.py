@@ -0,0 +1,262 @@
+"""Batch ATS scoring: many resumes against one job description.
+
+PDFs are parsed in the shared ``ats.extract`` process pool (parsing is
+CPU-bound and PyPDF2 holds the GIL), then scored with bounded concurrent LLM
+calls through ``fan_out``.
+Every file yields exactly one ``BatchResult``; a PDF that fails to parse or
+score is reported in its row instead of aborting the batch.
+"""
+import csv
+import io
+import os
+import zipfile
+from collections import Counter, deque
+from itertools import islice
+from concurrent.futures import FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from ats.concurrency import Task, fan_out
+from ats.extract import PDF_PARSE_WORKERS, discard_pool, get_parse_pool
+from ats.ranking import ResumeIndex
+from ats.resume import cached_resume, extract_resume, resume_digest, store_resume
+from ats.structured import match_resume
+from ats.text_prep import jd_for_prompt, resume_for_prompt
+
+BATCH_MAX_FILES = int(os.getenv("BATCH_MAX_FILES", "500"))
+
+
+@dataclass
+class BatchResult:
+    name: str
+    score: Optional[float] = None
+    keyword_score: Optional[float] = None
+    summary: str = ""
+    pages: int = 0
+    error: str = ""
+
+
+@dataclass
+class Unreadable:
+    """Stands in for a file's bytes when an archive (or one of its members) can't be read."""
+    error: str
+
+
+def _is_pdf(info):
+    return not info.is_dir() and info.filename.lower().endswith(".pdf")
+
+
+def collect_pdfs(files):
+    """Expand ``(name, bytes)`` uploads into PDFs, unpacking any ZIP archives.
+
+    Members are decompressed one at a time as they are consumed. A corrupt
+    archive or member comes out as ``(name, Unreadable(error))`` so the caller
+    can report it in its row and carry on with the rest.
+    """
+    for name, data in files:
+        if not name.lower().endswith(".zip"):
+            yield name, data
+            continue
+        try:
+            archive = zipfile.ZipFile(io.BytesIO(data))
+        except (zipfile.BadZipFile, OSError) as e:
+            yield name, Unreadable(f"Failed to open ZIP: {e}")
+            continue
+        with archive:
+            for info in archive.infolist():
+                if _is_pdf(info):
+                    try:
+                        member = archive.read(info)
+                    except Exception as e:
+                        member = Unreadable(f"Failed to extract from {name}: {e}")
+                    yield os.path.basename(info.filename), member
+
+
+def count_pdfs(files):
+    """How many entries ``collect_pdfs`` will yield, from the ZIP directories alone."""
+    total = 0
+    for name, data in files:
+        if not name.lower().endswith(".zip"):
+            total += 1
+            continue
+        try:
+            with zipfile.ZipFile(io.BytesIO(data)) as archive:
+                total += sum(1 for info in archive.infolist() if _is_pdf(info))
+        except (zipfile.BadZipFile, OSError):
+            total += 1
+    return total
+
+
+def _parse_worker(data):
+    # Runs in a child process; only picklable values cross the boundary
+    return extract_resume(data, parallel=False)
+
+
+class ParseStage:
+    """Parses ``(name, bytes)`` pairs in the shared process pool, one ``add`` at a time.
+
+    ``add`` answers cache hits and unreadable files right away; everything
+    else is submitted, and callers ``wait`` on ``futures`` and pass the done
+    ones to ``finished``. When a worker crashes, the pool breaks and every file
+    in flight fails with it. Those files are rerun one at a time on a fresh
+    pool, so only the PDF that actually crashes it is reported as failed.
+    """
+
+    def __init__(self, pool=None):
+        self.pool = pool or get_parse_pool()
+        # future -> (name, data, pool it ran on, whether it runs alone)
+        self.futures = {}
+        # Files that were in flight when a worker died, and files held back while they rerun
+        self._suspects = deque()
+        self._held = deque()
+
+    @property
+    def pending(self):
+        return len(self.futures) + len(self._suspects) + len(self._held)
+
+    def add(self, name, data):
+        """``(name, parsed, error)`` if the result is known now, else None once the file is queued."""
+        if isinstance(data, Unreadable):
+            return name, None, data.error
+        cached = cached_resume(resume_digest(data))
+        if cached is not None:
+            return name, cached, ""
+        if self._suspects or self._isolating():
+            self._held.append((name, data))
+        else:
+            self._submit(name, data)
+        return None
+
+    def _submit(self, name, data, alone=False):
+        self.futures[self.pool.submit(_parse_worker, data)] = (name, data, self.pool, alone)
+
+    def _isolating(self):
+        return any(alone for _, _, _, alone in self.futures.values())
+
+    def finished(self, done):
+        """``(name, parsed, error)`` for each finished future in ``done`` that belongs to this stage."""
+        results = []
+        for future in done:
+            if future not in self.futures:
+                continue
+            name, data, pool, alone = self.futures.pop(future)
+            try:
+                parsed = future.result()
+            except BrokenProcessPool as e:
+                if pool is self.pool:
+                    discard_pool(pool)
+                    self.pool = get_parse_pool()
+                if alone:
+                    results.append((name, None, f"Failed to read PDF: {e}"))
+                else:
+                    self._suspects.append((name, data))
+                continue
+            except Exception as e:
+                results.append((name, None, f"Failed to read PDF: {e}"))
+                continue
+            store_resume(parsed)
+            results.append((name, parsed, ""))
+        if self._suspects:
+            if not self.futures:
+                self._submit(*self._suspects.popleft(), alone=True)
+        elif not self._isolating():
+            while self._held:
+                self._submit(*self._held.popleft())
+        return results
+
+
+def parse_many(pdfs, pool=None, window=None):
+    """Parse ``(name, bytes)`` pairs, yielding ``(name, ParsedResume | None, error)`` as they finish.
+
+    Files already in the shared resume cache are not sent to the pool. At most
+    ``window`` files are in the pool at once, so concurrent batches from other
+    sessions interleave with this one instead of queueing behind all of it.
+    """
+    stage = ParseStage(pool)
+    window = window or PDF_PARSE_WORKERS
+    pdfs = iter(pdfs)
+    exhausted = False
+    while True:
+        while not exhausted and stage.pending < window:
+            item = next(pdfs, None)
+            if item is None:
+                exhausted = True
+            else:
+                result = stage.add(*item)
+                if result:
+                    yield result
+        if not stage.futures:
+            if exhausted:
+                return
+            continue
+        done, _ = wait(stage.futures, return_when=FIRST_COMPLETED)
+        yield from stage.finished(done)
+
+
+def unique_names(pdfs):
+    """Number repeated names ("resume.pdf (2)"), so every row can be told apart.
+
+    ZIPs often hold several "resume.pdf" files from different folders.
+    """
+    seen = Counter()
+    for name, data in pdfs:
+        seen[name] += 1
+        yield (name if seen[name] == 1 else f"{name} ({seen[name]})"), data
+
+
+def run_batch(files, job_description, generate, pool=None, top_k=None):
+    """Parse and score every resume in ``files``; yields ``BatchResult`` rows as they complete.
+
+    ``generate`` is the LLM call (the app passes ``get_gemini_response``);
+    scores come back as structured ``MatchResult``s. Every parsed resume first
+    gets a local BM25 keyword score; with ``top_k`` only the best ``top_k`` of
+    those are sent to the LLM and the rest keep their keyword score alone.
+    """
+    # islice stops reading ZIP members once the cap is reached
+    pdfs = list(islice(unique_names(collect_pdfs(files)), BATCH_MAX_FILES))
+    parsed = {}
+    for name, resume, error in parse_many(pdfs, pool=pool):
+        if error:
+            yield BatchResult(name=name, error=error)
+        elif not resume.has_text:
+            yield BatchResult(name=name, pages=resume.page_count, error="No extractable text in PDF (scanned, and OCR found none or is not installed)")
+        else:
+            parsed[name] = resume
+    if not parsed:
+        return
+
+    job_description = jd_for_prompt(job_description)
+    texts = {name: resume_for_prompt(resume, "Batch_Percentage_Match") for name, resume in parsed.items()}
+    ranking = ResumeIndex(list(texts.items())).rank(job_description)
+    keyword_scores = {name: round(coverage, 1) for name, _, coverage in ranking}
+    shortlist = [name for name, _, _ in ranking][:top_k] if top_k else list(parsed)
+    for name, _, _ in ranking[len(shortlist):]:
+        yield BatchResult(name=name, keyword_score=keyword_scores[name], pages=parsed[name].page_count,
+                          summary="Not sent for LLM scoring (below the keyword pre-filter cut-off).")
+
+    tasks = [Task(name, match_resume, (job_description, texts[name], generate), {"action": "Batch_Percentage_Match"})
+             for name in shortlist]
+    for name, match, error in fan_out(tasks):
+        row = BatchResult(name=name, keyword_score=keyword_scores[name], pages=parsed[name].page_count)
+        if error:
+            row.error = str(error)
+        else:
+            row.score = match.match_percentage
+            row.summary = match.summary
+        yield row
+
+
+def rank_results(results):
+    """LLM-scored rows first, then keyword-only rows, each by score; failures at the bottom."""
+    return sorted(results, key=lambda r: (r.score is None, r.keyword_score is None,
+                                          -(r.score or 0), -(r.keyword_score or 0), r.name))
+
+
+def results_to_csv(results):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=["rank", "name", "score", "keyword_score", "pages", "error", "summary"])
+    writer.writeheader()
+    for rank, result in enumerate(rank_results(results), start=1):
+        writer.writerow({"rank": rank, **asdict(result)})
+    return buffer.getvalue()
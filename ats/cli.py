@@ -0,0 +1,135 @@
+"""Command-line entry point: the ATS operations without a browser.
+
+``run`` walks files and directories (PDFs and ZIPs of PDFs), streams them
+through ``ats.service.process_resumes`` and prints one JSON line per resume
+as soon as it is done, so the output can be piped into another process
+while the batch is still running::
+
+    python -m ats.cli run --jd jd.txt resumes/ --ops match,score > results.jsonl
+    python -m ats.cli run --jd jd.txt resumes/ --ops updated_resume --pdf-dir out/
+    python -m ats.cli questions --jd jd.txt
+
+A summary line goes to stderr at the end. LLM concurrency is
+``LLM_MAX_WORKERS``; parsing uses ``PDF_PARSE_WORKERS`` processes.
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+# Operations whose text result can also be written out as a PDF
+PDF_OPERATIONS = {"learning_path": "Personalized Learning Path", "updated_resume": None}
+
+
+def iter_files(paths):
+    """``(name, bytes)`` for every PDF/ZIP under ``paths``, read one at a time."""
+    from ats.batch import collect_pdfs
+
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for filename in sorted(files):
+                    if filename.lower().endswith((".pdf", ".zip")):
+                        full = os.path.join(root, filename)
+                        yield from _read(full, os.path.relpath(full, path), collect_pdfs)
+        else:
+            yield from _read(path, os.path.basename(path), collect_pdfs)
+
+
+def _read(path, name, collect_pdfs):
+    with open(path, "rb") as f:
+        data = f.read()
+    if name.lower().endswith(".zip"):
+        for member, pdf in collect_pdfs([(name, data)]):
+            # An archive that can't be opened comes back under its own name
+            yield (name if member == name else f"{name}/{member}"), pdf
+    else:
+        yield name, data
+
+
+def _read_text(value):
+    """``--jd`` takes a file path, ``-`` for stdin, or the text itself."""
+    if value == "-":
+        return sys.stdin.read()
+    if os.path.isfile(value):
+        with open(value, encoding="utf-8") as f:
+            return f.read()
+    return value
+
+
+def _write_pdfs(result, pdf_dir):
+    from ats.service import to_pdf
+
+    stem = re.sub(r"[^\w.-]+", "_", os.path.splitext(result.name)[0])
+    for operation, title in PDF_OPERATIONS.items():
+        if operation in result.results:
+            path = os.path.join(pdf_dir, f"{stem}.{operation}.pdf")
+            with open(path, "wb") as f:
+                f.write(to_pdf(result.results[operation], title=title))
+            result.results[f"{operation}_pdf"] = path
+
+
+def run(args):
+    from ats.service import process_resumes
+
+    job_description = _read_text(args.jd)
+    operations = [op.strip() for op in args.ops.split(",") if op.strip()]
+    if args.pdf_dir:
+        os.makedirs(args.pdf_dir, exist_ok=True)
+    started = time.perf_counter()
+    done = failed = 0
+    for result in process_resumes(iter_files(args.paths), job_description, operations,
+                                  window=args.window, duration=args.duration):
+        if args.pdf_dir and not result.error:
+            _write_pdfs(result, args.pdf_dir)
+        done += 1
+        failed += bool(result.error or result.errors)
+        print(json.dumps(result.to_dict()), flush=True)
+    elapsed = time.perf_counter() - started
+    print(f"{done} resumes in {elapsed:.1f}s ({done / elapsed if elapsed else 0:.2f}/s), {failed} with errors",
+          file=sys.stderr)
+    return 1 if failed and failed == done else 0
+
+
+def questions(args):
+    from ats.service import interview_questions
+
+    print(interview_questions(_read_text(args.jd)))
+    return 0
+
+
+def main(argv=None):
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    from ats.service import LEARNING_PATH_DURATIONS, OPERATIONS, SERVICE_WINDOW, ServiceError
+
+    parser = argparse.ArgumentParser(prog="python -m ats.cli", description="ATS operations without the web UI.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="process resumes and print one JSON line per resume")
+    run_parser.add_argument("paths", nargs="+", help="PDF or ZIP files, or directories of them")
+    run_parser.add_argument("--jd", required=True, help="job description: a file, '-' for stdin, or the text")
+    run_parser.add_argument("--ops", default="match", help=f"comma-separated, from: {', '.join(OPERATIONS)}")
+    run_parser.add_argument("--duration", default=LEARNING_PATH_DURATIONS[0], choices=LEARNING_PATH_DURATIONS)
+    run_parser.add_argument("--pdf-dir", help="also write learning paths / updated resumes here as PDFs")
+    run_parser.add_argument("--window", type=int, default=SERVICE_WINDOW, help="resumes in flight at once")
+    run_parser.set_defaults(handler=run)
+
+    questions_parser = commands.add_parser("questions", help="30 interview questions for a job description")
+    questions_parser.add_argument("--jd", required=True)
+    questions_parser.set_defaults(handler=questions)
+
+    args = parser.parse_args(argv)
+    try:
+        return args.handler(args)
+    except ServiceError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+"""Local checks for code pasted into the Python Code Debugger.
+
+Before the debugger asks Gemini, the code is compiled and scanned for
+undefined names and unused imports (a small pyflakes-style pass over the
+AST). With ``CODE_CHECK_RUN=1`` it is also executed, which catches runtime
+errors too, but only inside a bubblewrap (``bwrap``) sandbox: no network, an
+empty root with just the Python runtime mounted read-only, a cleared
+environment, an unprivileged uid and a throwaway ``/tmp``. A small launcher
+inside the sandbox sets CPU, memory, file-size and process limits before the
+code starts. Without ``bwrap`` the code is never run. Only the exception type
+and line come back, never its message. Reports are cached per code hash. The diagnostics are shown right away and
+attached to the prompt, so Gemini only has to explain and fix them.
+"""
+import ast
+import builtins
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass, field
+
+from ats.cache import LRUCache
+
+# Running pasted code is opt-in, even sandboxed
+CODE_CHECK_RUN = os.getenv("CODE_CHECK_RUN", "0") == "1"
+CODE_CHECK_BWRAP = os.getenv("CODE_CHECK_BWRAP", "bwrap")
+CODE_CHECK_TIMEOUT = float(os.getenv("CODE_CHECK_TIMEOUT", "3"))
+CODE_CHECK_MEMORY_MB = int(os.getenv("CODE_CHECK_MEMORY_MB", "256"))
+MAX_OUTPUT_CHARS = 2000
+
+ERROR_KINDS = ("syntax", "undefined-name", "runtime")
+
+_reports = LRUCache(maxsize=256)
+
+_MODULE_NAMES = {"__file__", "__builtins__", "__annotations__", "__path__", "__cached__"}
+_RESULT = re.compile(r"^@@code-check (\w+) (\d+)$", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class Diagnostic:
+    line: int
+    kind: str
+    message: str
+
+    @property
+    def is_error(self):
+        return self.kind in ERROR_KINDS
+
+    def __str__(self):
+        return f"line {self.line}: {self.message}" if self.line else self.message
+
+
+@dataclass
+class CodeReport:
+    diagnostics: list = field(default_factory=list)
+    # Whether the code was executed, and what it printed
+    ran: bool = False
+    output: str = ""
+
+    @property
+    def errors(self):
+        return [d for d in self.diagnostics if d.is_error]
+
+    @property
+    def warnings(self):
+        return [d for d in self.diagnostics if not d.is_error]
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def to_text(self):
+        return "\n".join(f"- {d}" for d in self.diagnostics)
+
+
+# -------------------- ✅ Static Checks --------------------
+
+def syntax_check(code):
+    """The parsed tree, or a syntax Diagnostic. ``compile`` also catches e.g. ``return`` outside a function."""
+    try:
+        tree = ast.parse(code, "<code>")
+        compile(tree, "<code>", "exec")
+    except SyntaxError as e:
+        return None, Diagnostic(e.lineno or 0, "syntax", f"{type(e).__name__}: {e.msg}")
+    except ValueError as e:
+        # e.g. null bytes in the source
+        return None, Diagnostic(0, "syntax", f"ValueError: {e}")
+    return tree, None
+
+
+def _imported(node):
+    """``(bound name, shown name)`` for each name an import statement binds."""
+    for alias in node.names:
+        if alias.name == "*":
+            continue
+        if alias.asname:
+            yield alias.asname, f"{alias.name} as {alias.asname}"
+        elif isinstance(node, ast.Import):
+            yield alias.name.split(".")[0], alias.name
+        else:
+            yield alias.name, alias.name
+
+
+def name_check(tree):
+    """Undefined names and unused imports.
+
+    Scopes are flattened: a name bound anywhere counts as defined everywhere.
+    That misses some scope errors but never flags working code.
+    """
+    bound = set(dir(builtins)) | _MODULE_NAMES
+    loaded = {}
+    imports = []
+    star_import = False
+    exported = set()
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            if isinstance(node.ctx, ast.Load):
+                loaded.setdefault(node.id, node.lineno)
+            else:
+                bound.add(node.id)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            bound.add(node.name)
+        elif isinstance(node, ast.arg):
+            bound.add(node.arg)
+        elif isinstance(node, ast.ExceptHandler) and node.name:
+            bound.add(node.name)
+        elif isinstance(node, (ast.Global, ast.Nonlocal)):
+            bound.update(node.names)
+        elif isinstance(node, (ast.MatchAs, ast.MatchStar)) and node.name:
+            bound.add(node.name)
+        elif isinstance(node, ast.MatchMapping) and node.rest:
+            bound.add(node.rest)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            if isinstance(node, ast.ImportFrom) and node.module == "__future__":
+                continue
+            star_import = star_import or any(alias.name == "*" for alias in node.names)
+            for name, shown in _imported(node):
+                bound.add(name)
+                imports.append((node.lineno, name, shown))
+        elif isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == "__all__" for t in node.targets):
+            if isinstance(node.value, (ast.List, ast.Tuple)):
+                exported.update(e.value for e in node.value.elts if isinstance(e, ast.Constant))
+
+    diagnostics = []
+    if not star_import:
+        diagnostics.extend(Diagnostic(line, "undefined-name", f"undefined name '{name}'")
+                           for name, line in loaded.items() if name not in bound)
+    diagnostics.extend(Diagnostic(line, "unused-import", f"'{shown}' imported but unused")
+                       for line, name, shown in imports if name not in loaded and name not in exported)
+    return sorted(diagnostics, key=lambda d: d.line)
+
+
+# -------------------- ✅ Sandboxed Run --------------------
+
+# Runs inside the sandbox: limits first, then the code. Failures are reported as
+# "@@code-check <ExceptionType> <line>" so nothing the code put in a message leaves.
+_LAUNCHER = """\
+import resource, sys, traceback
+cpu, memory = int(sys.argv[2]), int(sys.argv[3])
+resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu))
+resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+resource.setrlimit(resource.RLIMIT_FSIZE, (1 << 20, 1 << 20))
+resource.setrlimit(resource.RLIMIT_NPROC, (0, 0))
+resource.setrlimit(resource.RLIMIT_NOFILE, (32, 32))
+with open(sys.argv[1], encoding="utf-8") as f:
+    code = compile(f.read(), "code.py", "exec")
+try:
+    exec(code, {"__name__": "__main__", "__builtins__": __builtins__})
+except SystemExit as e:
+    if e.code not in (None, 0):
+        sys.stdout.flush()
+        print("@@code-check SystemExit 0", file=sys.stderr)
+        sys.exit(1)
+except BaseException as e:
+    frames = [f.lineno for f in traceback.extract_tb(e.__traceback__) if f.filename == "code.py"]
+    sys.stdout.flush()
+    print(f"@@code-check {type(e).__name__} {frames[-1] if frames else 0}", file=sys.stderr)
+    sys.exit(1)
+"""
+
+
+def sandbox_available():
+    """Running needs ``resource`` (POSIX) and the ``bwrap`` binary."""
+    try:
+        import resource  # noqa: F401
+    except ImportError:
+        return False
+    return shutil.which(CODE_CHECK_BWRAP) is not None
+
+
+def sandbox_command(workdir, timeout, memory_mb, bwrap=CODE_CHECK_BWRAP):
+    """The ``bwrap`` argv that runs ``workdir``'s code.py through the launcher."""
+    python = os.path.realpath(sys.executable)
+    command = [bwrap, "--unshare-all", "--die-with-parent", "--new-session", "--clearenv",
+               "--uid", "65534", "--gid", "65534"]
+    # Empty root: only the interpreter, its libraries and the code, all read-only
+    for path in ("/usr", "/lib", "/lib64", "/bin"):
+        command += ["--ro-bind-try", path, path]
+    for path in dict.fromkeys([sys.base_prefix, sys.prefix, os.path.dirname(os.path.dirname(python))]):
+        command += ["--ro-bind", path, path]
+    command += ["--ro-bind", workdir, "/sandbox", "--proc", "/proc", "--dev", "/dev", "--tmpfs", "/tmp",
+                "--chdir", "/tmp", "--setenv", "PYTHONIOENCODING", "utf-8", "--setenv", "HOME", "/tmp",
+                python, "-I", "/sandbox/launcher.py", "/sandbox/code.py",
+                str(int(timeout) + 1), str(memory_mb * 1024 * 1024)]
+    return command
+
+
+def run_code(code, timeout=CODE_CHECK_TIMEOUT, memory_mb=CODE_CHECK_MEMORY_MB):
+    """Run ``code`` in the bwrap sandbox; return ``(diagnostics, output)``.
+
+    Code that waits for input or runs past ``timeout`` gets a warning, not an error.
+    """
+    with tempfile.TemporaryDirectory() as workdir:
+        with open(os.path.join(workdir, "code.py"), "w", encoding="utf-8") as f:
+            f.write(code)
+        with open(os.path.join(workdir, "launcher.py"), "w", encoding="utf-8") as f:
+            f.write(_LAUNCHER)
+        try:
+            result = subprocess.run(sandbox_command(workdir, timeout, memory_mb), stdin=subprocess.DEVNULL,
+                                    capture_output=True, text=True, timeout=timeout, env={},
+                                    start_new_session=True)
+        except subprocess.TimeoutExpired:
+            return [Diagnostic(0, "timeout", f"still running after {timeout:g}s (an endless loop, or it waits for something)")], ""
+    output = result.stdout[-MAX_OUTPUT_CHARS:]
+    if result.returncode == 0:
+        return [], output
+    found = _RESULT.findall(result.stderr)
+    if not found:
+        # Killed by a limit, or the sandbox itself failed to start
+        return [Diagnostic(0, "runtime", f"exited with status {result.returncode} (hit a CPU or memory limit?)")], output
+    kind, line = found[-1][0], int(found[-1][1])
+    if kind == "EOFError":
+        return [Diagnostic(0, "needs-input", "reads input(), so it could not be run to the end")], output
+    if kind == "ModuleNotFoundError":
+        return [Diagnostic(line, "missing-module", "imports a module that isn't installed where the check runs")], output
+    return [Diagnostic(line, "runtime", f"{kind} raised when run")], output
+
+
+def check_code(code, run=CODE_CHECK_RUN):
+    """Compile, name-check and (with ``run``) execute ``code``; cached per code hash."""
+    run = run and sandbox_available()
+    key = hashlib.sha256(f"{run}\x1f{code}".encode("utf-8")).hexdigest()
+
+    def compute():
+        tree, error = syntax_check(code)
+        if error:
+            return CodeReport([error])
+        report = CodeReport(name_check(tree))
+        if run and report.ok:
+            diagnostics, report.output = run_code(code)
+            report.diagnostics.extend(diagnostics)
+            report.ran = True
+        return report
+
+    return _reports.get_or_create(key, compute)
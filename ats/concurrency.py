@@ -0,0 +1,207 @@
+"""Run independent LLM prompts concurrently on a shared thread pool.
+
+``fan_out`` yields each result as soon as it finishes, so a section that needs
+several independent answers waits for the slowest call instead of the sum of
+all of them. Calls sharing a ``key`` (e.g. the same API key or action) are
+capped by a per-key semaphore so one section cannot flood the quota; tasks
+wait for a slot before they are submitted, and a task's timeout only counts
+the time it actually runs.
+
+All LLM work (``fan_out`` tasks and background jobs) shares one bounded
+``FairExecutor``. It keeps a queue per session and serves sessions in turn, so
+a session that queues thirty prompts delays everyone else by one task per
+worker, not by thirty.
+"""
+import contextvars
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+
+LLM_MAX_WORKERS = int(os.getenv("LLM_MAX_WORKERS", "8"))
+LLM_PER_KEY_CONCURRENCY = int(os.getenv("LLM_PER_KEY_CONCURRENCY", "4"))
+LLM_CALL_TIMEOUT = float(os.getenv("LLM_CALL_TIMEOUT", "120"))
+
+_session = contextvars.ContextVar("session", default=None)
+
+
+def set_session(session_id):
+    """Tag work submitted from this thread/context with ``session_id``."""
+    _session.set(session_id)
+
+
+def current_session():
+    """The explicit session, else the Streamlit session running this script, else None."""
+    session = _session.get()
+    if session is None and "streamlit" in sys.modules:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+        ctx = get_script_run_ctx(suppress_warning=True)
+        session = ctx.session_id if ctx else None
+    return session
+
+
+class FairExecutor:
+    """Bounded thread pool that takes tasks from each session's queue in turn.
+
+    Implements ``submit`` like ``concurrent.futures`` executors; the session is
+    taken from ``current_session()`` at submit time.
+    """
+
+    def __init__(self, max_workers=LLM_MAX_WORKERS, thread_name_prefix="llm"):
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self._queues = OrderedDict()
+        self._cond = threading.Condition()
+        self._threads = []
+        self._running = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        return self.submit_as(current_session(), fn, *args, **kwargs)
+
+    def submit_as(self, session, fn, /, *args, **kwargs):
+        future = Future()
+        with self._cond:
+            self._queues.setdefault(session, deque()).append((future, fn, args, kwargs))
+            if len(self._threads) < self.max_workers:
+                thread = threading.Thread(target=self._work, daemon=True,
+                                          name=f"{self.thread_name_prefix}_{len(self._threads)}")
+                self._threads.append(thread)
+                thread.start()
+            self._cond.notify()
+        return future
+
+    def _next(self):
+        # Round robin: take from the oldest session in line, then send it to the back
+        with self._cond:
+            while not self._queues:
+                self._cond.wait()
+            session, queue = next(iter(self._queues.items()))
+            item = queue.popleft()
+            if queue:
+                self._queues.move_to_end(session)
+            else:
+                del self._queues[session]
+            self._running += 1
+            return item
+
+    def _work(self):
+        while True:
+            future, fn, args, kwargs = self._next()
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(fn(*args, **kwargs))
+                    except BaseException as e:
+                        future.set_exception(e)
+            finally:
+                with self._cond:
+                    self._running -= 1
+
+    def stats(self):
+        with self._cond:
+            return {"workers": len(self._threads), "running": self._running,
+                    "queued": {session: len(queue) for session, queue in self._queues.items()}}
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Process-wide pool shared by every session."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = FairExecutor(max_workers=LLM_MAX_WORKERS)
+        return _executor
+
+
+class KeyedLimiter:
+    """One bounded semaphore per key, created on first use."""
+
+    def __init__(self, limit=LLM_PER_KEY_CONCURRENCY):
+        self.limit = limit
+        self._semaphores = {}
+        self._lock = threading.Lock()
+
+    def semaphore(self, key):
+        with self._lock:
+            sem = self._semaphores.get(key)
+            if sem is None:
+                sem = self._semaphores[key] = threading.BoundedSemaphore(self.limit)
+            return sem
+
+
+limiter = KeyedLimiter()
+
+
+@dataclass
+class Task:
+    name: str
+    fn: object
+    args: tuple = ()
+    kwargs: dict = field(default_factory=dict)
+    key: str = "gemini"
+    timeout: float = LLM_CALL_TIMEOUT
+
+
+def _run(task, started, semaphore):
+    # The caller already holds the key's semaphore; the task's clock starts now, not at submit
+    started.append(time.monotonic())
+    try:
+        return task.fn(*task.args, **task.kwargs)
+    finally:
+        semaphore.release()
+
+
+def fan_out(tasks, executor=None, poll=0.1):
+    """Submit ``tasks`` concurrently and yield ``(name, result, error)`` as each completes.
+
+    A task is only handed to the pool once its key has a free slot, so no
+    worker sits waiting on the per-key semaphore and at most
+    ``LLM_PER_KEY_CONCURRENCY`` calls per key are queued or running at once.
+    ``error`` is ``None`` on success, the raised exception otherwise, or a
+    ``TimeoutError`` once a task has *run* for longer than its ``timeout``
+    (time spent waiting for a slot doesn't count). A timed-out task is
+    abandoned (its thread finishes in the background) rather than killed.
+    """
+    executor = executor or get_executor()
+    waiting = deque(tasks)
+    pending = {}
+    try:
+        while waiting or pending:
+            # Hand over every waiting task whose key has a free slot, in order
+            blocked = deque()
+            for task in waiting:
+                semaphore = limiter.semaphore(task.key)
+                if semaphore.acquire(blocking=False):
+                    started = []
+                    pending[executor.submit(_run, task, started, semaphore)] = (task, started, semaphore)
+                else:
+                    blocked.append(task)
+            waiting = blocked
+            now = time.monotonic()
+            deadlines = [started[0] + task.timeout for task, started, _ in pending.values() if started]
+            timeout = max(0.0, min(deadlines) - now) if deadlines else None
+            if waiting or len(deadlines) < len(pending):
+                # Neither other callers freeing a slot nor a queued task starting notifies us
+                timeout = poll if timeout is None else min(timeout, poll)
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                task, _, _ = pending.pop(future)
+                error = future.exception()
+                yield task.name, (None if error else future.result()), error
+            now = time.monotonic()
+            for future, (task, started, _) in list(pending.items()):
+                if started and now >= started[0] + task.timeout:
+                    del pending[future]
+                    yield task.name, None, TimeoutError(f"{task.name} timed out after {task.timeout:g}s")
+    finally:
+        # Consumer stopped early: drop tasks that haven't started and give back their slots
+        for future, (_, _, semaphore) in pending.items():
+            if future.cancel():
+                semaphore.release()
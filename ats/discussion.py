@@ -0,0 +1,228 @@
+"""Group discussion engine: questions from a pooled bank, answers graded in batches.
+
+Questions for a topic come from the ``Discussion_Questions`` question bank
+(generated once and shared by every session), falling back to a built-in
+list when Gemini can't be reached. Answers are not graded one by one while
+the user waits: every ``DISCUSSION_GRADE_BATCH`` answers, and at the end of
+a round, the ungraded ones go to Gemini in a single structured call on the
+shared worker pool, and the feedback shows up when it is ready.
+
+A ``Discussion`` is the whole per-session state. It keeps at most
+``DISCUSSION_HISTORY`` turns, with answers cut to ``MAX_ANSWER_CHARS``, plus
+running score totals, so long sessions stay small in memory and in prompts.
+"""
+import os
+import random
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass
+
+from ats.concurrency import get_executor
+from ats.llm import is_valid_response
+from ats.question_bank import GENERATORS, get_question_bank
+from ats.structured import generate_structured
+
+DISCUSSION_QUESTIONS = int(os.getenv("DISCUSSION_QUESTIONS", "5"))
+DISCUSSION_GRADE_BATCH = int(os.getenv("DISCUSSION_GRADE_BATCH", "3"))
+DISCUSSION_HISTORY = int(os.getenv("DISCUSSION_HISTORY", "20"))
+MAX_ANSWER_CHARS = int(os.getenv("DISCUSSION_MAX_ANSWER_CHARS", "2000"))
+MAX_POOL_SIZE = 30
+
+# Turn status
+NEW, GRADING, GRADED, FAILED = "new", "grading", "graded", "failed"
+
+FALLBACK_QUESTIONS = {
+    "Data Science": [
+        "What is the role of data science in modern industries?",
+        "Explain the difference between supervised and unsupervised learning.",
+        "How do data cleaning techniques impact model performance?",
+        "What are the ethical concerns in data science?",
+        "How can data science be used for real-world problem-solving?"
+    ],
+    "AI": [
+        "What is Artificial Intelligence, and how does it work?",
+        "Discuss the difference between AI, Machine Learning, and Deep Learning.",
+        "What are the main applications of AI in daily life?",
+        "What are the ethical risks associated with AI development?",
+        "What is the future of AI in automation and job markets?"
+    ],
+    "Machine Learning": [
+        "Define Machine Learning and its core principles.",
+        "How does feature selection impact model accuracy?",
+        "What is the bias-variance tradeoff in ML?",
+        "Explain reinforcement learning with an example.",
+        "How do you handle overfitting in machine learning?"
+    ],
+    "Web Development": [
+        "What are the key components of web development?",
+        "Explain the difference between frontend and backend development.",
+        "How does responsive design impact user experience?",
+        "What are the security best practices for web applications?",
+        "What is the role of APIs in modern web applications?"
+    ]
+}
+
+GRADE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "grades": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "turn": {"type": "integer"},
+                    "score": {"type": "integer"},
+                    "feedback": {"type": "string"},
+                },
+                "required": ["turn", "score", "feedback"],
+            },
+        },
+    },
+    "required": ["grades"],
+}
+
+GRADE_PROMPT = (
+    "You are moderating a group discussion on {topic}. For each numbered turn below, score the answer "
+    "from 1 to 10 for correctness, depth and clarity, and give one or two sentences of feedback "
+    "addressed to the participant. Return one grade per turn, using the same turn numbers.\n\n{turns}"
+)
+
+_NUMBERING = re.compile(r"^\s*(?:[-*•]|\d+[.)]|q\d+[:.)])\s*", re.IGNORECASE)
+
+
+def parse_questions(text):
+    """One question per non-empty line, with bullets and numbering stripped."""
+    questions = []
+    for line in (text or "").splitlines():
+        line = _NUMBERING.sub("", line).strip(" *")
+        if len(line) > 10 and line not in questions:
+            questions.append(line)
+    return questions[:MAX_POOL_SIZE]
+
+
+def question_pool(topic, generate, bank=None):
+    """The topic's shared question pool: from the bank, else generated once and stored."""
+    bank = bank or get_question_bank()
+    entry = bank.sample("Discussion_Questions", topic)
+    questions = parse_questions(entry.content) if entry else []
+    if not questions:
+        text = generate(GENERATORS["Discussion_Questions"].prompt(topic), action="Discussion_Questions")
+        questions = parse_questions(text) if is_valid_response(text) else []
+        if questions:
+            bank.add("Discussion_Questions", topic, [text])
+    return questions or list(FALLBACK_QUESTIONS.get(topic, []))
+
+
+@dataclass
+class Turn:
+    question: str
+    answer: str
+    status: str = NEW
+    score: int = 0
+    feedback: str = ""
+
+
+def grade_turns(topic, turns, generate):
+    """Grade several turns with one structured call; returns ``[(score, feedback)]`` in order."""
+    listing = "\n\n".join(f"Turn {i}\nQuestion: {turn.question}\nAnswer: {turn.answer}"
+                          for i, turn in enumerate(turns, 1))
+    data = generate_structured(generate, GRADE_PROMPT.format(topic=topic, turns=listing), GRADE_SCHEMA,
+                               action="AI_Guided_Discussion")
+    grades = {grade["turn"]: grade for grade in data["grades"]}
+    if len(data["grades"]) == len(turns) and set(grades) != set(range(1, len(turns) + 1)):
+        # Right number of grades but renumbered: take them in order
+        grades = dict(enumerate(data["grades"], 1))
+    results = []
+    for i in range(1, len(turns) + 1):
+        grade = grades.get(i)
+        if grade is None:
+            results.append(None)
+        else:
+            results.append((max(1, min(10, grade["score"])), grade["feedback"].strip()))
+    return results
+
+
+class Discussion:
+    """One session's discussion on ``topic``: current question, capped history and scores."""
+
+    def __init__(self, topic, pool, per_round=DISCUSSION_QUESTIONS, history=DISCUSSION_HISTORY,
+                 batch=DISCUSSION_GRADE_BATCH, rng=None):
+        self.topic = topic
+        self.per_round = per_round
+        self.batch = batch
+        self.turns = deque(maxlen=history)
+        # Answers asked so far; also keys the answer box, so it starts empty for each question
+        self.asked = 0
+        self.graded = 0
+        self.score_total = 0
+        self._pool = list(pool)
+        self._rng = rng or random.Random()
+        self._unused = []
+        self._lock = threading.Lock()
+        self.current = None
+        self.remaining = 0
+        self.more()
+
+    def _draw(self):
+        if not self._unused:
+            # Reshuffle once the pool is used up, avoiding the questions asked just now
+            recent = {turn.question for turn in self.turns}
+            self._unused = [q for q in self._pool if q not in recent] or list(self._pool)
+            self._rng.shuffle(self._unused)
+        return self._unused.pop() if self._unused else None
+
+    def more(self):
+        """Start another round of questions."""
+        self.remaining = self.per_round
+        self.current = self._draw()
+        if self.current is None:
+            self.remaining = 0
+
+    @property
+    def finished(self):
+        return self.remaining <= 0
+
+    @property
+    def pending(self):
+        return sum(1 for turn in self.turns if turn.status == GRADING)
+
+    @property
+    def average(self):
+        return self.score_total / self.graded if self.graded else 0.0
+
+    def answer(self, text, generate, executor=None):
+        """Record an answer and move on; grading runs in the background in batches."""
+        self.turns.append(Turn(self.current, text.strip()[:MAX_ANSWER_CHARS]))
+        self.asked += 1
+        self.remaining -= 1
+        self.current = None if self.finished else self._draw()
+        ungraded = sum(1 for turn in self.turns if turn.status in (NEW, FAILED))
+        if ungraded >= self.batch or self.finished:
+            self.grade(generate, executor)
+
+    def grade(self, generate, executor=None):
+        """Send every ungraded (or previously failed) turn to the grader in one call."""
+        with self._lock:
+            turns = [turn for turn in self.turns if turn.status in (NEW, FAILED)]
+            for turn in turns:
+                turn.status = GRADING
+        if not turns:
+            return None
+        future = (executor or get_executor()).submit(grade_turns, self.topic, turns, generate)
+        future.add_done_callback(lambda done: self._apply(turns, done))
+        return future
+
+    def _apply(self, turns, future):
+        error = future.exception()
+        results = future.result() if error is None else [None] * len(turns)
+        with self._lock:
+            for turn, result in zip(turns, results):
+                if result is None:
+                    turn.status = FAILED
+                    turn.feedback = f"Could not grade this answer: {error}" if error else "Not graded, will retry."
+                    continue
+                turn.score, turn.feedback = result
+                turn.status = GRADED
+                self.graded += 1
+                self.score_total += turn.score
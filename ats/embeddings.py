@@ -0,0 +1,379 @@
+"""Local semantic skill matching between a resume and a job description.
+
+Resumes and JDs are cut into short skill phrases (bullets, comma lists) and
+embedded on CPU with a small sentence-transformer (``EMBEDDING_MODEL``,
+loaded through ``transformers``). A resume's vectors are written once to a
+memory-mapped ``.npy`` file keyed by its digest, so later matches against any
+JD only embed the JD and run one cosine top-K search.
+
+``skill_gap`` turns that into matched and missing JD skills and a
+reproducible percentage in milliseconds; prompts then only carry the gap
+list instead of the full resume and JD. Without ``transformers`` installed,
+the same result is computed from BM25 keyword overlap (``ats.ranking``).
+
+Both texts are fingerprinted per section (heading block or paragraph).
+Phrases, vector indexes and skill coverage are cached per section hash, so
+after a small edit to the JD or a revised resume only the changed sections
+are re-embedded and searched, and the rest is merged from the cache.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field, replace
+
+import numpy as np
+
+from ats.cache import LRUCache
+from ats.ranking import STOPWORDS, extract_keywords, keyword_match
+from ats.text_prep import HEADINGS, split_sections
+
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+EMBEDDING_DIR = os.getenv("EMBEDDING_DIR", os.path.join(".cache", "embeddings"))
+EMBEDDING_THREADS = int(os.getenv("EMBEDDING_THREADS", "2"))
+# Stored section indexes kept on disk; the least recently used go first
+EMBEDDING_MAX_INDEXES = int(os.getenv("EMBEDDING_MAX_INDEXES", "5000"))
+# Cosine similarity at which a resume phrase counts as having the JD skill
+SKILL_MATCH_THRESHOLD = float(os.getenv("SKILL_MATCH_THRESHOLD", "0.6"))
+MAX_JD_SKILLS = int(os.getenv("MAX_JD_SKILLS", "60"))
+
+_SPLIT = re.compile(r"[\n,;|•·/()\[\]]+|\.\s+|\s+&\s+|:\s+")
+_MARKUP = re.compile(r"[*#_`>]+|^\s*[-–]\s*")
+_WORD = re.compile(r"[a-z0-9][a-z0-9+#.\-]*")
+# A line with one of these is a list or "label: value", i.e. content rather than a heading
+_CONTENT = re.compile(r"[,;|•·/]|:\s*\S")
+
+_gaps = LRUCache(maxsize=256)
+_indexes = LRUCache(maxsize=512)
+_section_phrases = LRUCache(maxsize=2048)
+# (model, resume section hash, JD skill) -> best cosine score in that section
+_coverage = LRUCache(maxsize=50000)
+
+
+def skill_phrases(text, max_words=4):
+    """Short, de-duplicated phrases that can name a skill.
+
+    Text is cut at list separators, sentence ends and stopwords, so "models
+    with Docker on AWS" gives "models", "docker" and "aws".
+    """
+    phrases, seen = [], set()
+    for raw in _SPLIT.split((text or "").lower()):
+        run = []
+        for word in _WORD.findall(_MARKUP.sub(" ", raw)) + [""]:
+            word = word.rstrip(".")
+            if word and word not in STOPWORDS and len(word) > 1:
+                run.append(word)
+                continue
+            phrase = " ".join(run)
+            run = []
+            if phrase and len(phrase.split()) <= max_words and phrase not in seen:
+                seen.add(phrase)
+                phrases.append(phrase)
+    return phrases
+
+
+def text_sections(text):
+    """``[(hash, text)]`` per heading section of ``text``, cut further at blank lines."""
+    sections = []
+    for lines in split_sections(text or ""):
+        block = []
+        for line in lines + [""]:
+            if line.strip():
+                block.append(line)
+            elif block:
+                body = "\n".join(block)
+                sections.append((hashlib.sha256(body.encode("utf-8")).hexdigest(), body))
+                block = []
+    return sections
+
+
+def is_heading(line):
+    """Whether ``line`` labels a block ("NICE TO HAVE", "## Requirements", "What you'll do:")."""
+    stripped = line.strip()
+    bare = stripped.strip("*#_: ")
+    if not bare or _CONTENT.search(bare) or len(bare.split()) > 6:
+        return False
+    if bare.lower() in HEADINGS or stripped.startswith("#") or stripped.endswith(":"):
+        return True
+    if stripped.startswith("**") and stripped.endswith("**"):
+        return True
+    # A single capitalised word is as likely a skill ("SQL") as a heading
+    return bare.isupper() and len(bare.split()) > 1
+
+
+def section_phrases(sections, max_words=4):
+    """``skill_phrases`` of the whole text, computed and cached one section at a time.
+
+    Heading lines are left out, so "NICE TO HAVE" doesn't come back as a "nice" skill.
+    """
+    phrases = []
+    for digest, body in sections:
+        content = "\n".join(line for line in body.splitlines() if not is_heading(line))
+        phrases.extend(_section_phrases.get_or_create((digest, max_words),
+                                                      lambda content=content: skill_phrases(content, max_words)))
+    return list(dict.fromkeys(phrases))
+
+
+def jd_skills(job_description, sections=None):
+    """JD phrases that carry at least one of the JD's weighted keywords."""
+    keywords = {word for keyword in extract_keywords(job_description, top_n=MAX_JD_SKILLS) for word in keyword.split()}
+    phrases = section_phrases(sections if sections is not None else text_sections(job_description))
+    return [phrase for phrase in phrases if keywords & set(phrase.split())][:MAX_JD_SKILLS]
+
+
+# -------------------- ✅ Encoder --------------------
+
+def embeddings_available():
+    try:
+        import torch  # noqa: F401
+        import transformers  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class Encoder:
+    """Mean-pooled, L2-normalised sentence embeddings on CPU, cached per phrase."""
+
+    def __init__(self, model_name=EMBEDDING_MODEL, cache_size=20000):
+        self.model_name = model_name
+        self._model = None
+        self._tokenizer = None
+        self._lock = threading.Lock()
+        # The HF fast tokenizer can't be called from two threads at once ("Already borrowed")
+        self._embed_lock = threading.Lock()
+        self._cache = LRUCache(maxsize=cache_size)
+
+    def _load(self):
+        with self._lock:
+            if self._model is None:
+                import torch
+                from transformers import AutoModel, AutoTokenizer
+
+                torch.set_num_threads(EMBEDDING_THREADS)
+                self._tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+                self._model = AutoModel.from_pretrained(self.model_name).eval()
+        return self._tokenizer, self._model
+
+    def _embed(self, texts):
+        import torch
+
+        tokenizer, model = self._load()
+        with self._embed_lock, torch.inference_mode():
+            batch = tokenizer(texts, padding=True, truncation=True, max_length=64, return_tensors="pt")
+            hidden = model(**batch).last_hidden_state
+            mask = batch["attention_mask"].unsqueeze(-1).to(hidden.dtype)
+            pooled = (hidden * mask).sum(1) / mask.sum(1).clamp(min=1e-9)
+            pooled = torch.nn.functional.normalize(pooled, dim=1)
+        return pooled.numpy().astype(np.float32)
+
+    def encode(self, texts, batch_size=64):
+        """``(len(texts), dim)`` float32 unit vectors."""
+        missing = [text for text in dict.fromkeys(texts) if text not in self._cache]
+        for start in range(0, len(missing), batch_size):
+            chunk = missing[start:start + batch_size]
+            for text, vector in zip(chunk, self._embed(chunk)):
+                self._cache.put(text, vector)
+        return np.stack([self._cache.get(text) for text in texts]) if texts else np.zeros((0, 0), np.float32)
+
+
+_encoder = None
+_encoder_lock = threading.Lock()
+
+
+def get_encoder():
+    global _encoder
+    with _encoder_lock:
+        if _encoder is None:
+            _encoder = Encoder()
+        return _encoder
+
+
+# -------------------- ✅ Index --------------------
+
+class EmbeddingIndex:
+    """Phrase vectors for one document in a memory-mapped ``.npy`` plus a JSON sidecar."""
+
+    def __init__(self, phrases, vectors):
+        self.phrases = phrases
+        self.vectors = vectors
+
+    @staticmethod
+    def _paths(key, directory):
+        return os.path.join(directory, f"{key}.npy"), os.path.join(directory, f"{key}.json")
+
+    @classmethod
+    def build(cls, key, phrases, encoder, directory=EMBEDDING_DIR):
+        os.makedirs(directory, exist_ok=True)
+        vectors_path, meta_path = cls._paths(key, directory)
+        vectors = encoder.encode(phrases)
+        # Per-writer temp names: threads (or processes) building the same key don't share one
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        out = np.lib.format.open_memmap(vectors_path + suffix, mode="w+", dtype=np.float32, shape=vectors.shape)
+        out[:] = vectors
+        out.flush()
+        del out
+        with open(meta_path + suffix, "w", encoding="utf-8") as f:
+            json.dump({"model": encoder.model_name, "phrases": phrases}, f)
+        # Both files get their real names only once complete
+        os.replace(vectors_path + suffix, vectors_path)
+        os.replace(meta_path + suffix, meta_path)
+        evict_indexes(directory)
+        return cls.load(key, directory)
+
+    @classmethod
+    def load(cls, key, directory=EMBEDDING_DIR):
+        vectors_path, meta_path = cls._paths(key, directory)
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        index = cls(meta["phrases"], np.load(vectors_path, mmap_mode="r"))
+        try:
+            # mtime marks last use for eviction
+            os.utime(meta_path)
+        except OSError:
+            pass
+        return index
+
+    @classmethod
+    def open(cls, key, phrases, encoder, directory=EMBEDDING_DIR):
+        """Load the stored index for ``key``, building it on first use."""
+        def get():
+            try:
+                return cls.load(key, directory)
+            except (OSError, ValueError):
+                return cls.build(key, phrases, encoder, directory)
+
+        return _indexes.get_or_create((directory, key), get)
+
+    def __len__(self):
+        return len(self.phrases)
+
+    def search(self, queries, top_k=3):
+        """Cosine top-K per query row: ``(scores, ids)``, each ``(len(queries), k)``, best first."""
+        if not len(self) or not len(queries):
+            return np.zeros((len(queries), 0), np.float32), np.zeros((len(queries), 0), int)
+        scores = queries @ np.asarray(self.vectors).T
+        k = min(top_k, scores.shape[1])
+        ids = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top = np.take_along_axis(scores, ids, axis=1)
+        order = np.argsort(-top, axis=1)
+        return np.take_along_axis(top, order, axis=1), np.take_along_axis(ids, order, axis=1)
+
+
+def evict_indexes(directory=EMBEDDING_DIR, max_indexes=EMBEDDING_MAX_INDEXES):
+    """Past ``max_indexes``, delete the least recently used down to 90% of it; returns how many went."""
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return 0
+    keys = [name[:-len(".json")] for name in names if name.endswith(".json")]
+    if len(keys) <= max_indexes:
+        return 0
+    used = []
+    for key in keys:
+        try:
+            used.append((os.path.getmtime(os.path.join(directory, f"{key}.json")), key))
+        except OSError:
+            pass
+    used.sort()
+    # Plus temp files left behind by a writer that died mid-build
+    paths = [path for _, key in used[:len(used) - max_indexes * 9 // 10] for path in EmbeddingIndex._paths(key, directory)]
+    paths += [os.path.join(directory, name) for name in names if name.endswith(".tmp")
+              and time.time() - _mtime(os.path.join(directory, name)) > 3600]
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    return len(used) - max_indexes * 9 // 10
+
+
+def _mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return time.time()
+
+
+# -------------------- ✅ Skill Gap --------------------
+
+@dataclass
+class SkillGap:
+    match_percentage: float
+    matched: list = field(default_factory=list)
+    missing: list = field(default_factory=list)
+    # "embeddings" or "keywords" (fallback when transformers isn't installed)
+    method: str = "embeddings"
+    # JD and resume sections analyzed for this result vs. all of them; the rest came from the cache
+    sections_analyzed: int = 0
+    sections_total: int = 0
+
+    def gap_prompt(self):
+        """The compact skill summary sent to the LLM instead of resume and JD."""
+        return (f"Skills the job asks for that the candidate has: {', '.join(self.matched) or 'none'}\n"
+                f"Skills the job asks for that the candidate is missing: {', '.join(self.missing) or 'none'}")
+
+    def to_text(self):
+        return (f"Match: {self.match_percentage:.0f}%\n\n"
+                f"Matched skills: {', '.join(self.matched) or '-'}\n"
+                f"Missing skills: {', '.join(self.missing) or '-'}\n")
+
+
+def _embedding_gap(job_description, resume_text, encoder):
+    jd_sections = text_sections(job_description)
+    analyzed = sum(1 for digest, _ in jd_sections if (digest, 4) not in _section_phrases)
+    skills = jd_skills(job_description, jd_sections)
+    resume_sections = text_sections(resume_text)
+    total = len(jd_sections) + len(resume_sections)
+    if not skills:
+        return SkillGap(0.0, method="embeddings", sections_analyzed=analyzed, sections_total=total)
+    resume = resume_text.lower()
+    # Exact mentions need no vectors; only the rest are searched semantically
+    exact = [skill for skill in skills if re.search(rf"(?<![a-z0-9]){re.escape(skill)}(?![a-z0-9])", resume)]
+    rest = [skill for skill in skills if skill not in exact]
+    best = dict.fromkeys(rest, 0.0)
+    for digest, body in resume_sections:
+        scores = {skill: _coverage.get((encoder.model_name, digest, skill)) for skill in rest}
+        todo = [skill for skill, score in scores.items() if score is None]
+        if todo:
+            # Only sections that are new, or haven't seen these skills yet, are searched
+            analyzed += 1
+            key = hashlib.sha256(f"{encoder.model_name}\x1f{digest}".encode("utf-8")).hexdigest()
+            index = EmbeddingIndex.open(key, skill_phrases(body, max_words=6), encoder)
+            found, _ = index.search(encoder.encode(todo), top_k=1)
+            for skill, row in zip(todo, found):
+                scores[skill] = float(row[0]) if len(row) else 0.0
+                _coverage.put((encoder.model_name, digest, skill), scores[skill])
+        for skill in rest:
+            best[skill] = max(best[skill], scores[skill])
+    matched = set(exact) | {skill for skill, score in best.items() if score >= SKILL_MATCH_THRESHOLD}
+    ordered = [skill for skill in skills if skill in matched]
+    missing = [skill for skill in skills if skill not in matched]
+    return SkillGap(round(100.0 * len(ordered) / len(skills), 1), ordered, missing, "embeddings", analyzed, total)
+
+
+def skill_gap(job_description, resume_text, resume_digest=None, encoder=None):
+    """Matched/missing JD skills and a match percentage, cached per (JD, resume, model)."""
+    if not job_description or not resume_text:
+        return SkillGap(0.0, method="keywords")
+    use_embeddings = encoder is not None or embeddings_available()
+    encoder = encoder or (get_encoder() if use_embeddings else None)
+    model = encoder.model_name if encoder else "keywords"
+    resume_key = hashlib.sha256(f"{model}\x1f{resume_digest or resume_text}".encode("utf-8")).hexdigest()
+    key = (hashlib.sha256(job_description.encode("utf-8")).hexdigest(), resume_key)
+
+    def compute():
+        if encoder is None:
+            percentage, matched, missing = keyword_match(job_description, resume_text)
+            return SkillGap(round(percentage, 1), list(matched), list(missing), "keywords")
+        return _embedding_gap(job_description, resume_text, encoder)
+
+    cached = _gaps.get(key)
+    if cached is not None:
+        # Same JD and resume as before: nothing was analyzed this time
+        return replace(cached, sections_analyzed=0)
+    gap = compute()
+    _gaps.put(key, gap)
+    return gap
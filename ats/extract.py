@@ -0,0 +1,261 @@
+"""Pluggable, layout-aware PDF text extraction with an OCR fallback.
+
+An extractor is a function ``(data, start, stop) -> [page text, ...]`` that
+registers itself under a name with ``@register_extractor``; ``PDF_EXTRACTOR``
+picks the one in use. ``extract_pages`` runs page chunks of long documents in
+parallel on a shared process pool, and sends pages whose text layer is empty
+(scanned resumes) through local OCR on ``pdf2image``-rendered images.
+
+The default ``layout`` extractor places text fragments by their coordinates,
+so two-column resumes come out one column at a time instead of interleaved
+line by line, and keeps blank lines between blocks so sections stay apart.
+"""
+import io
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+PDF_EXTRACTOR = os.getenv("PDF_EXTRACTOR", "layout")
+PDF_PARSE_WORKERS = int(os.getenv("PDF_PARSE_WORKERS", os.getenv("BATCH_PARSE_WORKERS", str(min(4, os.cpu_count() or 1)))))
+# Below this many pages the process round trip costs more than it saves
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "8"))
+PDF_OCR = os.getenv("PDF_OCR", "1") == "1"
+OCR_DPI = int(os.getenv("OCR_DPI", "200"))
+OCR_LANG = os.getenv("OCR_LANG", "eng")
+# A page with less text than this is treated as having no text layer
+MIN_PAGE_CHARS = int(os.getenv("MIN_PAGE_CHARS", "20"))
+
+PAGE_SEPARATOR = "\n\n"
+
+EXTRACTORS = {}
+
+
+def register_extractor(name):
+    def decorator(fn):
+        EXTRACTORS[name] = fn
+        return fn
+    return decorator
+
+
+def _reader(data):
+    from PyPDF2 import PdfReader
+
+    return PdfReader(io.BytesIO(data))
+
+
+@register_extractor("plain")
+def plain_pages(data, start, stop):
+    """PyPDF2's content-stream order, one ``extract_text()`` per page."""
+    reader = _reader(data)
+    return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+@register_extractor("layout")
+def layout_pages(data, start, stop):
+    """Text placed by position: columns read top to bottom, blocks kept apart."""
+    reader = _reader(data)
+    return [layout_text(reader.pages[i]) for i in range(start, stop)]
+
+
+# -------------------- ✅ Layout --------------------
+
+def _fragments(page):
+    """``(x, y, width, size, text)`` per line of text drawn on ``page``, in user space."""
+    fragments = []
+
+    def visit(text, cm, tm, font_dict, font_size):
+        if not text.strip():
+            return
+        x = tm[4] * cm[0] + tm[5] * cm[2] + cm[4]
+        y = tm[4] * cm[1] + tm[5] * cm[3] + cm[5]
+        size = abs(font_size * (tm[3] or 1) * (cm[3] or 1)) or 10.0
+        for i, line in enumerate(text.split("\n")):
+            if line.strip():
+                # No glyph widths from the visitor; half an em per character is close enough
+                fragments.append((x, y - i * size * 1.2, len(line) * size * 0.5, size, line.strip()))
+
+    page.extract_text(visitor_text=visit)
+    return fragments
+
+
+def _in_blocks(side):
+    """Share of ``side``'s fragments that have another one a line above or below them."""
+    ys = sorted(y for _, y, _, _, _ in side)
+    sizes = {y: size for _, y, _, size, _ in side}
+    stacked = 0
+    for i, y in enumerate(ys):
+        gaps = [abs(y - other) for other in ys[max(0, i - 1):i] + ys[i + 1:i + 2]]
+        if any(sizes[y] * 0.5 < gap <= sizes[y] * 1.8 for gap in gaps):
+            stacked += 1
+    return stacked / len(side) if side else 0.0
+
+
+def _find_gutter(fragments, page_width):
+    """x of a vertical gap splitting the page into two columns, or None.
+
+    Fragments that cross the gap (a full-width name or header) are allowed, as
+    long as most of the page sits clearly on one side or the other. Both sides
+    must read as columns, mostly lines stacked into blocks: dates or locations
+    right-aligned on single role lines are part of those lines, not a column.
+    """
+    if len(fragments) < 6:
+        return None
+    best = None
+    for step in range(25, 76):
+        gutter = page_width * step / 100
+        crossing = sum(1 for x, _, width, _, _ in fragments if x < gutter < x + width)
+        left = sum(1 for x, _, _, _, _ in fragments if x + 1 < gutter)
+        right = len(fragments) - left
+        if crossing > len(fragments) * 0.1 or min(left - crossing, right) < len(fragments) * 0.2:
+            continue
+        if best is None or crossing < best[0]:
+            sides = ([f for f in fragments if f[0] + f[2] <= gutter], [f for f in fragments if f[0] >= gutter])
+            if all(_in_blocks(side) >= 0.5 for side in sides):
+                best = (crossing, gutter)
+    return best[1] if best else None
+
+
+def _lines(fragments):
+    """Group fragments into lines (top to bottom), with '' between blocks."""
+    fragments = sorted(fragments, key=lambda f: (-f[1], f[0]))
+    rows = []
+    for x, y, _, size, text in fragments:
+        if rows and abs(rows[-1][0] - y) <= size * 0.4:
+            rows[-1][2].append((x, text))
+        else:
+            rows.append((y, size, [(x, text)]))
+    out = []
+    for i, (y, size, parts) in enumerate(rows):
+        # A gap well beyond normal leading marks a new paragraph or section
+        if i and rows[i - 1][0] - y > size * 1.9:
+            out.append("")
+        out.append(" ".join(text for _, text in sorted(parts)))
+    return out
+
+
+def layout_text(page):
+    fragments = _fragments(page)
+    if not fragments:
+        return ""
+    gutter = _find_gutter(fragments, float(page.mediabox.width))
+    if gutter is None:
+        return "\n".join(_lines(fragments))
+
+    # Full-width fragments split the page into bands; each band reads left column, then right
+    out, band = [], []
+
+    def flush():
+        left = [f for f in band if f[0] < gutter]
+        right = [f for f in band if f[0] >= gutter]
+        for column in (left, right):
+            if column:
+                if out:
+                    out.append("")
+                out.extend(_lines(column))
+
+    for fragment in sorted(fragments, key=lambda f: -f[1]):
+        x, _, width, _, _ = fragment
+        if x < gutter < x + width:
+            flush()
+            band = []
+            if out:
+                out.append("")
+            out.extend(_lines([fragment]))
+        else:
+            band.append(fragment)
+    flush()
+    return "\n".join(out)
+
+
+# -------------------- ✅ OCR --------------------
+
+def ocr_available():
+    try:
+        import pytesseract
+
+        pytesseract.get_tesseract_version()
+        return True
+    except Exception:
+        return False
+
+
+def ocr_pages(data, indices):
+    """OCR text for the given 0-based page ``indices``; {} if OCR isn't installed.
+
+    Needs poppler (for pdf2image) and the Tesseract binary with ``pytesseract``.
+    Tesseract runs as a subprocess, so a thread per page is enough to use every core.
+    """
+    if not indices or not ocr_available():
+        return {}
+    from pdf2image import convert_from_bytes
+    import pytesseract
+
+    def ocr(index):
+        image = convert_from_bytes(data, dpi=OCR_DPI, first_page=index + 1, last_page=index + 1)[0]
+        return index, pytesseract.image_to_string(image, lang=OCR_LANG)
+
+    with ThreadPoolExecutor(max_workers=PDF_PARSE_WORKERS) as executor:
+        return dict(executor.map(ocr, indices))
+
+
+# -------------------- ✅ Process Pool --------------------
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_parse_pool():
+    """Shared process pool; spawn avoids forking the multi-threaded Streamlit server."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=PDF_PARSE_WORKERS,
+                                        mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def discard_pool(pool):
+    """Drop a broken shared pool (e.g. a worker crashed) so the next call starts a fresh one."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _extract_chunk(name, data, start, stop):
+    # Runs in a child process; only picklable values cross the boundary
+    return EXTRACTORS[name](data, start, stop)
+
+
+def extract_pages(data, extractor=None, parallel=True, ocr=PDF_OCR, pool=None):
+    """``(pages, ocr_indices)``: text per page and which pages came from OCR.
+
+    ``parallel=False`` keeps everything in this process (used inside pool workers).
+    """
+    name = extractor or PDF_EXTRACTOR
+    if name not in EXTRACTORS:
+        raise ValueError(f"Unknown PDF extractor {name!r}; choose from {', '.join(sorted(EXTRACTORS))}")
+    count = len(_reader(data).pages)
+
+    if parallel and count >= PDF_PARALLEL_MIN_PAGES and PDF_PARSE_WORKERS > 1:
+        pool = pool or get_parse_pool()
+        size = -(-count // PDF_PARSE_WORKERS)
+        chunks = [pool.submit(_extract_chunk, name, data, start, min(start + size, count))
+                  for start in range(0, count, size)]
+        try:
+            pages = [text for chunk in chunks for text in chunk.result()]
+        except BrokenProcessPool:
+            discard_pool(pool)
+            pages = EXTRACTORS[name](data, 0, count)
+    else:
+        pages = EXTRACTORS[name](data, 0, count)
+
+    empty = [i for i, text in enumerate(pages) if len(text.strip()) < MIN_PAGE_CHARS]
+    recognised = ocr_pages(data, empty) if ocr else {}
+    for index, text in recognised.items():
+        if text.strip():
+            pages[index] = text
+    return pages, tuple(sorted(i for i, text in recognised.items() if text.strip()))
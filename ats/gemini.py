@@ -0,0 +1,183 @@
+"""Gemini calls used by every section of the app.
+
+``get_gemini_response`` returns the answer text, or a string starting with
+``Error:``/``API Error:`` on failure (see ``is_valid_response``);
+``stream_gemini_response`` yields the same answer in chunks. Both go through
+the shared model registry, the response cache, the rate limiter and
+telemetry.
+"""
+import json
+import os
+import time
+
+from ats.llm import DEFAULT_MODEL, MissingAPIKey, get_model
+from ats.ratelimit import RateLimitTimeout, guarded_call, is_retryable
+from ats.response_cache import cache_key, get_response_cache
+from ats.telemetry import telemetry
+from ats.text_prep import estimate_tokens
+
+# Opt-in: drop the random suffix so identical prompts give cacheable, repeatable answers
+LLM_DETERMINISTIC = os.getenv("LLM_DETERMINISTIC", "0") == "1"
+# Number of cached answers kept per prompt (0 = no caching unless deterministic)
+LLM_CACHE_VARIANTS = int(os.getenv("LLM_CACHE_VARIANTS", "0"))
+
+MODEL_NAME = DEFAULT_MODEL
+
+
+def _resolve_cache_settings(prompt, action, deterministic, variants):
+    """Apply the env defaults and return (deterministic, variants, cache, key)."""
+    deterministic = LLM_DETERMINISTIC if deterministic is None else deterministic
+    variants = LLM_CACHE_VARIANTS if variants is None else variants
+    if deterministic:
+        variants = max(variants, 1)
+    cache = get_response_cache() if variants else None
+    key = cache_key(MODEL_NAME, prompt, action) if cache is not None else None
+    return deterministic, variants, cache, key
+
+
+def forget_response(prompt, action="GOOGLE_API_KEY"):
+    """Drop the cached answers for ``prompt``, e.g. once a caller finds them unusable."""
+    get_response_cache().discard(cache_key(MODEL_NAME, prompt, action))
+
+
+def token_usage(response, prompt, text):
+    """(prompt, response) token counts from Gemini's usage metadata, else estimates."""
+    usage = getattr(response, "usage_metadata", None)
+    if usage and usage.prompt_token_count:
+        return usage.prompt_token_count, usage.candidates_token_count
+    return estimate_tokens(prompt), estimate_tokens(text)
+
+
+def api_error_message(error):
+    """User-facing text for a failed call; quota/availability problems say so plainly."""
+    if isinstance(error, RateLimitTimeout):
+        return f"Error: {str(error)}"
+    if is_retryable(error):
+        return f"API Error: Gemini is over quota or unavailable right now, please try again shortly. ({str(error)})"
+    return f"API Error: {str(error)}"
+
+
+def _elapsed_ms(started):
+    return (time.perf_counter() - started) * 1000
+
+
+def _prompt_contents(prompt, deterministic):
+    contents = [prompt]
+    if not deterministic:
+        contents.append(f"Add randomness: {os.urandom(8).hex()}")
+    return contents
+
+
+def get_gemini_response(prompt, action="GOOGLE_API_KEY", deterministic=None, variants=None, generation_config=None):
+    if not prompt.strip():
+        return "Error: Prompt is empty. Please provide a valid prompt."
+
+    started = time.perf_counter()
+    deterministic, variants, cache, key = _resolve_cache_settings(prompt, action, deterministic, variants)
+    if cache is not None:
+        cached = cache.get(key, max_variants=variants)
+        if cached is not None:
+            elapsed = _elapsed_ms(started)
+            telemetry.record(action, model=MODEL_NAME, latency_ms=elapsed, first_token_ms=elapsed, cache="hit")
+            return cached
+
+    cache_state = "miss" if cache is not None else "off"
+    # Identical prompts running at the same moment share one request
+    inflight_key = cache_key(MODEL_NAME, prompt, f"{action}|{deterministic}|{json.dumps(generation_config or {}, sort_keys=True)}")
+    try:
+        # Shared model: SDK configured once per process, connection reused
+        model = get_model(MODEL_NAME, generation_config)
+        contents = _prompt_contents(prompt, deterministic)
+        # Rate limited to the API quota, retried with backoff on 429/5xx
+        response = guarded_call(lambda: model.generate_content(contents), key=inflight_key)
+
+        if hasattr(response, 'text') and response.text:
+            elapsed = _elapsed_ms(started)
+            prompt_count, response_count = token_usage(response, prompt, response.text)
+            telemetry.record(action, model=MODEL_NAME, latency_ms=elapsed, first_token_ms=elapsed,
+                             prompt_tokens=prompt_count, response_tokens=response_count, cache=cache_state)
+            if cache is not None:
+                cache.put(key, response.text, MODEL_NAME, action, max_variants=variants)
+            return response.text
+        else:
+            telemetry.record(action, model=MODEL_NAME, latency_ms=_elapsed_ms(started), cache=cache_state,
+                             error="empty response")
+            return "Error: No valid response received from Gemini API."
+    except MissingAPIKey as e:
+        return f"Error: {str(e)}"
+    except Exception as e:
+        telemetry.record(action, model=MODEL_NAME, latency_ms=_elapsed_ms(started), cache=cache_state,
+                         error=type(e).__name__)
+        return api_error_message(e)
+
+
+def _failed(status, message):
+    if status is not None:
+        status["error"] = message
+    return message
+
+
+def stream_gemini_response(prompt, action="GOOGLE_API_KEY", deterministic=None, variants=None, status=None):
+    """Same as get_gemini_response, but yields text chunks as Gemini produces them.
+
+    Meant for ``st.write_stream``, which renders chunks progressively and returns
+    the full text for download buttons and PDFs. Cache hits come back as a
+    single chunk; a completed stream is stored in the cache like a normal call.
+    A failure, even after some chunks, is yielded as an error message and, if
+    ``status`` (a dict) is given, recorded as ``status["error"]``, since the
+    joined text alone can look like a valid answer.
+    """
+    if not prompt.strip():
+        yield _failed(status, "Error: Prompt is empty. Please provide a valid prompt.")
+        return
+
+    started = time.perf_counter()
+    deterministic, variants, cache, key = _resolve_cache_settings(prompt, action, deterministic, variants)
+    if cache is not None:
+        cached = cache.get(key, max_variants=variants)
+        if cached is not None:
+            elapsed = _elapsed_ms(started)
+            telemetry.record(action, model=MODEL_NAME, latency_ms=elapsed, first_token_ms=elapsed, cache="hit")
+            yield cached
+            return
+
+    cache_state = "miss" if cache is not None else "off"
+    parts = []
+    last_chunk = None
+    first_token_ms = 0.0
+    try:
+        model = get_model(MODEL_NAME)
+        contents = _prompt_contents(prompt, deterministic)
+        # Retries only cover opening the stream; a stream can't be shared, so no coalescing
+        for chunk in guarded_call(lambda: model.generate_content(contents, stream=True)):
+            last_chunk = chunk
+            # Chunks without text parts (e.g. safety metadata) raise on .text
+            text = chunk.text if chunk.parts else ""
+            if text:
+                if not parts:
+                    first_token_ms = _elapsed_ms(started)
+                parts.append(text)
+                yield text
+    except MissingAPIKey as e:
+        yield _failed(status, f"Error: {str(e)}")
+        return
+    except Exception as e:
+        telemetry.record(action, model=MODEL_NAME, latency_ms=_elapsed_ms(started), first_token_ms=first_token_ms,
+                         cache=cache_state, error=type(e).__name__)
+        if parts:
+            # After partial output, on a line of its own
+            yield "\n\n"
+        yield _failed(status, api_error_message(e))
+        return
+
+    if not parts:
+        telemetry.record(action, model=MODEL_NAME, latency_ms=_elapsed_ms(started), cache=cache_state,
+                         error="empty response")
+        yield _failed(status, "Error: No valid response received from Gemini API.")
+        return
+    full_text = "".join(parts)
+    prompt_count, response_count = token_usage(last_chunk, prompt, full_text)
+    telemetry.record(action, model=MODEL_NAME, latency_ms=_elapsed_ms(started), first_token_ms=first_token_ms,
+                     prompt_tokens=prompt_count, response_tokens=response_count, cache=cache_state)
+    if cache is not None:
+        cache.put(key, full_text, MODEL_NAME, action, max_variants=variants)
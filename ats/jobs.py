@@ -0,0 +1,143 @@
+"""Local job queue for long-running LLM generations.
+
+Work submitted from a Streamlit button used to run in the script thread, so
+the next click killed it and the API spend was lost. Jobs here run on the
+shared LLM pool (``ats.concurrency.FairExecutor``) and their state and result
+live in SQLite, so a rerun, a page reload or another tab can pick the result
+up by job id. Submitting a job identical to one still queued or running
+returns the existing id instead of starting a second generation.
+
+Each job stores its prompt, action and keyword arguments, so jobs left
+unfinished by a previous process are re-queued on start-up.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+
+from ats.concurrency import get_executor
+from ats.llm import is_valid_response
+
+JOBS_PATH = os.getenv("JOBS_PATH", os.path.join(".cache", "jobs.sqlite"))
+JOB_RETENTION = float(os.getenv("JOB_RETENTION", str(24 * 3600)))
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    action TEXT NOT NULL,
+    prompt TEXT NOT NULL,
+    kwargs TEXT NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_fingerprint ON jobs (fingerprint, status);
+"""
+
+
+@dataclass
+class Job:
+    id: str
+    action: str
+    status: str
+    result: str
+    error: str
+    created_at: float
+    updated_at: float
+
+    @property
+    def finished(self):
+        return self.status in (DONE, FAILED)
+
+
+def fingerprint(prompt, action, kwargs):
+    raw = json.dumps([action, prompt, kwargs], sort_keys=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class JobQueue:
+    """SQLite-backed queue whose jobs call ``runner(prompt, action=..., **kwargs)``."""
+
+    def __init__(self, runner, path=JOBS_PATH, executor=None):
+        self.runner = runner
+        self.path = path
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=10)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._executor = executor or get_executor()
+        self._purge()
+        self._resume_unfinished()
+
+    def _execute(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _purge(self):
+        self._execute("DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+                      (DONE, FAILED, time.time() - JOB_RETENTION))
+
+    def _resume_unfinished(self):
+        for job_id, in self._execute("SELECT id FROM jobs WHERE status IN (?, ?)", (QUEUED, RUNNING)):
+            self._set(job_id, QUEUED)
+            self._executor.submit(self._run, job_id)
+
+    def _set(self, job_id, status, result=None, error=None):
+        self._execute("UPDATE jobs SET status = ?, result = ?, error = ?, updated_at = ? WHERE id = ?",
+                      (status, result, error, time.time(), job_id))
+
+    def submit(self, prompt, action, **kwargs):
+        """Queue a generation and return its job id (an in-flight duplicate's id if there is one)."""
+        key = fingerprint(prompt, action, kwargs)
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT id FROM jobs WHERE fingerprint = ? AND status IN (?, ?) LIMIT 1",
+                    (key, QUEUED, RUNNING)).fetchone()
+                if row:
+                    self._conn.execute("COMMIT")
+                    return row[0]
+                job_id = uuid.uuid4().hex
+                self._conn.execute("INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?, NULL, NULL, ?, ?)",
+                                   (job_id, key, action, prompt, json.dumps(kwargs), QUEUED, now, now))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        self._executor.submit(self._run, job_id)
+        return job_id
+
+    def _run(self, job_id):
+        rows = self._execute("SELECT prompt, action, kwargs FROM jobs WHERE id = ?", (job_id,))
+        if not rows:
+            return
+        prompt, action, kwargs = rows[0]
+        self._set(job_id, RUNNING)
+        try:
+            result = self.runner(prompt, action=action, **json.loads(kwargs))
+        except Exception as e:
+            self._set(job_id, FAILED, error=str(e))
+            return
+        if is_valid_response(result):
+            self._set(job_id, DONE, result=result)
+        else:
+            self._set(job_id, FAILED, error=result)
+
+    def get(self, job_id):
+        rows = self._execute(
+            "SELECT id, action, status, result, error, created_at, updated_at FROM jobs WHERE id = ?", (job_id,))
+        return Job(*rows[0]) if rows else None
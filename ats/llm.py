@@ -0,0 +1,124 @@
+"""Process-wide Gemini client and model registry.
+
+``genai.configure`` drops the cached API clients, so calling it per request
+means a fresh channel (and TLS handshake) on every call. Here it runs once per
+process and ``GenerativeModel`` instances are reused, keeping the underlying
+connection alive between requests and across Streamlit sessions.
+
+The provider behind the models is pluggable: ``LLM_BACKEND`` names an entry in
+``BACKENDS`` (or any ``module:Class`` path). A backend has ``configure()``,
+called once, and ``model(name, generation_config)``, returning an object with
+Gemini's ``generate_content(contents, stream=False)`` and ``count_tokens(text)``.
+``stub`` (``ats.llm_stub``) answers locally for offline benchmarks and CI.
+"""
+import importlib
+import json
+import os
+import threading
+
+DEFAULT_MODEL = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
+# "grpc" keeps one long-lived HTTP/2 channel; "rest" uses a pooled HTTP session
+GEMINI_TRANSPORT = os.getenv("GEMINI_TRANSPORT", "grpc")
+LLM_BACKEND = os.getenv("LLM_BACKEND", "gemini")
+
+BACKENDS = {
+    "gemini": "ats.llm:GeminiBackend",
+    "stub": "ats.llm_stub:StubBackend",
+}
+
+
+class MissingAPIKey(RuntimeError):
+    """Raised when GOOGLE_API_KEY is not set."""
+
+
+def _config_key(generation_config):
+    # Configs may nest (e.g. a response_schema dict), so key on their JSON form
+    if not generation_config:
+        return ""
+    return json.dumps(generation_config, sort_keys=True, default=str)
+
+
+def is_valid_response(text):
+    """False for the error strings get_gemini_response returns instead of raising."""
+    return bool(text) and not text.startswith(("Error:", "API Error:"))
+
+
+class GeminiBackend:
+    """google-generativeai, configured with GOOGLE_API_KEY."""
+
+    def __init__(self, transport=GEMINI_TRANSPORT):
+        self.transport = transport
+
+    def configure(self):
+        import google.generativeai as genai
+
+        api_key = os.getenv("GOOGLE_API_KEY")
+        if not api_key:
+            raise MissingAPIKey("GOOGLE_API_KEY not found in environment variables.")
+        genai.configure(api_key=api_key, transport=self.transport)
+
+    def model(self, model_name, generation_config=None):
+        import google.generativeai as genai
+
+        return genai.GenerativeModel(model_name, generation_config=generation_config)
+
+
+def load_backend(name=None):
+    """Instantiate the backend registered as ``name`` (or given as ``module:Class``)."""
+    name = name or LLM_BACKEND
+    path = BACKENDS.get(name, name)
+    module_name, _, class_name = path.partition(":")
+    if not class_name:
+        raise ValueError(f"Unknown LLM backend {name!r}; choose from {', '.join(sorted(BACKENDS))}")
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+class ModelRegistry:
+    """Configures the backend once and hands out one model per (name, config)."""
+
+    def __init__(self, backend=None):
+        self._backend = backend
+        self._configured = False
+        self._models = {}
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            self._backend = load_backend()
+        return self._backend
+
+    def get(self, model_name=DEFAULT_MODEL, generation_config=None):
+        key = (model_name, _config_key(generation_config))
+        model = self._models.get(key)
+        if model is not None:
+            return model
+        with self._lock:
+            if not self._configured:
+                self.backend.configure()
+                self._configured = True
+            model = self._models.get(key)
+            if model is None:
+                model = self.backend.model(model_name, generation_config)
+                self._models[key] = model
+            return model
+
+    def use(self, backend):
+        """Switch to another backend (a name, ``module:Class`` or instance)."""
+        with self._lock:
+            self._backend = load_backend(backend) if isinstance(backend, str) else backend
+            self._configured = False
+            self._models.clear()
+
+    def reset(self):
+        """Forget configured clients, e.g. after the API key changes."""
+        with self._lock:
+            self._configured = False
+            self._models.clear()
+
+
+registry = ModelRegistry()
+
+
+def get_model(model_name=DEFAULT_MODEL, generation_config=None):
+    return registry.get(model_name, generation_config)
@@ -0,0 +1,125 @@
+"""Deterministic local LLM backend for offline benchmarks and CI.
+
+Select it with ``LLM_BACKEND=stub``. Answers depend only on the prompt (and
+``LLM_STUB_SEED``), so repeated runs produce the same text. Latency is
+simulated as a fixed time to first token plus a generation rate, and JSON
+requests (``response_mime_type`` ``application/json`` with a
+``response_schema``) get an object that matches the schema.
+"""
+import hashlib
+import json
+import os
+import random
+import re
+import time
+from types import SimpleNamespace
+
+from ats.text_prep import estimate_tokens
+
+LLM_STUB_LATENCY_MS = float(os.getenv("LLM_STUB_LATENCY_MS", "300"))
+# Simulated generation speed; 0 returns the whole answer after the first-token latency
+LLM_STUB_TOKENS_PER_SEC = float(os.getenv("LLM_STUB_TOKENS_PER_SEC", "200"))
+LLM_STUB_OUTPUT_TOKENS = int(os.getenv("LLM_STUB_OUTPUT_TOKENS", "400"))
+LLM_STUB_SEED = os.getenv("LLM_STUB_SEED", "0")
+
+STREAM_CHUNK_TOKENS = 20
+
+_WORD = re.compile(r"[A-Za-z][A-Za-z+#.-]{2,}")
+_FILLER = ("experience", "project", "python", "data", "model", "pipeline", "analysis", "skills",
+           "learning", "deployment", "team", "results", "design", "testing", "performance")
+
+
+class StubResponse:
+    """The parts of a Gemini response the app reads."""
+
+    def __init__(self, text, prompt_tokens):
+        self.text = text
+        self.parts = [text] if text else []
+        self.usage_metadata = SimpleNamespace(prompt_token_count=prompt_tokens,
+                                              candidates_token_count=estimate_tokens(text),
+                                              total_token_count=prompt_tokens + estimate_tokens(text))
+
+
+class StubModel:
+    def __init__(self, model_name, generation_config=None, latency_ms=None, tokens_per_sec=None,
+                 output_tokens=None):
+        self.model_name = model_name
+        self.generation_config = generation_config or {}
+        self.latency_ms = LLM_STUB_LATENCY_MS if latency_ms is None else latency_ms
+        self.tokens_per_sec = LLM_STUB_TOKENS_PER_SEC if tokens_per_sec is None else tokens_per_sec
+        self.output_tokens = LLM_STUB_OUTPUT_TOKENS if output_tokens is None else output_tokens
+
+    def count_tokens(self, text):
+        return SimpleNamespace(total_tokens=estimate_tokens(text))
+
+    def _answer(self, prompt):
+        seed = hashlib.sha256(f"{LLM_STUB_SEED}\x1f{self.model_name}\x1f{prompt}".encode("utf-8")).digest()
+        rng = random.Random(seed)
+        words = _WORD.findall(prompt)[:500] or list(_FILLER)
+        schema = self.generation_config.get("response_schema")
+        if self.generation_config.get("response_mime_type") == "application/json" and schema:
+            return json.dumps(_fake(schema, rng, words))
+        return _prose(rng, words, self.output_tokens)
+
+    def _sleep_for(self, tokens):
+        if self.tokens_per_sec > 0:
+            time.sleep(tokens / self.tokens_per_sec)
+
+    def generate_content(self, contents, stream=False, **kwargs):
+        # Only the prompt counts; the "Add randomness" suffix would defeat determinism
+        prompt = contents[0] if isinstance(contents, (list, tuple)) else contents
+        text = self._answer(prompt)
+        prompt_tokens = estimate_tokens(prompt)
+        time.sleep(self.latency_ms / 1000)
+        if not stream:
+            self._sleep_for(estimate_tokens(text))
+            return StubResponse(text, prompt_tokens)
+        return self._stream(text, prompt_tokens)
+
+    def _stream(self, text, prompt_tokens):
+        step = STREAM_CHUNK_TOKENS * 4
+        for start in range(0, len(text), step):
+            chunk = text[start:start + step]
+            if start:
+                self._sleep_for(estimate_tokens(chunk))
+            yield StubResponse(chunk, prompt_tokens)
+
+
+class StubBackend:
+    def configure(self):
+        pass
+
+    def model(self, model_name, generation_config=None):
+        return StubModel(model_name, generation_config)
+
+
+def _sentence(rng, words, length):
+    return " ".join(rng.choice(words) for _ in range(length)).capitalize() + "."
+
+
+def _prose(rng, words, tokens):
+    """Markdown with headings and bullets, about ``tokens`` tokens long."""
+    lines = []
+    while estimate_tokens("\n".join(lines)) < tokens:
+        lines.append(f"**{rng.choice(words).title()}**")
+        lines.append(_sentence(rng, words, rng.randint(12, 24)))
+        lines.extend(f"* {_sentence(rng, words, rng.randint(6, 12))}" for _ in range(rng.randint(2, 4)))
+        lines.append("")
+    return "\n".join(lines).strip()
+
+
+def _fake(schema, rng, words, item=False):
+    kind = schema.get("type")
+    if kind == "object":
+        return {name: _fake(sub, rng, words) for name, sub in schema.get("properties", {}).items()}
+    if kind == "array":
+        items = schema.get("items", {"type": "string"})
+        return [_fake(items, rng, words, item=True) for _ in range(rng.randint(2, 5))]
+    if kind == "number":
+        return round(rng.uniform(0, 100), 1)
+    if kind == "integer":
+        return rng.randint(0, 100)
+    if kind == "boolean":
+        return rng.random() < 0.5
+    # List items read like skills or roles, free-text fields like a summary
+    return _sentence(rng, words, rng.randint(1, 3) if item else rng.randint(15, 30))
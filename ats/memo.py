@@ -0,0 +1,53 @@
+"""Per-session memoization of generated panel content.
+
+Streamlit reruns the whole script on every widget interaction. Sections whose
+output only depends on a few inputs (the selected MNC, the resume hash, ...)
+keep their last result in the session state under an explicit key and are
+recomputed only when that key changes or the user asks to regenerate.
+
+``store`` is any mutable mapping; the app passes ``st.session_state``. Only
+the latest key per section is kept, so memory stays bounded per session.
+"""
+
+MEMO_STATE_KEY = "_memo"
+
+
+def _sections(store):
+    if MEMO_STATE_KEY not in store:
+        store[MEMO_STATE_KEY] = {}
+    return store[MEMO_STATE_KEY]
+
+
+def get_memo(store, section, key, default=None):
+    entry = _sections(store).get(section)
+    if entry is not None and entry[0] == key:
+        return entry[1]
+    return default
+
+
+def set_memo(store, section, key, value):
+    _sections(store)[section] = (key, value)
+
+
+def forget(store, *sections):
+    """Drop the memo for ``sections``, or for every section when none are given."""
+    memo = _sections(store)
+    if not sections:
+        memo.clear()
+    for section in sections:
+        memo.pop(section, None)
+
+
+def memoize(store, section, key, compute, regenerate=False, keep=None):
+    """Return the memoized value for ``(section, key)``, computing it on a miss.
+
+    ``keep(value)`` can veto storing a result (e.g. an API error message) so
+    the next rerun tries again instead of showing a stale failure.
+    """
+    sentinel = object()
+    value = sentinel if regenerate else get_memo(store, section, key, sentinel)
+    if value is sentinel:
+        value = compute()
+        if keep is None or keep(value):
+            set_memo(store, section, key, value)
+    return value
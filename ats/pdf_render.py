@@ -0,0 +1,106 @@
+"""In-memory PDF rendering for LLM answers, shared by every download button.
+
+The stylesheet is built once per process (``getSampleStyleSheet()`` returns a
+fresh sheet each call, and adding a style name twice raises), and markdown-ish
+model output is turned into ReportLab flowables in a single pass over its
+lines: ``#`` headings, ``-``/``*``/numbered bullets, fenced code blocks and
+``**bold**``/``*italic*``/```code``` inline markup. Nothing touches the disk.
+"""
+import io
+import re
+import threading
+
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.platypus import Paragraph, Preformatted, SimpleDocTemplate, Spacer
+
+_styles = None
+_styles_lock = threading.Lock()
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*)$")
+_BULLET = re.compile(r"^\s*(?:[-*•]|\d+[.)])\s+(.*)$")
+_BOLD = re.compile(r"\*\*(.+?)\*\*")
+_ITALIC = re.compile(r"(?<![*\w])\*(?!\s)(.+?)(?<!\s)\*(?![*\w])")
+_CODE = re.compile(r"`([^`]+)`")
+
+
+def get_styles():
+    """Process-wide stylesheet with the app's custom styles added once."""
+    global _styles
+    with _styles_lock:
+        if _styles is None:
+            styles = getSampleStyleSheet()
+            styles.add(ParagraphStyle(name='Custom', parent=styles['BodyText'], spaceAfter=8, leading=14))
+            styles.add(ParagraphStyle(name='CustomBullet', parent=styles['Custom'], leftIndent=18, bulletIndent=6,
+                                      spaceAfter=4))
+            styles.add(ParagraphStyle(name='CustomCode', parent=styles['Code'], fontSize=8, leading=10,
+                                      leftIndent=12, spaceBefore=4, spaceAfter=8))
+            styles.add(ParagraphStyle(name='CustomTitle', parent=styles['Title'], alignment=TA_CENTER))
+            _styles = styles
+        return _styles
+
+
+def _escape(text):
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def inline_markup(text):
+    """Escape ReportLab's XML specials, then map inline markdown to its tags."""
+    text = _escape(text)
+    text = _CODE.sub(r"<font face='Courier'>\1</font>", text)
+    text = _BOLD.sub(r"<b>\1</b>", text)
+    return _ITALIC.sub(r"<i>\1</i>", text)
+
+
+def _paragraph(text, style, **kwargs):
+    try:
+        return Paragraph(inline_markup(text), style, **kwargs)
+    except ValueError:
+        # Overlapping markers (e.g. "*a **b* c**") nest badly; keep the line as plain text
+        return Paragraph(_escape(text), style, **kwargs)
+
+
+def markdown_to_flowables(text):
+    styles = get_styles()
+    heading_styles = {1: styles['Heading1'], 2: styles['Heading2']}
+    flowables = []
+    code = None
+    for line in text.splitlines():
+        if line.strip().startswith("```"):
+            if code is None:
+                code = []
+            else:
+                flowables.append(Preformatted("\n".join(code), styles['CustomCode']))
+                code = None
+            continue
+        if code is not None:
+            code.append(line)
+            continue
+        if not line.strip():
+            continue
+        heading = _HEADING.match(line)
+        bullet = _BULLET.match(line)
+        if heading:
+            style = heading_styles.get(len(heading.group(1)), styles['Heading3'])
+            flowables.append(_paragraph(heading.group(2).strip("# "), style))
+        elif bullet:
+            flowables.append(_paragraph(bullet.group(1), styles['CustomBullet'], bulletText="•"))
+        else:
+            flowables.append(_paragraph(line, styles['Custom']))
+    if code:
+        # Unterminated fence at the end of a truncated answer
+        flowables.append(Preformatted("\n".join(code), styles['CustomCode']))
+    return flowables
+
+
+def render_pdf(text, title=None):
+    """Render ``text`` (with an optional title) to PDF bytes entirely in memory."""
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter, title=title or "")
+    story = []
+    if title:
+        story += [_paragraph(title, get_styles()['CustomTitle']), Spacer(1, 12)]
+    story += markdown_to_flowables(text)
+    doc.build(story or [Spacer(1, 12)])
+    return buffer.getvalue()
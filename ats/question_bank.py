@@ -0,0 +1,257 @@
+"""Pre-generated, versioned answers for prompts that don't depend on the user.
+
+DSA questions per level, "Teach me" explanations and case studies per topic,
+interview questions per category, the MNC project/skill overviews and the
+group-discussion question pools are the same for everyone, so they are generated ahead of time for every selectbox
+value and served from SQLite instead of a live call per click.
+
+Each (bank, item) keeps a few variants of its latest version; ``sample``
+returns one at random for variety. A rebuild writes a new version in one
+transaction, so readers switch over atomically, and older versions are pruned.
+
+Build offline (needs GOOGLE_API_KEY)::
+
+    python -m ats.question_bank build                 # every bank, every item
+    python -m ats.question_bank build --bank DSA_Questions --variants 5
+    python -m ats.question_bank stats
+
+The app also refreshes items older than ``QUESTION_BANK_REFRESH_HOURS`` in the
+background, and stores a live answer for any item the bank is still missing.
+"""
+if __name__ == "__main__":
+    # Run from the command line: read .env before this module or any ats import reads its settings
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+import argparse  # noqa: E402
+import os  # noqa: E402
+import random  # noqa: E402
+import sqlite3  # noqa: E402
+import threading  # noqa: E402
+import time  # noqa: E402
+from dataclasses import dataclass  # noqa: E402
+
+from ats.concurrency import LLM_CALL_TIMEOUT, Task, fan_out, set_session  # noqa: E402
+from ats.llm import is_valid_response  # noqa: E402
+
+QUESTION_BANK_PATH = os.getenv("QUESTION_BANK_PATH", os.path.join(".cache", "question_bank.sqlite"))
+QUESTION_BANK_VARIANTS = int(os.getenv("QUESTION_BANK_VARIANTS", "3"))
+QUESTION_BANK_KEEP_VERSIONS = int(os.getenv("QUESTION_BANK_KEEP_VERSIONS", "2"))
+# 0 disables the background refresh
+QUESTION_BANK_REFRESH_HOURS = float(os.getenv("QUESTION_BANK_REFRESH_HOURS", "24"))
+
+DSA_LEVELS = ("Easy", "Intermediate", "Advanced")
+DSA_TOPICS = ("Arrays", "Linked Lists", "Trees", "Graphs", "Dynamic Programming", "Recursion",
+              "algorithm complexity (Big O notation)", "sorting", "searching")
+QUESTION_CATEGORIES = ("Python", "Machine Learning", "Deep Learning", "Docker", "Data Warehousing",
+                       "Data Pipelines", "Data Modeling", "SQL")
+MNC_NAMES = ("TCS", "Infosys", "Wipro")
+DISCUSSION_TOPICS = ("Data Science", "AI", "Machine Learning", "Web Development")
+
+
+@dataclass(frozen=True)
+class Generator:
+    bank: str
+    options: tuple
+    template: str
+
+    def prompt(self, option):
+        return self.template.format(option=option)
+
+
+# The bank name doubles as the telemetry action
+GENERATORS = {generator.bank: generator for generator in (
+    Generator("DSA_Questions", DSA_LEVELS,
+              "Generate 10 DSA questions and answers for data science at {option} level."),
+    Generator("Teach_me_DSA_Topics", DSA_TOPICS,
+              "Explain the {option} topic in an easy-to-understand way suitable for beginners, using simple language and clear examples add all details like defination exampales of {option} and code implementation in python with full explaination of that code."),
+    Generator("Case_Study_DSA_Topics", DSA_TOPICS,
+              "Provide a real-world case study on {option} for data science/ data engineer/ m.l/ai with a detailed, easy-to-understand solution."),
+    Generator("Interview_Questions", QUESTION_CATEGORIES,
+              "Generate 30 {option} interview questions and detailed answers"),
+    Generator("Project_Types_Skills", MNC_NAMES,
+              "What types of Data Science projects does {option} typically work on, and what skills align best?"),
+    Generator("Required_Skills", MNC_NAMES,
+              "What key technical and soft skills are needed for a Data Science role at {option}?"),
+    Generator("Discussion_Questions", DISCUSSION_TOPICS,
+              "Write 15 open-ended group discussion questions about {option}, from basics to current debates. "
+              "One question per line, no numbering and nothing else."),
+)}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    bank TEXT NOT NULL,
+    item TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    variant INTEGER NOT NULL,
+    content TEXT NOT NULL,
+    built_at REAL NOT NULL,
+    PRIMARY KEY (bank, item, version, variant)
+);
+"""
+
+
+@dataclass(frozen=True)
+class Entry:
+    content: str
+    version: int
+    built_at: float
+
+
+class QuestionBank:
+    """SQLite store of answer variants per (bank, item), read one row at a time."""
+
+    def __init__(self, path=QUESTION_BANK_PATH, keep_versions=QUESTION_BANK_KEEP_VERSIONS):
+        self.path = path
+        self.keep_versions = keep_versions
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=10)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def _execute(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def sample(self, bank, item, rng=random):
+        """A random variant of the latest version of ``item``, or None if it isn't built."""
+        rows = self._execute(
+            "SELECT content, version, built_at FROM items WHERE bank = ? AND item = ? AND version = "
+            "(SELECT MAX(version) FROM items WHERE bank = ? AND item = ?)", (bank, item, bank, item))
+        return Entry(*rng.choice(rows)) if rows else None
+
+    def add(self, bank, item, contents):
+        """Store ``contents`` as the next version of ``item`` and return its number."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                (latest,), = self._conn.execute("SELECT COALESCE(MAX(version), 0) FROM items WHERE bank = ? AND item = ?",
+                                                (bank, item)).fetchall()
+                version = latest + 1
+                self._conn.executemany("INSERT INTO items VALUES (?, ?, ?, ?, ?, ?)",
+                                       [(bank, item, version, i, content, now) for i, content in enumerate(contents)])
+                self._conn.execute("DELETE FROM items WHERE bank = ? AND item = ? AND version <= ?",
+                                   (bank, item, version - self.keep_versions))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return version
+
+    def built(self):
+        """``{(bank, item): built_at}`` for the latest version of every stored item."""
+        rows = self._execute("SELECT bank, item, MAX(built_at) FROM items GROUP BY bank, item")
+        return {(bank, item): built_at for bank, item, built_at in rows}
+
+    def stats(self):
+        rows = self._execute("SELECT bank, COUNT(DISTINCT item), MAX(version), MIN(built_at) FROM items GROUP BY bank")
+        return [{"bank": bank, "items": items, "latest_version": version, "oldest_build": built_at}
+                for bank, items, version, built_at in rows]
+
+
+def build(bank, generate, banks=None, variants=QUESTION_BANK_VARIANTS, max_age=None, missing=True):
+    """Generate ``variants`` answers per item and store each complete item as a new version.
+
+    ``max_age`` (seconds) limits the build to items older than that; ``missing``
+    controls whether items not in the store yet are built too. Returns
+    ``(stored, failed)`` item counts. Calls go through the shared fair pool.
+    """
+    built = bank.built()
+    now = time.time()
+    todo = []
+    for generator in GENERATORS.values():
+        if banks and generator.bank not in banks:
+            continue
+        for option in generator.options:
+            built_at = built.get((generator.bank, option))
+            if built_at is None and not missing:
+                continue
+            if built_at is not None and max_age is not None and now - built_at < max_age:
+                continue
+            todo.append((generator, option))
+
+    def generate_item(generator, option):
+        # Fresh answers each time: no response cache, no deterministic mode. Variants of one
+        # item run one after another, since identical prompts in flight share one request.
+        answers = [generate(generator.prompt(option), action=generator.bank, deterministic=False, variants=0)
+                   for _ in range(variants)]
+        return [answer for answer in answers if is_valid_response(answer)]
+
+    # fan_out hands items to the pool as per-key slots free up and times each one from when it
+    # starts, so items queued behind the rate limit aren't failed (and their answers thrown away)
+    tasks = [Task((generator, option), generate_item, (generator, option), timeout=LLM_CALL_TIMEOUT * variants)
+             for generator, option in todo]
+    stored = 0
+    # Stored as each item finishes, so an interrupted build keeps what it has paid for
+    for (generator, option), contents, error in fan_out(tasks):
+        if error is None and contents:
+            bank.add(generator.bank, option, contents)
+            stored += 1
+    return stored, len(todo) - stored
+
+
+def start_refresh(bank, generate, interval_hours=QUESTION_BANK_REFRESH_HOURS):
+    """Rebuild items older than ``interval_hours`` on a daemon thread, checking every hour at most."""
+    if interval_hours <= 0:
+        return None
+    max_age = interval_hours * 3600
+
+    def loop():
+        # Counts as its own session, so refreshes take turns with users in the LLM pool
+        set_session("question-bank-refresh")
+        while True:
+            try:
+                build(bank, generate, max_age=max_age, missing=False)
+            except Exception:
+                pass
+            time.sleep(min(max_age, 3600))
+
+    thread = threading.Thread(target=loop, name="question-bank-refresh", daemon=True)
+    thread.start()
+    return thread
+
+
+_bank = None
+_bank_lock = threading.Lock()
+
+
+def get_question_bank():
+    """The process-wide bank; its background refresh starts on first use."""
+    global _bank
+    with _bank_lock:
+        if _bank is None:
+            from ats.gemini import get_gemini_response
+
+            _bank = QuestionBank()
+            start_refresh(_bank, get_gemini_response)
+        return _bank
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or inspect the pre-generated question bank.")
+    parser.add_argument("command", choices=["build", "stats"])
+    parser.add_argument("--bank", action="append", choices=sorted(GENERATORS), help="only these banks")
+    parser.add_argument("--variants", type=int, default=QUESTION_BANK_VARIANTS)
+    parser.add_argument("--stale-hours", type=float, help="only rebuild items older than this")
+    parser.add_argument("--path", default=QUESTION_BANK_PATH)
+    args = parser.parse_args()
+
+    bank = QuestionBank(args.path)
+    if args.command == "build":
+        from ats.gemini import get_gemini_response
+
+        max_age = args.stale_hours * 3600 if args.stale_hours is not None else None
+        stored, failed = build(bank, get_gemini_response, banks=args.bank, variants=args.variants, max_age=max_age)
+        print(f"stored {stored} items, {failed} failed")
+    for row in bank.stats():
+        print(f"{row['bank']:24s} {row['items']:3d} items  v{row['latest_version']}  "
+              f"oldest {time.strftime('%Y-%m-%d %H:%M', time.localtime(row['oldest_build']))}")
+
+
+if __name__ == "__main__":
+    main()
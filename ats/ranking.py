@@ -0,0 +1,128 @@
+"""Local keyword ranking of resumes against a job description (BM25).
+
+No API calls: the JD is reduced to weighted keywords (unigrams and adjacent
+pairs such as "machine learning") and resumes are scored with Okapi BM25 over
+a precomputed inverted index. Posting lists are NumPy arrays, so scoring a
+query is one vectorised update per JD keyword regardless of corpus size.
+
+Two numbers come out per resume: the BM25 score used for ordering, and a
+0-100 keyword coverage (share of JD keyword weight present in the resume)
+that is shown to users as an instant match percentage.
+"""
+import math
+import re
+from collections import Counter, defaultdict
+
+import numpy as np
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#.\-]*")
+# Single letters that are real skills; every other one-character token is noise
+_SHORT_SKILLS = {"c", "r"}
+
+STOPWORDS = frozenset("""
+a about above across after again against all also am an and any are as at be because been before being
+below between both but by can could did do does doing down during each etc few for from further had has
+have having he her here hers him his how i if in into is it its itself just me more most my no nor not
+now of off on once only or other our ours out over own same she should so some such than that the their
+theirs them then there these they this those through to too under until up very was we were what when
+where which while who whom why will with would you your yours
+ability able candidate candidates company core day degree description desired details environment
+excellent experience good great include includes including job knowledge looking must need needs new plus
+preferred proficiency proficient qualification qualifications related required requirements
+responsibilities responsible role seeking skill skills strong team teams understanding using well work
+working year years
+""".split())
+
+
+def tokenize(text):
+    """Lower-cased skill-friendly tokens (keeps c++, c#, node.js) plus adjacent-word pairs."""
+    words = []
+    for token in _TOKEN.findall((text or "").lower()):
+        token = token.rstrip(".-")
+        if token in STOPWORDS or token.isdigit():
+            continue
+        if len(token) == 1 and token not in _SHORT_SKILLS:
+            continue
+        words.append(token)
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def extract_keywords(job_description, top_n=40):
+    """Weighted JD keywords: ``{term: weight}`` with log-scaled term frequency."""
+    counts = Counter(tokenize(job_description))
+    # Adjacent pairs are only kept when they repeat, i.e. look like a real phrase
+    terms = [(term, count) for term, count in counts.items() if " " not in term or count > 1]
+    terms.sort(key=lambda item: (-item[1], item[0]))
+    return {term: 1.0 + math.log(count) for term, count in terms[:top_n]}
+
+
+class ResumeIndex:
+    """Inverted index over a resume corpus with vectorised BM25 scoring."""
+
+    def __init__(self, documents, k1=1.5, b=0.75):
+        self.names = [name for name, _ in documents]
+        self.k1 = k1
+        tokenized = [tokenize(text) for _, text in documents]
+        doc_len = np.array([len(tokens) for tokens in tokenized], dtype=float)
+        avgdl = doc_len.mean() if len(doc_len) and doc_len.mean() > 0 else 1.0
+        # Per-document part of the BM25 denominator, computed once
+        self._norm = k1 * (1 - b + b * doc_len / avgdl)
+
+        postings = defaultdict(dict)
+        for doc_id, tokens in enumerate(tokenized):
+            for term, count in Counter(tokens).items():
+                postings[term][doc_id] = count
+        n_docs = len(documents)
+        self.index = {}
+        self.idf = {}
+        for term, docs in postings.items():
+            self.index[term] = (np.fromiter(docs.keys(), dtype=np.int64, count=len(docs)),
+                                np.fromiter(docs.values(), dtype=float, count=len(docs)))
+            self.idf[term] = math.log(1 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+
+    def __len__(self):
+        return len(self.names)
+
+    def bm25(self, keywords):
+        """BM25 score of every document for ``keywords`` (``{term: weight}``)."""
+        scores = np.zeros(len(self.names))
+        for term, weight in keywords.items():
+            posting = self.index.get(term)
+            if posting is None:
+                continue
+            docs, tf = posting
+            scores[docs] += weight * self.idf[term] * tf * (self.k1 + 1) / (tf + self._norm[docs])
+        return scores
+
+    def coverage(self, keywords):
+        """Percentage (0-100) of total keyword weight found in each document."""
+        covered = np.zeros(len(self.names))
+        total = sum(keywords.values())
+        if not total:
+            return covered
+        for term, weight in keywords.items():
+            posting = self.index.get(term)
+            if posting is not None:
+                covered[posting[0]] += weight
+        return covered * (100.0 / total)
+
+    def rank(self, job_description, top_k=None):
+        """``[(name, bm25, coverage_percent), ...]`` best first, optionally cut to ``top_k``."""
+        keywords = extract_keywords(job_description)
+        bm25 = self.bm25(keywords)
+        coverage = self.coverage(keywords)
+        order = np.lexsort((-coverage, -bm25))
+        if top_k is not None:
+            order = order[:top_k]
+        return [(self.names[i], float(bm25[i]), float(coverage[i])) for i in order]
+
+
+def keyword_match(job_description, resume_text):
+    """Instant single-resume match: ``(percentage, matched_terms, missing_terms)``."""
+    keywords = extract_keywords(job_description)
+    present = set(tokenize(resume_text))
+    matched = [term for term in keywords if term in present]
+    missing = [term for term in keywords if term not in present]
+    total = sum(keywords.values())
+    percentage = 100.0 * sum(keywords[term] for term in matched) / total if total else 0.0
+    return percentage, matched, missing
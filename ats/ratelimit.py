@@ -0,0 +1,153 @@
+"""Client-side protection for Gemini calls: rate limit, retry, coalescing.
+
+* A process-wide token bucket sized to the API quota (``GEMINI_RPM``) spaces
+  requests out instead of letting a burst of sessions all hit 429 together.
+* Retryable failures (429, 5xx, timeouts, dropped connections) are retried
+  with full-jitter exponential backoff.
+* Concurrent calls with the same key share a single in-flight request.
+
+Everything is counted in ``counters`` for the usage dashboard.
+"""
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future
+
+GEMINI_RPM = float(os.getenv("GEMINI_RPM", "15"))
+GEMINI_BURST = int(os.getenv("GEMINI_BURST", "5"))
+GEMINI_QUEUE_TIMEOUT = float(os.getenv("GEMINI_QUEUE_TIMEOUT", "60"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+LLM_BACKOFF_BASE = float(os.getenv("LLM_BACKOFF_BASE", "1"))
+LLM_BACKOFF_CAP = float(os.getenv("LLM_BACKOFF_CAP", "30"))
+
+_RETRYABLE_CODES = {408, 429, 500, 502, 503, 504}
+_RETRYABLE_NAMES = {"ResourceExhausted", "TooManyRequests", "ServiceUnavailable", "InternalServerError",
+                    "DeadlineExceeded", "GatewayTimeout", "BadGateway"}
+
+
+class RateLimitTimeout(RuntimeError):
+    """No request slot became free within GEMINI_QUEUE_TIMEOUT."""
+
+
+class Counters:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def add(self, name, amount=1):
+        with self._lock:
+            self._values[name] = self._values.get(name, 0) + amount
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._values)
+
+
+counters = Counters()
+
+
+class TokenBucket:
+    """Classic token bucket: ``rate`` tokens per second, at most ``capacity`` banked."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._cond = threading.Condition()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, timeout=None):
+        """Take one token, waiting up to ``timeout`` seconds; returns ``False`` on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._refill()
+            if self._tokens < 1:
+                counters.add("throttled")
+            while self._tokens < 1:
+                wait = (1 - self._tokens) / self.rate
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    wait = min(wait, remaining)
+                self._cond.wait(wait)
+                self._refill()
+            self._tokens -= 1
+            return True
+
+
+class Coalescer:
+    """Single-flight: callers with the same key while a call is running get its result."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight = {}
+
+    def do(self, key, fn):
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            counters.add("coalesced")
+            return future.result()
+        try:
+            result = fn()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+
+bucket = TokenBucket(GEMINI_RPM / 60.0, GEMINI_BURST)
+coalescer = Coalescer()
+
+
+def is_retryable(error):
+    code = getattr(error, "code", None)
+    code = getattr(code, "value", code)
+    if isinstance(code, tuple):
+        code = code[0]
+    return (type(error).__name__ in _RETRYABLE_NAMES or code in _RETRYABLE_CODES
+            or isinstance(error, (ConnectionError, TimeoutError)))
+
+
+def backoff_delay(attempt):
+    """Full jitter: uniform in [0, min(cap, base * 2**attempt)]."""
+    return random.uniform(0, min(LLM_BACKOFF_CAP, LLM_BACKOFF_BASE * 2 ** attempt))
+
+
+def _with_retries(fn):
+    for attempt in range(LLM_MAX_RETRIES + 1):
+        if not bucket.acquire(timeout=GEMINI_QUEUE_TIMEOUT):
+            counters.add("queue_timeouts")
+            raise RateLimitTimeout("Too many requests right now; please try again in a moment.")
+        counters.add("requests")
+        try:
+            return fn()
+        except Exception as e:
+            if not is_retryable(e):
+                raise
+            if attempt == LLM_MAX_RETRIES:
+                counters.add("retries_exhausted")
+                raise
+            counters.add("retries")
+            time.sleep(backoff_delay(attempt))
+
+
+def guarded_call(fn, key=None):
+    """Call ``fn()`` under the rate limiter with retries; share in-flight calls by ``key``."""
+    if key is None:
+        return _with_retries(fn)
+    return coalescer.do(key, lambda: _with_retries(fn))
@@ -0,0 +1,148 @@
+"""On-disk cache of Gemini responses, shared by every session and restart.
+
+Entries are keyed by model, action and the whitespace-normalised prompt. A key
+can hold several *variants* so that callers who want some variety still get a
+different answer now and then without an API round-trip on every click.
+"""
+import hashlib
+import os
+import random
+import re
+import sqlite3
+import threading
+import time
+
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", os.path.join(".cache", "llm_responses.sqlite"))
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 3600)))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT NOT NULL,
+    variant INTEGER NOT NULL,
+    model TEXT NOT NULL,
+    action TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (key, variant)
+);
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+"""
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_prompt(prompt):
+    return _WHITESPACE.sub(" ", prompt).strip()
+
+
+def cache_key(model, prompt, action):
+    raw = "\x1f".join([model, action, normalize_prompt(prompt)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed response store with TTL and entry-count eviction."""
+
+    def __init__(self, path=LLM_CACHE_PATH, ttl=LLM_CACHE_TTL, max_entries=LLM_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def _fresh_after(self):
+        return time.time() - self.ttl
+
+    def variants(self, key):
+        """All unexpired responses stored under ``key``."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT variant, response FROM responses WHERE key = ? AND created_at >= ? ORDER BY variant",
+                (key, self._fresh_after()),
+            ).fetchall()
+        return rows
+
+    def get(self, key, max_variants=1):
+        """Return a cached response for ``key``, or ``None``.
+
+        With ``max_variants > 1`` this only answers once the pool is full, so
+        callers keep generating (and storing) new variants until then and
+        afterwards get a random pick from the pool.
+        """
+        rows = self.variants(key)
+        if not rows or len(rows) < max_variants:
+            return None
+        variant, response = random.choice(rows)
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ? AND variant = ?",
+                (time.time(), key, variant),
+            )
+        return response
+
+    def put(self, key, response, model, action, max_variants=1):
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM responses WHERE key = ? AND created_at < ?", (key, self._fresh_after()))
+                used = [row[0] for row in self._conn.execute("SELECT variant FROM responses WHERE key = ?", (key,))]
+                if len(used) >= max_variants:
+                    # Pool already full (another session got there first): replace the oldest variant
+                    variant = self._conn.execute(
+                        "SELECT variant FROM responses WHERE key = ? ORDER BY created_at LIMIT 1", (key,)
+                    ).fetchone()[0]
+                else:
+                    variant = next(i for i in range(max_variants) if i not in used)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, variant, model, action, response, now, now),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        self.evict()
+
+    def discard(self, key):
+        """Drop every variant stored under ``key``."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def evict(self):
+        """Drop expired rows, then the least recently used ones beyond ``max_entries``."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE created_at < ?", (self._fresh_after(),))
+            self._conn.execute(
+                "DELETE FROM responses WHERE rowid IN ("
+                " SELECT rowid FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_response_cache():
+    """Process-wide cache instance, opened on first use."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache()
+        return _default_cache
@@ -0,0 +1,69 @@
+"""Resume PDF parsing, cached by a hash of the uploaded bytes.
+
+Streamlit reruns the whole script on every click, so parsing must be a cache
+lookup after the first time a given file is seen. The cache is process-wide:
+the same PDF uploaded from another session is not parsed again either.
+Text extraction itself lives in ``ats.extract``.
+"""
+import hashlib
+import os
+from dataclasses import dataclass
+
+from ats.cache import LRUCache
+from ats.extract import PAGE_SEPARATOR, extract_pages
+
+RESUME_CACHE_SIZE = int(os.getenv("RESUME_CACHE_SIZE", "64"))
+
+_resume_cache = LRUCache(maxsize=RESUME_CACHE_SIZE)
+
+
+@dataclass(frozen=True)
+class ParsedResume:
+    digest: str
+    text: str
+    pages: tuple
+    ocr_pages: tuple = ()
+
+    @property
+    def page_count(self):
+        return len(self.pages)
+
+    @property
+    def has_text(self):
+        return bool(self.text.strip())
+
+
+def resume_digest(data):
+    """Content address of an uploaded file."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def extract_resume(data, digest=None, parallel=True):
+    """Extract ``data`` page by page; pages stay separate in ``pages`` and ``text``."""
+    pages, ocr = extract_pages(data, parallel=parallel)
+    return ParsedResume(digest=digest or resume_digest(data), text=PAGE_SEPARATOR.join(pages),
+                        pages=tuple(pages), ocr_pages=ocr)
+
+
+def parse_resume(data):
+    """Return the parsed resume for ``data``, using the shared LRU cache."""
+    digest = resume_digest(data)
+    return _resume_cache.get_or_create(digest, lambda: extract_resume(data, digest))
+
+
+def cached_resume(digest):
+    """The cached parse of the file with ``digest``, or None."""
+    return _resume_cache.get(digest)
+
+
+def store_resume(parsed):
+    """Cache a resume parsed elsewhere (e.g. in a pool worker) under its digest."""
+    _resume_cache.put(parsed.digest, parsed)
+
+
+def clear_resume_cache():
+    _resume_cache.clear()
+
+
+def resume_cache_stats():
+    return _resume_cache.stats()
@@ -0,0 +1,221 @@
+"""Core ATS operations without Streamlit.
+
+The Streamlit sections, the CLI (``ats.cli``) and the HTTP API (``ats.api``)
+share these functions and prompt builders. Every operation takes an optional
+``generate`` (the ``get_gemini_response`` signature, default Gemini) and
+raises ``ServiceError`` instead of returning the ``Error:`` strings the
+low-level call uses.
+
+``process_resumes`` is the streaming pipeline behind batch use. It reads
+``(name, bytes)`` pairs lazily, parses them in the process pool, runs the
+requested operations on the shared fair LLM pool, and yields one
+``ResumeResult`` per resume as soon as it is ready. At most ``window``
+resumes are in flight, so memory stays flat however many files there are.
+"""
+import os
+from concurrent.futures import FIRST_COMPLETED, wait
+from dataclasses import asdict, dataclass, field
+
+from ats.gemini import get_gemini_response
+from ats.llm import is_valid_response
+from ats.resume import parse_resume
+from ats.structured import match_resume
+from ats.text_prep import compact_resume, jd_for_prompt, resume_for_prompt
+
+LEARNING_PATH_DURATIONS = ("3 Months", "6 Months", "9 Months", "12 Months")
+SERVICE_WINDOW = int(os.getenv("SERVICE_WINDOW", "16"))
+
+
+class ServiceError(RuntimeError):
+    """An operation could not produce a result (missing input, API error, unreadable PDF)."""
+
+
+def _checked(text):
+    if not is_valid_response(text):
+        raise ServiceError(text or "Empty response")
+    return text
+
+
+# -------------------- ✅ Prompts --------------------
+
+def match_summary_prompt(gap):
+    return f"In 3-4 sentences, summarize how well this candidate fits the job and what matters most to close the gap.\n\n{gap.gap_prompt()}"
+
+
+def learning_path_prompt(job_description, resume, duration):
+    return f"Create a detailed and structured personalized learning path for a duration of {duration} based on the resume and job description:\n\nJob Description:\n{job_description}\n\nResume:\n{resume} and also suggest books and other important thing"
+
+
+def updated_resume_prompt(resume):
+    return f"Suggest improvements and generate an updated resume for this candidate according to job description, not more than 2 pages:\n{resume}"
+
+
+def interview_questions_prompt(job_description):
+    return f"Generate 30 technical interview questions and their detailed answers according to that job description.\n\nJob Description:\n{job_description}"
+
+
+# -------------------- ✅ Operations --------------------
+
+def load_resume(data):
+    """Parse PDF bytes (cached per file); raises ``ServiceError`` if there is no text."""
+    try:
+        parsed = parse_resume(data)
+    except Exception as e:
+        raise ServiceError(f"Failed to read PDF: {e}") from e
+    if not parsed.has_text:
+        raise ServiceError("No extractable text in PDF (scanned, and OCR found none or is not installed)")
+    return parsed
+
+
+@dataclass
+class MatchReport:
+    match_percentage: float
+    matched: list = field(default_factory=list)
+    missing: list = field(default_factory=list)
+    method: str = ""
+    summary: str = ""
+
+
+def match(job_description, parsed, generate=None, summary=True):
+    """Local skill gap plus (optionally) a short LLM summary of it."""
+    from ats.embeddings import skill_gap
+
+    gap = skill_gap(jd_for_prompt(job_description), compact_resume(parsed), parsed.digest)
+    report = MatchReport(gap.match_percentage, gap.matched, gap.missing, gap.method)
+    if summary:
+        report.summary = _checked((generate or get_gemini_response)(
+            match_summary_prompt(gap), action="Percentage_Match", deterministic=True))
+    return report
+
+
+def score(job_description, parsed, generate=None):
+    """Structured LLM match score, the one batch ranking uses."""
+    return match_resume(jd_for_prompt(job_description), resume_for_prompt(parsed, "Batch_Percentage_Match"),
+                        generate or get_gemini_response, action="Batch_Percentage_Match")
+
+
+def learning_path(job_description, parsed, duration=LEARNING_PATH_DURATIONS[0], generate=None):
+    prompt = learning_path_prompt(jd_for_prompt(job_description), resume_for_prompt(parsed, "Personalized_Learning_Path"),
+                                  duration)
+    return _checked((generate or get_gemini_response)(prompt, action="Personalized_Learning_Path"))
+
+
+def updated_resume(parsed, generate=None):
+    prompt = updated_resume_prompt(resume_for_prompt(parsed, "Generate_Updated_Resume"))
+    return _checked((generate or get_gemini_response)(prompt, action="Generate_Updated_Resume"))
+
+
+def interview_questions(job_description, generate=None):
+    prompt = interview_questions_prompt(jd_for_prompt(job_description))
+    return _checked((generate or get_gemini_response)(prompt, action="Generate_Interview_Questions"))
+
+
+def to_pdf(text, title=None):
+    from ats.pdf_render import render_pdf
+
+    return render_pdf(text, title=title)
+
+
+# Per-resume operations for the pipeline; each returns something JSON-serialisable
+OPERATIONS = {
+    "match": lambda jd, parsed, generate, options: asdict(match(jd, parsed, generate)),
+    "score": lambda jd, parsed, generate, options: asdict(score(jd, parsed, generate)),
+    "learning_path": lambda jd, parsed, generate, options: learning_path(
+        jd, parsed, options.get("duration", LEARNING_PATH_DURATIONS[0]), generate),
+    "updated_resume": lambda jd, parsed, generate, options: updated_resume(parsed, generate),
+}
+
+
+# -------------------- ✅ Streaming Pipeline --------------------
+
+@dataclass
+class ResumeResult:
+    name: str
+    pages: int = 0
+    results: dict = field(default_factory=dict)
+    # Operations that failed, with their error
+    errors: dict = field(default_factory=dict)
+    error: str = ""
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def _run_operations(job_description, parsed, operations, generate, options):
+    results, errors = {}, {}
+    for operation in operations:
+        try:
+            results[operation] = OPERATIONS[operation](job_description, parsed, generate, options)
+        except Exception as e:
+            errors[operation] = str(e)
+    return results, errors
+
+
+def process_resumes(items, job_description, operations=("match",), generate=None, window=SERVICE_WINDOW,
+                    **options):
+    """Run ``operations`` on every ``(name, bytes)`` in ``items``; yields ``ResumeResult`` as each finishes.
+
+    Unknown operations raise ``ServiceError`` here, before anything is read. An
+    ``ats.batch.Unreadable`` in place of the bytes (a corrupt ZIP from
+    ``collect_pdfs``) comes back as that item's error row. Repeated names
+    (``resume.pdf`` from two ZIP folders) are numbered, as in batch scoring.
+    """
+    unknown = set(operations) - set(OPERATIONS)
+    if unknown:
+        raise ServiceError(f"Unknown operation(s): {', '.join(sorted(unknown))}")
+    return _pipeline(iter(items), job_description, tuple(operations), generate or get_gemini_response,
+                     max(1, window), options)
+
+
+def _pipeline(items, job_description, operations, generate, window, options):
+    from ats.batch import ParseStage, unique_names
+    from ats.concurrency import get_executor
+
+    # Same parse stage as batch scoring: cache hits skip the pool, a worker crash fails only its PDF
+    stage = ParseStage()
+    executor = get_executor()
+    items = unique_names(items)
+    running = {}
+    ready = []
+    exhausted = False
+
+    def parsed_row(name, parsed, error):
+        # A ResumeResult for a file that can't go further, or None once its operations are started
+        if error:
+            return ResumeResult(name, error=error)
+        if not parsed.has_text:
+            return ResumeResult(name, parsed.page_count, error="No extractable text in PDF")
+        future = executor.submit(_run_operations, job_description, parsed, operations, generate, options)
+        running[future] = (name, parsed)
+        return None
+
+    def fill():
+        nonlocal exhausted
+        while not exhausted and stage.pending + len(running) < window:
+            item = next(items, None)
+            if item is None:
+                exhausted = True
+                return
+            result = stage.add(*item)
+            row = result and parsed_row(*result)
+            if row:
+                ready.append(row)
+
+    while True:
+        fill()
+        yield from ready
+        ready.clear()
+        if not (stage.futures or running):
+            if exhausted:
+                return
+            continue
+        done, _ = wait([*stage.futures, *running], return_when=FIRST_COMPLETED)
+        for result in stage.finished(done):
+            row = parsed_row(*result)
+            if row:
+                yield row
+        for future in done:
+            if future in running:
+                name, parsed = running.pop(future)
+                results, errors = future.result()
+                yield ResumeResult(name, parsed.page_count, results, errors)
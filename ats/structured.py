@@ -0,0 +1,178 @@
+"""Schema-constrained JSON answers for the scoring and insights prompts.
+
+Gemini is asked for ``application/json`` output with a response schema, the
+reply is validated against the same schema, and a single cheap repair call is
+made if it does not parse. Validated results are turned into small dataclasses
+and cached per prompt, so the ranking table, exports and PDFs reuse them
+instead of re-prompting or scraping numbers out of prose.
+"""
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass, field
+
+from ats.cache import LRUCache
+from ats.gemini import forget_response
+from ats.llm import is_valid_response
+
+STRUCTURED_CACHE_SIZE = int(os.getenv("STRUCTURED_CACHE_SIZE", "512"))
+
+_results = LRUCache(maxsize=STRUCTURED_CACHE_SIZE)
+
+_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+
+MATCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "match_percentage": {"type": "number"},
+        "matched_skills": _STRING_LIST,
+        "missing_skills": _STRING_LIST,
+        "summary": {"type": "string"},
+    },
+    "required": ["match_percentage", "matched_skills", "missing_skills", "summary"],
+}
+
+INSIGHTS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "job_roles": _STRING_LIST,
+        "market_trends": _STRING_LIST,
+        "summary": {"type": "string"},
+    },
+    "required": ["job_roles", "market_trends", "summary"],
+}
+
+MATCH_PROMPT = (
+    "Evaluate the following resume against this job description. Return a JSON object with "
+    "match_percentage (0-100), matched_skills, missing_skills and a short summary of the fit."
+    "\n\nJob Description:\n{job_description}\n\nResume:\n{resume}"
+)
+
+INSIGHTS_PROMPT = (
+    "Based on this resume, suggest specific job roles the user is most suited for and analyze "
+    "market trends for their skills. Return a JSON object with job_roles, market_trends and a "
+    "short summary.\n\nResume:\n{resume}"
+)
+
+REPAIR_PROMPT = (
+    "The text below was supposed to be JSON matching this schema but is invalid ({error}). "
+    "Return only the corrected JSON object.\n\nSchema:\n{schema}\n\nText:\n{text}"
+)
+
+
+class StructuredOutputError(ValueError):
+    """The model did not return valid JSON for the schema, even after a repair attempt."""
+
+
+@dataclass
+class MatchResult:
+    match_percentage: float
+    matched_skills: list = field(default_factory=list)
+    missing_skills: list = field(default_factory=list)
+    summary: str = ""
+
+    def to_text(self):
+        return (f"Match: {self.match_percentage:.0f}%\n\n{self.summary}\n\n"
+                f"Matched skills: {', '.join(self.matched_skills) or '-'}\n"
+                f"Missing skills: {', '.join(self.missing_skills) or '-'}\n")
+
+
+@dataclass
+class Insights:
+    job_roles: list = field(default_factory=list)
+    market_trends: list = field(default_factory=list)
+    summary: str = ""
+
+    def to_text(self):
+        roles = "\n".join(f"- {role}" for role in self.job_roles)
+        trends = "\n".join(f"- {trend}" for trend in self.market_trends)
+        return f"{self.summary}\n\nJob roles:\n{roles}\n\nMarket trends:\n{trends}\n"
+
+
+_TYPES = {"object": dict, "array": list, "string": str, "number": (int, float), "integer": int, "boolean": bool}
+
+
+def validate(data, schema, path="$"):
+    """Check ``data`` against the subset of JSON Schema used here; raises ``ValueError``."""
+    expected = _TYPES[schema["type"]]
+    if not isinstance(data, expected) or (schema["type"] in ("number", "integer") and isinstance(data, bool)):
+        raise ValueError(f"{path} should be {schema['type']}")
+    if schema["type"] == "object":
+        for name in schema.get("required", []):
+            if name not in data:
+                raise ValueError(f"{path}.{name} is missing")
+        for name, sub in schema.get("properties", {}).items():
+            if name in data:
+                validate(data[name], sub, f"{path}.{name}")
+    elif schema["type"] == "array":
+        for i, item in enumerate(data):
+            validate(item, schema["items"], f"{path}[{i}]")
+    return data
+
+
+def parse_json(text, schema):
+    return validate(json.loads(_FENCE.sub("", text.strip())), schema)
+
+
+def generate_structured(generate, prompt, schema, action):
+    """Ask ``generate`` for JSON matching ``schema`` and return the validated object.
+
+    ``generate`` has the ``get_gemini_response`` signature. Calls are made in
+    deterministic mode so identical prompts are also served from the on-disk
+    response cache; replies that never yield valid JSON are dropped from it
+    again, so a retry reaches the model instead of replaying the same text.
+    """
+    config = {"response_mime_type": "application/json", "response_schema": schema}
+    text = generate(prompt, action=action, deterministic=True, generation_config=config)
+    if not is_valid_response(text):
+        raise StructuredOutputError(text)
+    try:
+        return parse_json(text, schema)
+    except ValueError as e:
+        error = e
+    repair = REPAIR_PROMPT.format(error=error, schema=json.dumps(schema), text=text)
+    repair_action = f"{action}_Repair"
+    fixed = generate(repair, action=repair_action, deterministic=True, generation_config=config)
+    try:
+        if not is_valid_response(fixed):
+            raise StructuredOutputError(fixed)
+        try:
+            return parse_json(fixed, schema)
+        except ValueError as e:
+            raise StructuredOutputError(f"Invalid JSON from model: {e}") from e
+    except StructuredOutputError:
+        # A repaired reply stays cached together with the original; a failed pair goes
+        forget_response(prompt, action)
+        forget_response(repair, repair_action)
+        raise
+
+
+def _cached(action, prompt, build):
+    key = hashlib.sha256(f"{action}\x1f{prompt}".encode("utf-8")).hexdigest()
+    return _results.get_or_create(key, build)
+
+
+def match_resume(job_description, resume_text, generate, action="Percentage_Match"):
+    """Typed match score for one resume, cached by prompt."""
+    prompt = MATCH_PROMPT.format(job_description=job_description, resume=resume_text)
+
+    def build():
+        data = generate_structured(generate, prompt, MATCH_SCHEMA, action)
+        data["match_percentage"] = max(0.0, min(100.0, float(data["match_percentage"])))
+        return MatchResult(**{name: data[name] for name in MATCH_SCHEMA["properties"]})
+
+    return _cached(action, prompt, build)
+
+
+def resume_insights(resume_text, generate, action="AI_Driven_Insights"):
+    """Typed job-role and market-trend insights for a resume, cached by prompt."""
+    prompt = INSIGHTS_PROMPT.format(resume=resume_text)
+
+    def build():
+        data = generate_structured(generate, prompt, INSIGHTS_SCHEMA, action)
+        return Insights(**{name: data[name] for name in INSIGHTS_SCHEMA["properties"]})
+
+    return _cached(action, prompt, build)
@@ -0,0 +1,173 @@
+"""Non-blocking API usage telemetry.
+
+``record()`` only appends to an in-memory ring buffer, so the request path
+never waits on disk. A daemon thread drains the buffer every few seconds and
+writes the batch to SQLite with one ``executemany``. If the writer falls
+behind, the oldest unflushed records are dropped (and counted) rather than
+slowing callers down.
+"""
+import atexit
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import astuple, dataclass, fields
+
+
+TELEMETRY_PATH = os.getenv("TELEMETRY_PATH", os.path.join(".logs", "telemetry.sqlite"))
+TELEMETRY_BUFFER_SIZE = int(os.getenv("TELEMETRY_BUFFER_SIZE", "10000"))
+TELEMETRY_FLUSH_INTERVAL = float(os.getenv("TELEMETRY_FLUSH_INTERVAL", "5"))
+
+
+@dataclass
+class CallRecord:
+    ts: float
+    action: str
+    model: str = ""
+    latency_ms: float = 0.0
+    # Time to first streamed chunk; equals latency for blocking calls
+    first_token_ms: float = 0.0
+    prompt_tokens: int = 0
+    response_tokens: int = 0
+    # "hit", "miss" or "off" (call not eligible for the response cache)
+    cache: str = "off"
+    error: str = ""
+
+
+_COLUMNS = [f.name for f in fields(CallRecord)]
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS calls (
+    ts REAL NOT NULL, action TEXT NOT NULL, model TEXT, latency_ms REAL, first_token_ms REAL,
+    prompt_tokens INTEGER, response_tokens INTEGER, cache TEXT, error TEXT
+);
+CREATE INDEX IF NOT EXISTS calls_ts ON calls (ts);
+"""
+
+# Nearest-rank percentile: the smallest value whose rank is at least p * count
+_SUMMARY = """
+WITH ranked AS (
+    SELECT *,
+           ROW_NUMBER() OVER (PARTITION BY action ORDER BY latency_ms) AS latency_rank,
+           ROW_NUMBER() OVER (PARTITION BY action ORDER BY first_token_ms) AS first_token_rank,
+           COUNT(*) OVER (PARTITION BY action) AS total
+    FROM calls WHERE ts >= ?
+)
+SELECT action, COUNT(*), SUM(error != ''), AVG(cache = 'hit'),
+       MIN(CASE WHEN latency_rank >= 0.50 * total THEN latency_ms END),
+       MIN(CASE WHEN latency_rank >= 0.95 * total THEN latency_ms END),
+       MIN(CASE WHEN latency_rank >= 0.99 * total THEN latency_ms END),
+       MIN(CASE WHEN first_token_rank >= 0.50 * total THEN first_token_ms END),
+       AVG(prompt_tokens), AVG(response_tokens)
+FROM ranked GROUP BY action ORDER BY action
+"""
+
+
+class Telemetry:
+    def __init__(self, path=TELEMETRY_PATH, buffer_size=TELEMETRY_BUFFER_SIZE, flush_interval=TELEMETRY_FLUSH_INTERVAL):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._buffer = deque(maxlen=buffer_size)
+        self._flush_lock = threading.Lock()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def record(self, action, **values):
+        """Queue one call record; never blocks on I/O."""
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+        self._buffer.append(CallRecord(ts=time.time(), action=action, **values))
+        if self._thread is None:
+            self._start()
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="telemetry-flush", daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except sqlite3.Error:
+                # Telemetry must never take the app down; records stay buffered for the next try
+                pass
+
+    def _connect(self):
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def flush(self):
+        """Write everything buffered so far to SQLite in one batch."""
+        with self._flush_lock:
+            batch = []
+            while self._buffer:
+                try:
+                    batch.append(self._buffer.popleft())
+                except IndexError:
+                    break
+            if not batch:
+                return 0
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.executemany(f"INSERT INTO calls ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})",
+                                     [astuple(record) for record in batch])
+            except sqlite3.Error:
+                self._buffer.extendleft(reversed(batch))
+                raise
+            finally:
+                conn.close()
+            return len(batch)
+
+    def records(self, since=0.0):
+        """Stored plus still-buffered records newer than ``since`` (epoch seconds)."""
+        rows = []
+        if os.path.exists(self.path):
+            conn = self._connect()
+            try:
+                rows = [CallRecord(*row) for row in conn.execute(
+                    f"SELECT {', '.join(_COLUMNS)} FROM calls WHERE ts >= ?", (since,))]
+            finally:
+                conn.close()
+        return rows + [record for record in list(self._buffer) if record.ts >= since]
+
+    def summary(self, since=0.0):
+        """Per-action call counts, error and cache-hit rates, and latency percentiles.
+
+        Buffered records are flushed first; the aggregation then runs in SQLite,
+        so no rows are loaded into Python. Percentiles are nearest-rank.
+        """
+        try:
+            self.flush()
+        except sqlite3.Error:
+            pass
+        if not os.path.exists(self.path):
+            return []
+        conn = self._connect()
+        try:
+            rows = conn.execute(_SUMMARY, (since,)).fetchall()
+        finally:
+            conn.close()
+        return [{
+            "action": action,
+            "calls": calls,
+            "errors": errors,
+            "cache_hit_rate": hit_rate,
+            "p50_ms": round(p50, 1),
+            "p95_ms": round(p95, 1),
+            "p99_ms": round(p99, 1),
+            "p50_first_token_ms": round(first_token, 1),
+            "avg_prompt_tokens": round(prompt_tokens),
+            "avg_response_tokens": round(response_tokens),
+        } for action, calls, errors, hit_rate, p50, p95, p99, first_token, prompt_tokens, response_tokens in rows]
+
+
+telemetry = Telemetry()
@@ -0,0 +1,167 @@
+"""Clean up extracted resume text and fit it into a per-action token budget.
+
+PDF extraction repeats page headers and footers, leaves page numbers and
+long whitespace runs, and all of it is sent to Gemini on every action. The
+resume is compacted once per upload (cached by content hash) and then cut to
+the budget of the action that uses it, section by section, so every section
+keeps its heading and opening lines.
+"""
+import hashlib
+import os
+import re
+from collections import Counter
+
+from ats.cache import LRUCache
+from ats.llm import DEFAULT_MODEL, get_model
+
+DEFAULT_TOKEN_BUDGET = int(os.getenv("PROMPT_TOKEN_BUDGET", "4000"))
+JD_TOKEN_BUDGET = int(os.getenv("JD_TOKEN_BUDGET", "1500"))
+
+# Resume token budget per action; anything not listed uses DEFAULT_TOKEN_BUDGET
+ACTION_TOKEN_BUDGETS = {
+    "Tell_me_about_resume": 6000,
+    "Generate_Updated_Resume": 6000,
+    "Percentage_Match": 3000,
+    "Batch_Percentage_Match": 2000,
+    "AI_Driven_Insights": 2500,
+}
+
+_compacted = LRUCache(maxsize=128)
+_token_counts = LRUCache(maxsize=1024)
+
+_SPACES = re.compile(r"[ \t ]+")
+_PAGE_NUMBER = re.compile(r"^(page\s*)?\d{1,3}(\s*(of|/)\s*\d{1,3})?$", re.IGNORECASE)
+HEADINGS = {
+    "summary", "profile", "objective", "experience", "work experience", "professional experience",
+    "employment", "education", "skills", "technical skills", "projects", "certifications",
+    "achievements", "awards", "publications", "languages", "interests", "contact",
+}
+
+
+def estimate_tokens(text):
+    """Rough count (~4 characters per token) used when the tokenizer can't be reached."""
+    return max(1, len(text) // 4) if text else 0
+
+
+def count_tokens(text, model_name=DEFAULT_MODEL):
+    """Token count from the model's own tokenizer, cached per text."""
+    key = hashlib.sha256(f"{model_name}\x1f{text}".encode("utf-8")).hexdigest()
+
+    def count():
+        try:
+            return get_model(model_name).count_tokens(text).total_tokens
+        except Exception:
+            return estimate_tokens(text)
+
+    return _token_counts.get_or_create(key, count)
+
+
+def _page_lines(page):
+    return [_SPACES.sub(" ", line).strip() for line in page.splitlines()]
+
+
+def normalize_pages(pages):
+    """Drop repeated headers/footers, page numbers, duplicate lines and blank runs."""
+    pages = [_page_lines(page) for page in pages]
+    repeated = set()
+    if len(pages) > 1:
+        seen = Counter(line for lines in pages for line in set(lines) if line and len(line) < 80)
+        repeated = {line for line, count in seen.items() if count >= max(2, len(pages) / 2)}
+
+    out = []
+    for lines in pages:
+        for line in lines:
+            if line in repeated or _PAGE_NUMBER.match(line):
+                continue
+            if line and out and line == out[-1]:
+                continue
+            if not line and (not out or not out[-1]):
+                continue
+            out.append(line)
+        if out and out[-1]:
+            out.append("")
+    return "\n".join(out).strip()
+
+
+def normalize_text(text):
+    return normalize_pages([text])
+
+
+def compact_resume(parsed):
+    """Normalised resume text, computed once per upload."""
+    return _compacted.get_or_create(parsed.digest, lambda: normalize_pages(parsed.pages))
+
+
+def _is_heading(line):
+    bare = line.strip(" :*#").lower()
+    return bare in HEADINGS or (line.isupper() and 2 < len(line) < 40)
+
+
+def split_sections(text):
+    sections, current = [], []
+    for line in text.splitlines():
+        if _is_heading(line) and current:
+            sections.append(current)
+            current = []
+        current.append(line)
+    if current:
+        sections.append(current)
+    return sections
+
+
+def _cut_line(line, room):
+    """``line`` cut to at most ``room`` characters, at the last space or comma that fits."""
+    if len(line) <= room:
+        return line
+    cut = max(line.rfind(" ", 0, room + 1), line.rfind(",", 0, room + 1))
+    return line[:cut if cut > 0 else room].rstrip(" ,;")
+
+
+def trim_sections(text, max_chars):
+    """Shorten ``text`` to about ``max_chars`` by cutting each section proportionally.
+
+    The line that crosses a section's allowance is cut inside, at a word or
+    comma, so a long one-line skills list keeps its first entries.
+    """
+    if len(text) <= max_chars:
+        return text
+    sections = split_sections(text)
+    ratio = max_chars / len(text)
+    kept = []
+    for lines in sections:
+        allowance = max(int(sum(len(line) + 1 for line in lines) * ratio), 120)
+        taken, used = [], 0
+        for line in lines:
+            if used + len(line) > allowance:
+                part = _cut_line(line, allowance - used) if allowance > used else ""
+                taken.append(f"{part} …" if part else "…")
+                break
+            taken.append(line)
+            used += len(line) + 1
+        kept.append("\n".join(taken))
+    return "\n".join(kept)
+
+
+def fit_to_budget(text, budget, model_name=DEFAULT_MODEL):
+    """Return ``text`` unchanged if it fits ``budget`` tokens, otherwise a trimmed version."""
+    # Well under budget by the rough estimate: skip the tokenizer round-trip
+    if estimate_tokens(text) <= budget * 0.75:
+        return text
+    tokens = count_tokens(text, model_name)
+    if tokens <= budget:
+        return text
+    return trim_sections(text, int(len(text) * budget / tokens))
+
+
+def token_budget(action):
+    return ACTION_TOKEN_BUDGETS.get(action, DEFAULT_TOKEN_BUDGET)
+
+
+def resume_for_prompt(parsed, action):
+    """Compacted resume trimmed to ``action``'s budget (cached per upload and budget)."""
+    budget = token_budget(action)
+    return _compacted.get_or_create((parsed.digest, budget), lambda: fit_to_budget(compact_resume(parsed), budget))
+
+
+def jd_for_prompt(job_description):
+    return fit_to_budget(normalize_text(job_description), JD_TOKEN_BUDGET)
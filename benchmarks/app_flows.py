@@ -0,0 +1,195 @@
+"""Offline benchmark of the core app flows, driven headlessly through AppTest.
+
+Runs ``app.py`` against the deterministic stub LLM backend (``ats.llm_stub``),
+so no network or API key is needed. Each iteration times four flows:
+
+* ``parse``: first run with a resume uploaded (resume caches cleared first),
+* ``match``: Percentage Match (local skill gap, then a streamed summary of it),
+* ``learning_path``: Personalized Learning Path job until its PDF is ready,
+* ``batch``: Batch ATS Scoring of generated sample resumes until the ranking is ready.
+
+LLM response caches are cleared between iterations so every call reaches the
+backend. Reports throughput and p50/p95/p99 latency per flow; ``--json``
+writes the same numbers for CI to compare against a previous run.
+
+Usage::
+
+    python benchmarks/app_flows.py --iterations 10 --latency-ms 50
+    python benchmarks/app_flows.py --json results.json
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "app.py")
+RESUME = os.path.join(ROOT, "updated_resume.pdf")
+JOB_DESCRIPTION = ("Data Scientist with Python, SQL, Pandas, scikit-learn and machine learning experience. "
+                   "Deploys models with Docker on AWS and builds dashboards in Power BI.")
+FLOWS = ("parse", "match", "learning_path", "batch")
+
+
+def configure(args, workdir):
+    """Point the app at the stub backend and throwaway caches; must run before any ats import."""
+    os.environ.update({
+        "LLM_BACKEND": "stub",
+        "LLM_STUB_LATENCY_MS": str(args.latency_ms),
+        "LLM_STUB_TOKENS_PER_SEC": str(args.tokens_per_sec),
+        "LLM_STUB_OUTPUT_TOKENS": str(args.output_tokens),
+        "LLM_CACHE_PATH": os.path.join(workdir, "llm_responses.sqlite"),
+        "JOBS_PATH": os.path.join(workdir, "jobs.sqlite"),
+        "TELEMETRY_PATH": os.path.join(workdir, "telemetry.sqlite"),
+        # Stub answers must never land in the real question bank or embedding store
+        "QUESTION_BANK_PATH": os.path.join(workdir, "question_bank.sqlite"),
+        "QUESTION_BANK_REFRESH_HOURS": "0",
+        "EMBEDDING_DIR": os.path.join(workdir, "embeddings"),
+        "JOB_POLL_SECONDS": "0.1",
+        "GEMINI_RPM": str(args.rpm),
+        "GEMINI_BURST": str(max(1, int(args.rpm // 60))),
+    })
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+
+
+SKILLS = ["Python", "SQL", "Pandas", "NumPy", "scikit-learn", "TensorFlow", "PyTorch", "Docker", "AWS",
+          "Kubernetes", "Spark", "Airflow", "Power BI", "Tableau", "FastAPI", "Streamlit"]
+
+
+def sample_resume(i):
+    """A small one-page PDF whose skills differ with ``i``, so every prompt is distinct."""
+    import io
+
+    from reportlab.pdfgen import canvas
+
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer)
+    pdf.drawString(72, 760, f"Candidate {i} - Data Scientist")
+    pdf.drawString(72, 730, "SKILLS")
+    for row, skill in enumerate(SKILLS[i % 5::2][:6]):
+        pdf.drawString(72, 712 - row * 14, f"{skill}, {SKILLS[(i + row) % len(SKILLS)]}")
+    pdf.drawString(72, 600, "EXPERIENCE")
+    pdf.drawString(72, 582, f"Analyst at Company {i}, {2015 + i % 8}-2024")
+    pdf.save()
+    return buffer.getvalue()
+
+
+def clear_caches():
+    from ats import resume, structured, text_prep
+    from ats.response_cache import get_response_cache
+
+    resume.clear_resume_cache()
+    text_prep._compacted.clear()
+    structured._results.clear()
+    get_response_cache().clear()
+
+
+def click(at, label):
+    next(button for button in at.button if label in button.label).click()
+    at.run()
+
+
+def wait_for_download(at, label, timeout):
+    deadline = time.perf_counter() + timeout
+    while not any(label in button.label for button in at.get("download_button")):
+        if time.perf_counter() > deadline:
+            raise TimeoutError(f"'{label}' did not appear within {timeout:g}s")
+        time.sleep(0.05)
+        at.run()
+
+
+def iteration(resume, batch, timeout):
+    from streamlit.testing.v1 import AppTest
+
+    timings = {}
+    clear_caches()
+    started = time.perf_counter()
+    at = AppTest.from_file(APP, default_timeout=timeout)
+    at.run()
+    at.text_area(key="input").input(JOB_DESCRIPTION)
+    at.file_uploader[0].set_value(("resume.pdf", resume, "application/pdf"))
+    at.run()
+    timings["parse"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    click(at, "Percentage Match")
+    timings["match"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    click(at, "Personalized Learning Path")
+    wait_for_download(at, "Learning Path PDF", timeout)
+    timings["learning_path"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    at.file_uploader(key="batch_files").set_value(batch)
+    click(at, "Rank Resumes")
+    wait_for_download(at, "Ranking (CSV)", timeout)
+    timings["batch"] = time.perf_counter() - started
+
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return timings
+
+
+def percentiles(seconds):
+    import numpy as np
+
+    ms = np.array(seconds) * 1000
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    return {"runs": len(ms), "per_sec": round(len(ms) / (ms.sum() / 1000), 2),
+            "p50_ms": round(float(p50), 1), "p95_ms": round(float(p95), 1),
+            "p99_ms": round(float(p99), 1), "max_ms": round(float(ms.max()), 1)}
+
+
+def summarize(samples, total):
+    report = {flow: percentiles(samples[flow]) for flow in FLOWS}
+    report["iterations_per_sec"] = round(len(samples["parse"]) / total, 3)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--batch-size", type=int, default=8, help="resumes per batch scoring run")
+    parser.add_argument("--latency-ms", type=float, default=50, help="stub time to first token")
+    parser.add_argument("--tokens-per-sec", type=float, default=0, help="stub generation rate (0 = instant)")
+    parser.add_argument("--output-tokens", type=int, default=400)
+    parser.add_argument("--rpm", type=float, default=60000,
+                        help="rate limiter quota; the default keeps it out of the way of the app's own cost")
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        configure(args, workdir)
+        with open(RESUME, "rb") as f:
+            resume = f.read()
+        batch = [(f"resume_{i}.pdf", sample_resume(i), "application/pdf") for i in range(args.batch_size)]
+
+        for _ in range(args.warmup):
+            iteration(resume, batch, args.timeout)
+        samples = {flow: [] for flow in FLOWS}
+        started = time.perf_counter()
+        for _ in range(args.iterations):
+            for flow, seconds in iteration(resume, batch, args.timeout).items():
+                samples[flow].append(seconds)
+        report = summarize(samples, time.perf_counter() - started)
+
+    print(f"stub LLM: {args.latency_ms:g} ms to first token, "
+          f"{args.tokens_per_sec:g} tokens/s, {args.output_tokens} output tokens")
+    print(f"{'flow':15s} {'runs':>5s} {'per sec':>8s} {'p50 ms':>9s} {'p95 ms':>9s} {'p99 ms':>9s}")
+    for flow in FLOWS:
+        row = report[flow]
+        print(f"{flow:15s} {row['runs']:5d} {row['per_sec']:8.2f} {row['p50_ms']:9.1f} "
+              f"{row['p95_ms']:9.1f} {row['p99_ms']:9.1f}")
+    print(f"full iterations per second: {report['iterations_per_sec']}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""PDF extraction throughput (pages/sec) per extractor, serial and parallel.
+
+Runs every registered extractor in ``ats.extract`` over a corpus of resumes.
+Without a corpus directory, a synthetic one is generated with ReportLab:
+single- and two-column resumes of 1, 2, 4 and 16 pages, plus a single-column
+one with dates right-aligned on its role lines (which must not be read as a
+second column).
+
+Usage::
+
+    python benchmarks/extract_throughput.py                 # synthetic corpus
+    python benchmarks/extract_throughput.py path/to/resumes --runs 5
+"""
+import argparse
+import glob
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ats import extract  # noqa: E402
+
+LEFT = ["SKILLS", "Python, SQL, Pandas", "NumPy, scikit-learn", "Docker, AWS EC2", "",
+        "EDUCATION", "B.Tech Computer Science", "CGPA 9.1"]
+RIGHT = ["EXPERIENCE", "Data Scientist, Acme 2021-2024", "Built churn models with XGBoost",
+         "Deployed model APIs behind FastAPI", "", "PROJECTS", "Resume ATS in Streamlit",
+         "Demand forecasting with Prophet"]
+
+
+def synthetic_corpus(directory):
+    from reportlab.pdfgen import canvas
+
+    paths = []
+    for columns in (1, 2):
+        for pages in (1, 2, 4, 16):
+            path = os.path.join(directory, f"resume_{columns}col_{pages}p.pdf")
+            pdf = canvas.Canvas(path, pagesize=(612, 792))
+            for _ in range(pages):
+                pdf.setFont("Helvetica-Bold", 16)
+                pdf.drawString(72, 740, "Jane Doe - Data Scientist | jane@example.com | +1 555 0100")
+                pdf.setFont("Helvetica", 10)
+                y = 700
+                for _ in range(3):
+                    for left, right in zip(LEFT, RIGHT):
+                        pdf.drawString(72, y, left)
+                        pdf.drawString(330 if columns == 2 else 72, y if columns == 2 else y - 14, right)
+                        y -= 14 if columns == 2 else 28
+                pdf.showPage()
+            pdf.save()
+            paths.append(path)
+    path = os.path.join(directory, "resume_dates_1p.pdf")
+    dated_resume(path)
+    paths.append(path)
+    return paths
+
+
+ROLES = [("Data Scientist, Acme", "2021 - 2024"), ("Analyst, Globex", "2018 - 2021"), ("Intern, Initech", "2017")]
+BULLETS = ["Built churn models with XGBoost", "Shipped Power BI dashboards"]
+
+
+def dated_resume(path):
+    """Single column: short role lines with the dates right-aligned at the margin, then bullets."""
+    from reportlab.pdfgen import canvas
+
+    pdf = canvas.Canvas(path, pagesize=(612, 792))
+    pdf.setFont("Helvetica-Bold", 16)
+    pdf.drawString(72, 740, "Jane Doe - Data Scientist")
+    pdf.setFont("Helvetica", 10)
+    y = 700
+    for role, dates in ROLES:
+        pdf.drawString(72, y, role)
+        pdf.drawRightString(540, y, dates)
+        y -= 14
+        for bullet in BULLETS:
+            pdf.drawString(84, y, f"- {bullet}")
+            y -= 14
+        y -= 10
+    pdf.save()
+
+
+def run(corpus, name, parallel, runs):
+    rates = []
+    for _ in range(runs):
+        pages = 0
+        started = time.perf_counter()
+        for data in corpus:
+            pages += len(extract.extract_pages(data, extractor=name, parallel=parallel, ocr=False)[0])
+        rates.append(pages / (time.perf_counter() - started))
+    return statistics.median(rates), pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("corpus", nargs="?", help="directory of PDF resumes")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = sorted(glob.glob(os.path.join(args.corpus, "*.pdf"))) if args.corpus else synthetic_corpus(tmp)
+        corpus = [open(path, "rb").read() for path in paths]
+
+    print(f"corpus: {len(corpus)} PDFs ({args.corpus or 'synthetic'}), "
+          f"{extract.PDF_PARSE_WORKERS} workers, parallel from {extract.PDF_PARALLEL_MIN_PAGES} pages")
+    extract.get_parse_pool().submit(int).result()  # start the workers outside the timings
+    for name in sorted(extract.EXTRACTORS):
+        for parallel in (False, True):
+            rate, pages = run(corpus, name, parallel, args.runs)
+            print(f"  {name:8s} {'parallel' if parallel else 'serial':8s} {rate:8.1f} pages/s  ({pages} pages)")
+    print(f"OCR fallback available: {extract.ocr_available()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Load test: N concurrent sessions against the stub LLM backend.
+
+Each simulated session is a thread tagged with its own session id
+(``ats.concurrency.set_session``), doing what a Streamlit script thread does
+for one user:
+
+* ``parse``: parse and compact a distinct resume,
+* ``match``: Percentage Match (local skill gap, then a streamed summary of it),
+* ``teach``: two DSA explanations fanned out in parallel,
+* ``learning_path``: queue a learning-path job, wait for it, render the PDF,
+* ``batch``: rank a small batch of resumes.
+
+Everything shares one process, so all LLM calls go through the same bounded
+fair pool (``LLM_MAX_WORKERS``) as on a real server. ``--noisy-batch N`` adds
+one more session ranking N resumes at the same time, to show that it does not
+hold the others up. (AppTest cannot drive sessions concurrently, so the UI
+layer itself is measured by ``app_flows.py`` instead.)
+
+Usage::
+
+    python benchmarks/load_test.py --sessions 16 --latency-ms 200
+    python benchmarks/load_test.py --sessions 32 --workers 8 --noisy-batch 60 --json load.json
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import app_flows  # noqa: E402
+
+ACTIONS = ("parse", "match", "teach", "learning_path", "batch")
+
+
+def timed(timings, action, fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    timings[action].append(time.perf_counter() - started)
+    return result
+
+
+def user_session(index, args, queue, timings, errors):
+    from ats.batch import run_batch
+    from ats.concurrency import Task, fan_out, set_session
+    from ats.embeddings import skill_gap
+    from ats.gemini import get_gemini_response, stream_gemini_response
+    from ats.pdf_render import render_pdf
+    from ats.resume import parse_resume
+    from ats.service import match_summary_prompt
+    from ats.text_prep import compact_resume
+
+    set_session(f"user-{index}")
+    jd = app_flows.JOB_DESCRIPTION
+    try:
+        def parse():
+            parsed = parse_resume(app_flows.sample_resume(1000 + index))
+            compact_resume(parsed)
+            return parsed
+
+        parsed = timed(timings, "parse", parse)
+
+        def match():
+            # What the Percentage Match button does: the gap is local, only its summary is streamed
+            gap = skill_gap(jd, parsed.text, parsed.digest)
+            status = {}
+            summary = "".join(stream_gemini_response(match_summary_prompt(gap), action="Percentage_Match",
+                                                     deterministic=True, status=status))
+            if status:
+                raise RuntimeError(status["error"])
+            return summary
+
+        timed(timings, "match", match)
+
+        def teach():
+            tasks = [Task(topic, get_gemini_response, (f"Session {index}: explain {topic} for data science",),
+                          {"action": "DSA_Teach_Me"}) for topic in ("Arrays", "Hash Tables")]
+            return [error for _, _, error in fan_out(tasks) if error]
+
+        failed = timed(timings, "teach", teach)
+        if failed:
+            raise failed[0]
+
+        def learning_path():
+            job_id = queue.submit(f"Session {index}: learning path for 3 months.\n{jd}",
+                                  action="Personalized_Learning_Path")
+            deadline = time.perf_counter() + args.timeout
+            while not queue.get(job_id).finished:
+                if time.perf_counter() > deadline:
+                    raise TimeoutError(f"job {job_id} not finished after {args.timeout:g}s")
+                time.sleep(0.02)
+            return render_pdf(queue.get(job_id).result, title="Learning Path")
+
+        timed(timings, "learning_path", learning_path)
+
+        files = [(f"batch_{index}_{i}.pdf", app_flows.sample_resume(index * 100 + i)) for i in range(args.batch_size)]
+        results = timed(timings, "batch", lambda: list(run_batch(files, jd, get_gemini_response)))
+        errors.extend(f"user {index}: {r.name}: {r.error}" for r in results if r.error)
+    except Exception as e:
+        errors.append(f"user {index}: {type(e).__name__}: {e}")
+
+
+def noisy_session(size, timings, errors):
+    from ats.batch import run_batch
+    from ats.concurrency import set_session
+    from ats.gemini import get_gemini_response
+
+    set_session("noisy")
+    files = [(f"noisy_{i}.pdf", app_flows.sample_resume(100000 + i)) for i in range(size)]
+    try:
+        timed(timings, "noisy_batch", lambda: list(run_batch(files, app_flows.JOB_DESCRIPTION, get_gemini_response)))
+    except Exception as e:
+        errors.append(f"noisy: {type(e).__name__}: {e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=8, help="LLM_MAX_WORKERS for the shared pool")
+    parser.add_argument("--batch-size", type=int, default=4)
+    parser.add_argument("--noisy-batch", type=int, default=0, help="extra session ranking this many resumes")
+    parser.add_argument("--latency-ms", type=float, default=200, help="stub time to first token")
+    parser.add_argument("--tokens-per-sec", type=float, default=0)
+    parser.add_argument("--output-tokens", type=int, default=400)
+    parser.add_argument("--rpm", type=float, default=60000)
+    parser.add_argument("--timeout", type=float, default=300)
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        app_flows.configure(args, workdir)
+        os.environ["LLM_MAX_WORKERS"] = str(args.workers)
+        from ats.gemini import get_gemini_response
+        from ats.jobs import JobQueue
+
+        queue = JobQueue(runner=get_gemini_response)
+        timings = {action: [] for action in ACTIONS + ("noisy_batch",)}
+        errors = []
+        threads = [threading.Thread(target=user_session, args=(i, args, queue, timings, errors))
+                   for i in range(args.sessions)]
+        if args.noisy_batch:
+            threads.insert(0, threading.Thread(target=noisy_session, args=(args.noisy_batch, timings, errors)))
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+    report = {action: app_flows.percentiles(values) for action, values in timings.items() if values}
+    completed = len(timings["batch"])
+    report.update({"sessions": args.sessions, "completed": completed, "errors": errors,
+                   "seconds": round(elapsed, 2), "sessions_per_sec": round(completed / elapsed, 3)})
+
+    print(f"{args.sessions} sessions, {args.workers} LLM workers, stub {args.latency_ms:g} ms/call, "
+          f"batch of {args.batch_size} per session" + (f", noisy batch of {args.noisy_batch}" if args.noisy_batch else ""))
+    print(f"{'action':15s} {'p50 ms':>9s} {'p95 ms':>9s} {'p99 ms':>9s} {'max ms':>9s}")
+    for action in ACTIONS + ("noisy_batch",):
+        if action in report:
+            row = report[action]
+            print(f"{action:15s} {row['p50_ms']:9.1f} {row['p95_ms']:9.1f} {row['p99_ms']:9.1f} {row['max_ms']:9.1f}")
+    print(f"completed {completed}/{args.sessions} sessions in {elapsed:.1f} s ({report['sessions_per_sec']} sessions/s)")
+    for error in errors:
+        print(f"  {error}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Startup benchmark for the Streamlit app.
+
+Measures, in fresh interpreters:
+
+* the module-level imports of an app script under ``python -X importtime``
+  (sum of top-level cumulative times, plus the heaviest modules), and
+* the wall time of a cold first run of the whole script through Streamlit's
+  ``AppTest`` (imports, module-level work and rendering every section).
+
+Usage::
+
+    python benchmarks/startup_importtime.py                 # current app.py
+    git show <rev>:app.py > /tmp/app_old.py
+    python benchmarks/startup_importtime.py /tmp/app_old.py
+"""
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def top_level_imports(path):
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    return "\n".join(ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom)))
+
+
+def importtime(code):
+    """(total_ms, {module: cumulative_ms}) for the top-level imports in ``code``."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                          capture_output=True, text=True, check=True)
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nested imports are indented under their parent; keep only the top level
+        if not name.startswith("  "):
+            modules[name.strip()] = int(cumulative) / 1000
+    return sum(modules.values()), modules
+
+
+def cold_run(path):
+    code = ("import time; t = time.perf_counter()\n"
+            "from streamlit.testing.v1 import AppTest\n"
+            f"AppTest.from_file({path!r}, default_timeout=120).run()\n"
+            "print((time.perf_counter() - t) * 1000)")
+    proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return float(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("app", nargs="?", default=os.path.join(ROOT, "app.py"))
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    code = top_level_imports(args.app)
+    totals, heaviest = [], {}
+    for _ in range(args.runs):
+        total, modules = importtime(code)
+        totals.append(total)
+        for name, ms in modules.items():
+            heaviest.setdefault(name, []).append(ms)
+    runs = [cold_run(os.path.abspath(args.app)) for _ in range(args.runs)]
+
+    print(f"app: {args.app}")
+    print(f"top-level imports: median {statistics.median(totals):.0f} ms over {args.runs} runs")
+    for name, values in sorted(heaviest.items(), key=lambda item: -statistics.median(item[1]))[:args.top]:
+        print(f"  {statistics.median(values):8.1f} ms  {name}")
+    print(f"cold first script run (AppTest): median {statistics.median(runs):.0f} ms")
+
+
+if __name__ == "__main__":
+    started = time.perf_counter()
+    main()
+    print(f"(benchmark took {time.perf_counter() - started:.1f} s)")
@@ -0,0 +1,44 @@
+import time
+
+import streamlit as st
+
+from ats.ratelimit import counters
+from ats.telemetry import telemetry
+
+st.set_page_config(page_title="ResumeSmartX - Usage Dashboard", page_icon="📈", layout='wide')
+
+st.markdown("""
+    <h1 style='text-align: center; color: #4CAF50;'>📈 API USAGE DASHBOARD</h1>
+    <hr style='border: 1px solid #4CAF50;'>
+""", unsafe_allow_html=True)
+
+windows = {"Last hour": 3600, "Last 24 hours": 24 * 3600, "Last 7 days": 7 * 24 * 3600, "All time": None}
+window = st.selectbox("🕒 Time window:", list(windows), index=1)
+since = time.time() - windows[window] if windows[window] else 0.0
+
+rows = telemetry.summary(since=since)
+if not rows:
+    st.info("No API calls recorded in this window yet.")
+else:
+    calls = sum(row["calls"] for row in rows)
+    errors = sum(row["errors"] for row in rows)
+    hits = sum(row["cache_hit_rate"] * row["calls"] for row in rows)
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Calls", calls)
+    col2.metric("Errors", errors)
+    col3.metric("Cache hit rate", f"{hits / calls:.0%}")
+    col4.metric("Dropped records", telemetry.dropped)
+
+    st.markdown("### ⏱ Latency per action (ms)")
+    st.dataframe(rows, use_container_width=True)
+    st.bar_chart({row["action"]: row["p95_ms"] for row in rows})
+    st.caption("Bars show p95 latency. Records are buffered in memory and flushed to SQLite in the background.")
+
+st.markdown("### 🚦 Rate limiting & retries (since server start)")
+limiter = counters.snapshot()
+col1, col2, col3, col4, col5 = st.columns(5)
+col1.metric("API requests", limiter.get("requests", 0))
+col2.metric("Throttled", limiter.get("throttled", 0))
+col3.metric("Retries", limiter.get("retries", 0))
+col4.metric("Retries exhausted", limiter.get("retries_exhausted", 0) + limiter.get("queue_timeouts", 0))
+col5.metric("Coalesced", limiter.get("coalesced", 0))
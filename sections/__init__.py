@@ -0,0 +1,5 @@
+"""Feature sections of the Streamlit app.
+
+Each module exposes ``render(ctx)`` and is imported only when its section is
+rendered, so a page pays for the dependencies of the sections it shows.
+"""
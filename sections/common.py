@@ -0,0 +1,132 @@
+"""Shared UI pieces: resume/JD inputs and the background-job panel."""
+import os
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import streamlit as st
+
+from ats.gemini import get_gemini_response, stream_gemini_response
+from ats.jobs import DONE, JobQueue
+from ats.llm import is_valid_response
+from ats.question_bank import GENERATORS, get_question_bank
+from ats.resume import ParsedResume, parse_resume
+from ats.text_prep import compact_resume, jd_for_prompt, resume_for_prompt
+
+JOB_POLL_SECONDS = float(os.getenv("JOB_POLL_SECONDS", "2"))
+
+
+@dataclass
+class ResumeContext:
+    """What the user has entered: job description and uploaded resume."""
+    input_text: str = ""
+    job_description: str = ""
+    parsed_resume: Optional[ParsedResume] = None
+    resume_text: str = ""
+
+    @property
+    def resume_digest(self):
+        return self.parsed_resume.digest if self.parsed_resume else None
+
+    def resume_for(self, action):
+        """Compacted resume trimmed to the token budget of ``action``."""
+        return resume_for_prompt(self.parsed_resume, action) if self.parsed_resume else ""
+
+
+def resume_inputs():
+    """Render the job description and resume upload columns and return their context."""
+    ctx = ResumeContext()
+    col1, col2 = st.columns(2)
+
+    with col1:
+        ctx.input_text = st.text_area("📋 Job Description:", key="input", height=150)
+
+    with col2:
+        uploaded_file = st.file_uploader("📄 Upload your resume (PDF)...", type=['pdf'])
+        if uploaded_file:
+            st.success("✅ PDF Uploaded Successfully.")
+            try:
+                # Parsed once per distinct file; reruns and repeat uploads hit the cache
+                ctx.parsed_resume = parse_resume(uploaded_file.getvalue())
+                # Headers/footers, page numbers and whitespace noise stripped once per upload
+                ctx.resume_text = compact_resume(ctx.parsed_resume)
+                if not ctx.parsed_resume.has_text:
+                    st.warning("⚠ No text found in this PDF. It looks scanned; install Tesseract and pytesseract for OCR.")
+                elif ctx.parsed_resume.ocr_pages:
+                    st.info(f"🔍 Read {len(ctx.parsed_resume.ocr_pages)} scanned page(s) with OCR.")
+            except Exception as e:
+                st.error(f"❌ Failed to read PDF: {str(e)}")
+
+    ctx.job_description = jd_for_prompt(ctx.input_text) if ctx.input_text else ""
+    return ctx
+
+
+def stream_answer(prompt, **kwargs):
+    """Stream an answer onto the page; returns its text, or None if the call failed (even midway)."""
+    status = {}
+    text = st.write_stream(stream_gemini_response(prompt, status=status, **kwargs))
+    return None if status else text
+
+
+def clear_state(prefix):
+    """Drop one section's session state (keys starting with ``prefix``), nothing else."""
+    for key in [key for key in st.session_state if key.startswith(prefix)]:
+        del st.session_state[key]
+
+
+# -------------------- ✅ Question Bank --------------------
+# Answers to prompts that don't depend on the user are pre-generated
+# (python -m ats.question_bank build) and refreshed in the background.
+
+def static_answer(bank, option):
+    """A stored answer for ``option`` if the bank has one, else a live one that seeds it."""
+    entry = get_question_bank().sample(bank, option)
+    if entry is not None:
+        return entry.content
+    response = get_gemini_response(GENERATORS[bank].prompt(option), action=bank)
+    if is_valid_response(response):
+        get_question_bank().add(bank, option, [response])
+    return response
+
+
+# -------------------- ✅ Background Jobs --------------------
+# Long generations run on a worker pool and persist in SQLite, so a rerun or a
+# page reload doesn't throw the answer (and the API spend) away.
+
+@st.cache_resource
+def get_job_queue():
+    return JobQueue(runner=get_gemini_response)
+
+
+def submit_job(section, prompt, action, **kwargs):
+    job_id = get_job_queue().submit(prompt, action, **kwargs)
+    st.session_state.setdefault("jobs", {})[section] = job_id
+    # Mirrored in the URL so the result can be picked up again after a reload
+    st.query_params[f"job_{section}"] = job_id
+    return job_id
+
+
+def current_job(section):
+    job_id = st.session_state.get("jobs", {}).get(section) or st.query_params.get(f"job_{section}")
+    return get_job_queue().get(job_id) if job_id else None
+
+
+@st.fragment(run_every=JOB_POLL_SECONDS)
+def _job_progress(job_id, label):
+    # Only this fragment reruns while polling; the full page reruns once the job is finished
+    job = get_job_queue().get(job_id)
+    if job is None or job.finished:
+        st.rerun()
+    st.info(f"⏳ {label}: {job.status} for {time.time() - job.created_at:.0f}s. You can keep using the app meanwhile.")
+
+
+def show_job(section, label, render):
+    job = current_job(section)
+    if job is None:
+        return
+    if not job.finished:
+        _job_progress(job.id, label)
+    elif job.status == DONE:
+        render(job.result)
+    else:
+        st.error(f"❌ {label} failed: {job.error}")
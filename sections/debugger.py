@@ -0,0 +1,59 @@
+"""Python Code Debugger."""
+import streamlit as st
+
+from ats.code_check import check_code
+from ats.gemini import get_gemini_response
+from ats.llm import is_valid_response
+
+
+@st.fragment
+def render(ctx):
+    st.markdown("---")
+    st.markdown("<h3 style='text-align: center;'>🛠️ Python Code Debugger</h3>", unsafe_allow_html=True)
+
+    user_code = st.text_area("Paste your Python code below:", height=300)
+
+    if st.button("Check & Fix Code"):
+        if user_code.strip() == "":
+            st.warning("Please enter some code.")
+        else:
+            # Local checks first: syntax, undefined names, unused imports (cached per code)
+            report = check_code(user_code)
+            if report.errors:
+                st.error("❌ Local checks found:\n\n" + "\n".join(f"- {d}" for d in report.errors))
+            if report.warnings:
+                st.warning("⚠ Worth a look:\n\n" + "\n".join(f"- {d}" for d in report.warnings))
+            if not report.diagnostics:
+                st.success("✅ Local checks passed" + (" and the code ran without errors." if report.ran else "."))
+
+            if report.diagnostics:
+                # Gemini gets the exact problems instead of having to find them
+                task = f"""
+                Local checks already found these problems:
+                {report.to_text()}
+
+                Fix them, plus any logic errors you notice. Return the fixed code and briefly explain the changes made.
+                """
+            else:
+                task = """
+                The code compiles and has no undefined names or unused imports. Look only for logic errors and
+                edge cases. If it has issues, correct them. Return the fixed code and briefly explain the changes made.
+                """
+
+            with st.spinner("Analyzing and fixing code..."):
+                prompt = f"""
+                {task.strip()}
+
+                Code:
+                ```python
+                {user_code}
+                ```
+                """
+
+                # Same code and diagnostics give the cached answer
+                response = get_gemini_response(prompt, action="Code_Debugger", deterministic=True)
+                if is_valid_response(response):
+                    st.subheader("✅ Corrected Code")
+                    st.code(response, language="python")
+                else:
+                    st.error(response)
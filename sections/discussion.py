@@ -0,0 +1,92 @@
+"""AI-guided group discussion."""
+import streamlit as st
+
+from ats.discussion import FAILED, GRADED, Discussion, question_pool
+from ats.gemini import get_gemini_response
+from ats.question_bank import DISCUSSION_TOPICS
+from sections.common import JOB_POLL_SECONDS, clear_state
+
+
+def _submit_answer():
+    state = st.session_state.discussion_state
+    user_response = st.session_state.get(f"discussion_answer_{state.asked}", "")
+    if not user_response.strip():
+        st.session_state.discussion_empty_answer = True
+        return
+    # Feedback is graded in the background, a few answers per call
+    state.answer(user_response, get_gemini_response)
+
+
+def _show_turn(i, turn):
+    st.markdown(f"**🔹 Q{i}:** {turn.question}")
+    st.markdown(f"💡 **Your Answer:** {turn.answer}")
+    if turn.status == GRADED:
+        st.markdown(f"✅ **AI Feedback ({turn.score}/10):** {turn.feedback}")
+    elif turn.status == FAILED:
+        st.markdown(f"⚠️ {turn.feedback}")
+    else:
+        st.markdown("⏳ *Feedback is being prepared...*")
+
+
+@st.fragment(run_every=JOB_POLL_SECONDS)
+def _grading_progress():
+    # Only this fragment reruns while grading; the section shows the feedback once it's in
+    state = st.session_state.get("discussion_state")
+    if state is None or not state.pending:
+        st.rerun()
+    st.info(f"⏳ Grading {state.pending} answer(s)...")
+
+
+def ai_guided_discussion():
+    st.markdown("---")
+    st.markdown("<h3 style='text-align: center;'>🤖 AI-Guided Group Discussion</h3>", unsafe_allow_html=True)
+
+    selected_topic = st.selectbox("📌 Select Discussion Topic:", DISCUSSION_TOPICS)
+
+    # The whole discussion is one compact object in this session's state
+    state = st.session_state.get("discussion_state")
+    if state is None or state.topic != selected_topic:
+        with st.spinner("⏳ Preparing questions..."):
+            state = Discussion(selected_topic, question_pool(selected_topic, get_gemini_response))
+        st.session_state.discussion_state = state
+
+    if not state.finished:
+        st.caption(f"Question {state.per_round - state.remaining + 1} of {state.per_round}")
+        st.markdown(f"**🤖 AI:** {state.current}")
+
+        st.text_area("✍️ Your Answer:", key=f"discussion_answer_{state.asked}")
+
+        # Handled in a callback so the next question shows without another rerun
+        st.button("Submit Answer", on_click=_submit_answer)
+        if st.session_state.pop("discussion_empty_answer", False):
+            st.warning("⚠️ Please enter a response before submitting.")
+
+        if state.turns:
+            with st.expander(f"Previous answers ({len(state.turns)})"):
+                for i, turn in enumerate(state.turns, 1):
+                    _show_turn(i, turn)
+
+    else:
+        st.success("🎉 Discussion completed! Here’s a summary:")
+        if state.graded:
+            st.metric("Average score", f"{state.average:.1f}/10")
+        for i, turn in enumerate(state.turns, 1):
+            _show_turn(i, turn)
+            st.markdown("---")
+        if state.pending:
+            _grading_progress()
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.button("➕ More Questions", on_click=state.more)
+        with col2:
+            if any(turn.status == FAILED for turn in state.turns):
+                st.button("🔁 Retry Grading", on_click=state.grade, args=(get_gemini_response,))
+        with col3:
+            # Only this section's state; the resume, MNC answers and jobs stay
+            st.button("Restart Discussion", on_click=clear_state, args=("discussion_",))
+
+
+@st.fragment
+def render(ctx):
+    ai_guided_discussion()
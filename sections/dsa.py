@@ -0,0 +1,57 @@
+"""DSA for Data Science and the interview question banks."""
+import streamlit as st
+
+from ats.concurrency import Task, fan_out
+from ats.question_bank import DSA_LEVELS, DSA_TOPICS, GENERATORS, QUESTION_CATEGORIES, get_question_bank
+from sections.common import show_job, static_answer, submit_job
+
+
+@st.fragment
+def render(ctx):
+    st.markdown("---")
+    st.markdown("<h3 style='text-align: center;'>🛠 DSA for Data Science</h3>", unsafe_allow_html=True)
+
+    # Main DSA Questions button
+    level = st.selectbox("📚 Select Difficulty Level:", DSA_LEVELS)
+
+    if st.button(f"📝 Generate {level} DSA Questions (Data Science)"):
+        with st.spinner("⏳ Loading... Please wait"):
+            st.write(static_answer("DSA_Questions", level))
+
+    topic = st.selectbox("🗂 Select DSA Topic:", DSA_TOPICS)
+
+    if st.button(f"📖 Teach me {topic} with Case Studies"):
+        with st.spinner("⏳ Gathering resources... Please wait"):
+            # Explanation and case study are independent: fetch both at once, show each as it lands
+            slots = {"explanation": st.empty(), "case_study": st.empty()}
+            tasks = [Task("explanation", static_answer, ("Teach_me_DSA_Topics", topic)),
+                     Task("case_study", static_answer, ("Case_Study_DSA_Topics", topic))]
+            for name, response, error in fan_out(tasks):
+                if error:
+                    slots[name].error(f"❌ {error}")
+                else:
+                    slots[name].write(response)
+
+    st.markdown("---")
+
+    question_category = st.selectbox("❓ Select Question Category:", QUESTION_CATEGORIES)
+
+    category_section = f"questions_{question_category.replace(' ', '_').lower()}"
+    if st.button(f"📝 Generate 30 {question_category} Interview Questions"):
+        # Served straight from the question bank when built; otherwise a background job
+        entry = get_question_bank().sample("Interview_Questions", question_category)
+        if entry is not None:
+            st.session_state.get("jobs", {}).pop(category_section, None)
+            st.query_params.pop(f"job_{category_section}", None)
+            st.write(entry.content)
+        else:
+            submit_job(category_section, GENERATORS["Interview_Questions"].prompt(question_category),
+                       action="Interview_Questions")
+    show_job(category_section, f"30 {question_category} interview questions",
+             lambda text: _seed_and_write("Interview_Questions", question_category, text))
+
+
+def _seed_and_write(bank, option, text):
+    if get_question_bank().sample(bank, option) is None:
+        get_question_bank().add(bank, option, [text])
+    st.write(text)
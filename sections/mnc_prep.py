@@ -0,0 +1,108 @@
+"""MNC Data Science preparation panel."""
+import streamlit as st
+
+from ats.concurrency import Task, fan_out
+from ats.gemini import get_gemini_response
+from ats.llm import is_valid_response
+from ats.memo import forget, get_memo, memoize, set_memo
+from ats.question_bank import GENERATORS
+from sections.common import static_answer
+
+# MNCs List (pre-generated in the question bank under the same names, see MNC_NAMES)
+mnc_data = [
+    {"name": "TCS", "color": "#FFA500", "icon": "🎯"},
+    {"name": "Infosys", "color": "#03A9F4", "icon": "🚀"},
+    {"name": "Wipro", "color": "#9C27B0", "icon": "🔍"},
+]
+
+
+@st.fragment
+def render(ctx):
+    # Page Header
+    st.markdown("---")
+    st.markdown("<h2 style='text-align: center; color:#FFA500;'>🚀 MNC Data Science Preparation</h2>", unsafe_allow_html=True)
+    st.markdown("---")
+
+    # Initialize session state
+    if "selected_mnc" not in st.session_state:
+        st.session_state["selected_mnc"] = None
+
+    # Layout for MNC Selection in One Row
+    col1, col2, col3 = st.columns(3)
+    for col, mnc in zip([col1, col2, col3], mnc_data):
+        with col:
+            if st.button(f"{mnc['icon']} {mnc['name']}", key=f"{mnc['name']}_button"):
+                st.session_state["selected_mnc"] = mnc["name"]
+
+    # Display Full-Page Response for Selected MNC
+    if st.session_state["selected_mnc"]:
+        selected_mnc = st.session_state["selected_mnc"]
+        # Generated MNC content is memoized per (MNC, resume) so unrelated clicks don't re-call Gemini
+        mnc_key = (selected_mnc, ctx.resume_digest)
+
+        st.markdown(f"<h3 style='color: #FFA500; text-align: center;'>{selected_mnc} Data Science Preparation</h3>", unsafe_allow_html=True)
+        st.markdown("---")
+
+        regenerate_mnc = st.button("🔄 Regenerate", key="regenerate_mnc")
+
+        with st.spinner("⏳ Analyzing your resume... Please wait"):
+            if ctx.resume_text:
+                response = memoize(st.session_state, "Additional_Skills_MNCS", mnc_key,
+                                   lambda: get_gemini_response(f"Based on the candidate's qualifications and resume, what additional skills and knowledge are needed to secure a Data Science role at {selected_mnc}?",
+                                                               action="Additional_Skills_MNCS"),
+                                   regenerate=regenerate_mnc, keep=is_valid_response)
+                st.info(response)
+            else:
+                st.warning("⚠ Please upload a resume first.")
+
+        # Once the MNC's required skills are known, the resume is checked against them locally
+        # and Career Recommendations gets only the gap list
+        gap = None
+        required = get_memo(st.session_state, "Required_Skills", mnc_key)
+        if required and ctx.resume_text:
+            from ats.embeddings import skill_gap
+
+            gap = skill_gap(required, ctx.resume_text, ctx.resume_digest)
+        career_context = f"\n\n{gap.gap_prompt()}" if gap else ""
+
+        # Additional Sections (independent prompts, so "Load All" runs them concurrently)
+        mnc_sections = [
+            ("📂 Project Types & Required Skills", "Project_Types_Skills",
+             GENERATORS["Project_Types_Skills"].prompt(selected_mnc)),
+            ("🛠 Required Skills", "Required_Skills", GENERATORS["Required_Skills"].prompt(selected_mnc)),
+            ("💡 Career Recommendations", "Career_Recommendations",
+             f"Based on the candidate's resume, what specific areas should they focus on to strengthen their chances of getting a Data Science role at {selected_mnc}?{career_context}"),
+        ]
+        if regenerate_mnc:
+            forget(st.session_state, *[action for _, action, _ in mnc_sections])
+        requested = [section for section in mnc_sections if st.button(section[0])]
+        if st.button("⚡ Load All Sections"):
+            requested = mnc_sections
+
+        if requested and not ctx.resume_text:
+            st.warning("⚠ Please upload a resume first.")
+        elif ctx.resume_text:
+            # Already-generated sections are shown from the memo; only missing ones hit the API
+            slots = {}
+            for section in mnc_sections:
+                label, action, _ = section
+                cached = get_memo(st.session_state, action, mnc_key)
+                if cached is not None:
+                    st.success(cached)
+                    if action == "Required_Skills" and gap:
+                        st.metric("Your match with these skills", f"{gap.match_percentage:.0f}%")
+                        st.write(f"❌ **Missing:** {', '.join(gap.missing) or '-'}")
+                elif section in requested:
+                    slots[action] = st.empty()
+                    slots[action].info(f"⏳ {label}: loading...")
+            # The MNC overviews don't depend on the resume and come from the question bank
+            tasks = [Task(action, static_answer, (action, selected_mnc)) if action in GENERATORS
+                     else Task(action, get_gemini_response, (prompt,), {"action": action})
+                     for _, action, prompt in requested if action in slots]
+            for action, response, error in fan_out(tasks):
+                if error:
+                    slots[action].error(f"❌ {error}")
+                else:
+                    slots[action].success(response)
+                    if is_valid_response(response):
+                        set_memo(st.session_state, action, mnc_key, response)
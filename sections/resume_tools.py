@@ -0,0 +1,183 @@
+"""Resume tools: Quick Actions on the uploaded resume and batch ATS scoring."""
+import streamlit as st
+
+from ats.gemini import get_gemini_response
+from ats.llm import is_valid_response
+from ats.memo import get_memo, set_memo
+from ats.service import (LEARNING_PATH_DURATIONS, interview_questions_prompt, learning_path_prompt,
+                         match_summary_prompt, updated_resume_prompt)
+from ats.structured import StructuredOutputError, resume_insights
+from sections.common import show_job, stream_answer, submit_job
+
+
+def render(ctx):
+    quick_actions(ctx)
+    batch_scoring(ctx)
+
+
+@st.fragment
+def quick_actions(ctx):
+    # Always visible buttons styled
+    st.markdown("---")
+    st.markdown("<h3 style='text-align: center;'>🛠 Quick Actions</h3>", unsafe_allow_html=True)
+
+    if st.button("📖 Tell Me About the Resume"):
+        with st.spinner("⏳ Loading... Please wait"):
+            if ctx.resume_text:
+                response = stream_answer(f"Please review the following resume and provide a detailed evaluation: {ctx.resume_for('Tell_me_about_resume')}",action="Tell_me_about_resume")
+                if is_valid_response(response):
+                    st.download_button("💾 Download Resume Evaluation", response, "resume_evaluation.txt")
+            else:
+                st.warning("⚠ Please upload a valid resume first.")
+
+    if st.button("📊 Percentage Match"):
+        with st.spinner("⏳ Loading... Please wait"):
+            if ctx.resume_text and ctx.input_text:
+                # Score and skill lists are computed locally; Gemini only sees the gap list
+                from ats.embeddings import skill_gap
+
+                gap = skill_gap(ctx.job_description, ctx.resume_text, ctx.resume_digest)
+                st.metric("Match", f"{gap.match_percentage:.0f}%")
+                st.write(f"✅ **Matched skills:** {', '.join(gap.matched) or '-'}")
+                st.write(f"❌ **Missing skills:** {', '.join(gap.missing) or '-'}")
+                if gap.sections_total:
+                    st.caption(f"♻ {gap.sections_total - gap.sections_analyzed} of {gap.sections_total} "
+                               "resume/JD sections unchanged and reused")
+                summary = stream_answer(match_summary_prompt(gap),
+                                        action="Percentage_Match", deterministic=True)
+                report = gap.to_text() + (f"\n{summary}\n" if is_valid_response(summary) else "")
+                st.download_button("💾 Download Percentage Match", report, "percentage_match.txt")
+            else:
+                st.warning("⚠ Please upload a resume and provide a job description.")
+
+    if st.button("⚡ Instant Keyword Match"):
+        if ctx.resume_text and ctx.input_text:
+            # Local BM25 keyword check: no API call, answers in milliseconds
+            from ats.ranking import keyword_match
+
+            percentage, matched, missing = keyword_match(ctx.input_text, ctx.resume_text)
+            st.metric("Keyword Match", f"{percentage:.0f}%")
+            st.write(f"✅ **Matched:** {', '.join(matched) or '-'}")
+            st.write(f"❌ **Missing:** {', '.join(missing) or '-'}")
+        else:
+            st.warning("⚠ Please upload a resume and provide a job description.")
+
+    learning_path_duration = st.selectbox("📆 Select Personalized Learning Path Duration:", LEARNING_PATH_DURATIONS)
+    learning_path_section = f"learning_path_{learning_path_duration.replace(' ', '_').lower()}"
+    if st.button("🎓 Personalized Learning Path"):
+        if ctx.resume_text and ctx.input_text and learning_path_duration:
+            submit_job(learning_path_section,
+                       learning_path_prompt(ctx.job_description, ctx.resume_for('Personalized_Learning_Path'), learning_path_duration),
+                       action="Personalized_Learning_Path")
+        else:
+            st.warning("⚠ Please upload a resume and provide a job description.")
+
+
+    def render_learning_path(response):
+        from ats.pdf_render import render_pdf
+
+        st.write(response)
+        pdf_data = render_pdf(response, title=f"Personalized Learning Path ({learning_path_duration})")
+        st.download_button(f"💾 Download Learning Path PDF", pdf_data, f"{learning_path_section}.pdf", "application/pdf")
+
+
+    show_job(learning_path_section, f"Learning path ({learning_path_duration})", render_learning_path)
+
+    if st.button("📝 Generate Updated Resume"):
+        with st.spinner("⏳ Loading... Please wait"):
+            if ctx.resume_text:
+                response = stream_answer(updated_resume_prompt(ctx.resume_for('Generate_Updated_Resume')),
+                                         action="Generate_Updated_Resume")
+
+                if is_valid_response(response):
+                    from ats.pdf_render import render_pdf
+
+                    # Rendered in memory: no shared file on disk for concurrent users to overwrite
+                    pdf_data = render_pdf(response)
+
+                    # Download button for PDF
+                    st.download_button(label="📥 Download Updated Resume", data=pdf_data, file_name="Updated_Resume.pdf", mime="application/pdf")
+            else:
+                st.warning("⚠ Please upload a resume first.")
+
+
+    if st.button("❓ Generate 30 Interview Questions and Answers"):
+        if ctx.resume_text:
+            submit_job("interview_questions", interview_questions_prompt(ctx.job_description),
+                       action="Generate_Interview_Questions")
+        else:
+            st.warning("⚠ Please upload a resume first.")
+    show_job("interview_questions", "30 interview questions", st.write)
+
+
+    if st.button("🚀 Skill Development Plan"):
+        with st.spinner("⏳ Loading... Please wait"):
+            if ctx.resume_text and ctx.input_text:
+                from ats.embeddings import skill_gap
+
+                gap = skill_gap(ctx.job_description, ctx.resume_text, ctx.resume_digest)
+                # Edits that don't change the skill gap don't need a new plan
+                plan = get_memo(st.session_state, "Skill_Development_Plan", gap.gap_prompt())
+                if plan is not None:
+                    st.write(plan)
+                else:
+                    response = stream_answer(f"Suggest courses, books, and projects to improve the candidate's missing skills for this job.\n\n{gap.gap_prompt()}",
+                                             action="Skill_Development_Plan")
+                    if is_valid_response(response):
+                        set_memo(st.session_state, "Skill_Development_Plan", gap.gap_prompt(), response)
+            else:
+                st.warning("⚠ Please upload a resume first.")
+
+    if st.button("🎥 Mock Interview Questions"):
+        with st.spinner("⏳ Loading... Please wait"):
+            if ctx.resume_text and ctx.input_text:
+                response = stream_answer(f"Generate follow-up interview questions based on the resume and job description, simulating a live interview.\n\nJob Description:\n{ctx.job_description}\n\nResume:\n{ctx.resume_for('Mock_Interview_Questions')}",
+                                         action="Mock_Interview_Questions")
+            else:
+                st.warning("⚠ Please upload a resume first.")
+
+    if st.button("💡 AI-Driven Insights"):
+        with st.spinner("🔍 Analyzing... Please wait"):
+            if ctx.resume_text:
+                try:
+                    insights = resume_insights(ctx.resume_for("AI_Driven_Insights"), get_gemini_response)
+                    st.write("📋 Smart Recommendations:")
+                    st.write(insights.summary)
+                    st.write("\n".join(f"- {role}" for role in insights.job_roles) or "No recommendations found.")
+                    st.write("📊 Market Trends:")
+                    st.write("\n".join(f"- {trend}" for trend in insights.market_trends) or "No market trends available.")
+                except StructuredOutputError as e:
+                    st.error(f"❌ {e}")
+            else:
+                st.warning("⚠ Please upload a resume first.")
+
+
+@st.fragment
+def batch_scoring(ctx):
+    st.markdown("---")
+    st.markdown("<h3 style='text-align: center;'>📦 Batch ATS Scoring</h3>", unsafe_allow_html=True)
+
+    batch_files = st.file_uploader("📂 Upload resumes to rank against the job description (PDFs or a ZIP)...",
+                                   type=['pdf', 'zip'], accept_multiple_files=True, key="batch_files")
+    batch_top_k = st.number_input("🔎 Send only the top K keyword matches to Gemini (0 = score all):",
+                                  min_value=0, max_value=500, value=0, step=5)
+    if st.button("🏁 Rank Resumes"):
+        if not batch_files or not ctx.input_text:
+            st.warning("⚠ Please upload resumes and provide a job description.")
+        else:
+            from ats.batch import BATCH_MAX_FILES, count_pdfs, rank_results, results_to_csv, run_batch
+
+            progress = st.progress(0.0, text="⏳ Parsing and scoring resumes...")
+            table = st.empty()
+            results = []
+            files = [(f.name, f.getvalue()) for f in batch_files]
+            expected = min(count_pdfs(files), BATCH_MAX_FILES)
+            for result in run_batch(files, ctx.input_text, get_gemini_response, top_k=batch_top_k or None):
+                results.append(result)
+                progress.progress(min(len(results) / max(expected, 1), 1.0),
+                                  text=f"⏳ {len(results)}/{expected} resumes processed")
+                table.dataframe([{"Resume": r.name, "Score (%)": r.score, "Keyword Match (%)": r.keyword_score,
+                                  "Pages": r.pages, "Error": r.error}
+                                 for r in rank_results(results)], use_container_width=True)
+            progress.progress(1.0, text=f"✅ {len(results)} resumes processed")
+            st.download_button("💾 Download Ranking (CSV)", results_to_csv(results), "resume_ranking.csv", "text/csv")
@@ -0,0 +1,28 @@
+"""Batch parsing: a worker crash fails only the PDF that caused it."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ats import batch  # noqa: E402
+from ats.resume import ParsedResume, resume_digest  # noqa: E402
+
+
+def crashing_worker(data):
+    # Runs in a spawned pool worker; takes the whole process down like a native crash would
+    if data.startswith(b"crash"):
+        os._exit(1)
+    text = data.decode()
+    return ParsedResume(resume_digest(data), text, (text,))
+
+
+def test_worker_crash_fails_only_the_crashing_pdf(monkeypatch):
+    monkeypatch.setattr(batch, "_parse_worker", crashing_worker)
+    files = [(f"resume{i}.pdf", f"resume {i} {os.getpid()}".encode()) for i in range(6)]
+    files.insert(2, ("broken.pdf", b"crash"))
+    results = {name: (parsed, error) for name, parsed, error in batch.parse_many(files, window=4)}
+    assert len(results) == 7
+    assert results["broken.pdf"][0] is None and results["broken.pdf"][1].startswith("Failed to read PDF")
+    for i in range(6):
+        parsed, error = results[f"resume{i}.pdf"]
+        assert error == "" and parsed.text.startswith(f"resume {i}")
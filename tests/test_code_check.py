@@ -0,0 +1,62 @@
+"""Static diagnostics, and what a sandboxed run reports back."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest  # noqa: E402
+
+from ats import code_check  # noqa: E402
+
+
+def diagnostics(code):
+    return [(d.line, d.kind) for d in code_check.check_code(code, run=False).diagnostics]
+
+
+def test_syntax_error_is_reported_with_its_line():
+    assert diagnostics("x = 1\nif x\n    pass\n") == [(2, "syntax")]
+    assert diagnostics("return 1\n") == [(1, "syntax")]
+
+
+def test_undefined_names_and_unused_imports():
+    code = "import os\nimport json as j\nfrom math import pi\n\ndef f(n):\n    return n * pi + missing\n"
+    assert diagnostics(code) == [(1, "unused-import"), (2, "unused-import"), (6, "undefined-name")]
+
+
+def test_working_code_is_clean():
+    code = "import sys\n\nclass A:\n    def run(self, *args):\n        for i in args:\n            print(i, file=sys.stdout)\n\nA().run(1)\n"
+    report = code_check.check_code(code, run=False)
+    assert report.ok and not report.diagnostics and not report.ran
+
+
+def test_sandbox_is_bwrap_with_no_network_or_environment():
+    command = code_check.sandbox_command("/tmp/work", 3, 256, bwrap="bwrap")
+    assert command[0] == "bwrap"
+    assert {"--unshare-all", "--clearenv", "--die-with-parent"} <= set(command)
+    workdir = command.index("/tmp/work")
+    assert command[workdir - 1:workdir + 2] == ["--ro-bind", "/tmp/work", "/sandbox"]
+
+
+@pytest.fixture
+def launcher_only(monkeypatch):
+    # The launcher and the diagnostics it reports, without bwrap around it
+    pytest.importorskip("resource")
+
+    def command(workdir, timeout, memory_mb):
+        return [sys.executable, "-I", os.path.join(workdir, "launcher.py"), os.path.join(workdir, "code.py"),
+                str(int(timeout) + 1), str(memory_mb * 1024 * 1024)]
+
+    monkeypatch.setattr(code_check, "sandbox_command", command)
+
+
+def test_runtime_error_reports_type_and_line_but_not_its_message(launcher_only):
+    found, output = code_check.run_code("print('hi')\nsecret = 'token-123'\nraise KeyError(secret)\n")
+    assert output == "hi\n"
+    assert [(d.line, d.kind, d.message) for d in found] == [(3, "runtime", "KeyError raised when run")]
+
+
+def test_input_missing_module_and_timeout(launcher_only):
+    assert [d.kind for d in code_check.run_code("name = input()\n")[0]] == ["needs-input"]
+    assert [(d.line, d.kind) for d in code_check.run_code("\nimport not_a_real_module\n")[0]] == [(2, "missing-module")]
+    assert [d.kind for d in code_check.run_code("while True:\n    pass\n", timeout=0.5)[0]] == ["timeout"]
+    assert code_check.run_code("import sys\nsys.exit(0)\n") == ([], "")
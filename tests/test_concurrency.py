@@ -0,0 +1,100 @@
+"""fan_out: results as they finish, timeouts counted from the start of a run, slots always given back.
+
+FairExecutor: sessions take turns.
+"""
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ats.concurrency import FairExecutor, Task, fan_out, limiter, set_session  # noqa: E402
+
+
+def nap(seconds, value=None):
+    time.sleep(seconds)
+    return value
+
+
+def fail():
+    raise ValueError("bad prompt")
+
+
+def slots_free(key):
+    semaphore = limiter.semaphore(key)
+    taken = 0
+    while semaphore.acquire(blocking=False):
+        taken += 1
+    for _ in range(taken):
+        semaphore.release()
+    return taken == limiter.limit
+
+
+def test_results_and_errors_come_back_per_task():
+    tasks = [Task("slow", nap, (0.2, "slow"), key="results"), Task("fast", nap, (0.01, "fast"), key="results"),
+             Task("broken", fail, key="results")]
+    results = list(fan_out(tasks, executor=FairExecutor(max_workers=3)))
+    assert [name for name, _, _ in results][-1] == "slow"
+    outcome = {name: (result, error) for name, result, error in results}
+    assert outcome["fast"] == ("fast", None) and outcome["slow"] == ("slow", None)
+    assert isinstance(outcome["broken"][1], ValueError)
+
+
+def test_time_waiting_for_a_worker_does_not_count_towards_the_timeout():
+    # One worker runs five 0.2 s tasks back to back: a second in all, each well within its own 0.5 s
+    tasks = [Task(i, nap, (0.2, i), key="queued", timeout=0.5) for i in range(5)]
+    results = list(fan_out(tasks, executor=FairExecutor(max_workers=1), poll=0.02))
+    assert sorted(name for name, _, _ in results) == list(range(5))
+    assert all(error is None for _, _, error in results)
+
+
+def test_a_task_that_runs_too_long_times_out():
+    started = time.monotonic()
+    tasks = [Task("hung", nap, (1.0,), key="hung", timeout=0.2), Task("ok", nap, (0.01, "ok"), key="hung")]
+    results = {name: (result, error) for name, result, error in fan_out(tasks, executor=FairExecutor(max_workers=2))}
+    assert isinstance(results["hung"][1], TimeoutError)
+    assert results["ok"] == ("ok", None)
+    assert time.monotonic() - started < 0.8
+
+
+def test_slots_are_given_back_when_the_consumer_stops_early():
+    tasks = [Task(i, nap, (0.05, i), key="early") for i in range(10)]
+    results = fan_out(tasks, executor=FairExecutor(max_workers=1))
+    next(results)
+    results.close()
+    # Tasks still queued were cancelled; the one running frees its slot when it finishes
+    time.sleep(0.2)
+    assert slots_free("early")
+
+
+def test_slots_are_given_back_after_failures():
+    list(fan_out([Task(i, fail, key="failures") for i in range(6)], executor=FairExecutor(max_workers=2)))
+    assert slots_free("failures")
+
+
+def test_sessions_take_turns():
+    executor = FairExecutor(max_workers=1)
+    gate = threading.Event()
+    order = []
+    executor.submit_as("gate", gate.wait)
+    futures = [executor.submit_as(session, order.append, f"{session}{i}") for session in "ab" for i in range(3)]
+    gate.set()
+    for future in futures:
+        future.result(timeout=5)
+    assert order == ["a0", "b0", "a1", "b1", "a2", "b2"]
+
+
+def test_submit_tags_work_with_the_current_session():
+    executor = FairExecutor(max_workers=1)
+    gate = threading.Event()
+    executor.submit_as("gate", gate.wait)
+    while executor.stats()["running"] < 1:
+        time.sleep(0.01)
+    set_session("tagged")
+    try:
+        executor.submit(nap, 0)
+        assert executor.stats()["queued"] == {"tagged": 1}
+    finally:
+        set_session(None)
+        gate.set()
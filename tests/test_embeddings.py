@@ -0,0 +1,31 @@
+"""JD skill phrases: headings are structure, not skills."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ats.embeddings import is_heading, jd_skills  # noqa: E402
+
+JD = """Data Scientist
+
+NICE TO HAVE
+- Spark
+- Dashboards in Power BI
+
+## What you'll do
+Build models in Python with Docker on AWS.
+Skills: Airflow, Kubernetes
+"""
+
+
+def test_heading_lines_are_not_extracted_as_skills():
+    skills = jd_skills(JD)
+    assert {"spark", "power bi", "python", "docker", "aws", "airflow", "kubernetes"} <= set(skills)
+    assert not {"nice", "what", "you'll"} & set(skills)
+
+
+def test_lists_and_single_capitalised_skills_are_content():
+    assert is_heading("NICE TO HAVE") and is_heading("Education") and is_heading("Responsibilities:")
+    assert not is_heading("SQL")
+    assert not is_heading("AWS, GCP, AZURE")
+    assert not is_heading("Skills: Airflow")
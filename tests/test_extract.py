@@ -0,0 +1,30 @@
+"""Layout extraction: real columns are read one at a time, right-aligned dates stay on their line."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from ats import extract  # noqa: E402
+from extract_throughput import LEFT, RIGHT, dated_resume, synthetic_corpus  # noqa: E402
+
+
+def _layout(path):
+    with open(path, "rb") as f:
+        pages, _ = extract.extract_pages(f.read(), extractor="layout", parallel=False, ocr=False)
+    return pages[0]
+
+
+def test_right_aligned_dates_stay_on_their_role_line(tmp_path):
+    path = str(tmp_path / "dated.pdf")
+    dated_resume(path)
+    lines = _layout(path).splitlines()
+    assert "Data Scientist, Acme 2021 - 2024" in lines
+    assert "Analyst, Globex 2018 - 2021" in lines
+
+
+def test_two_columns_are_read_one_after_the_other(tmp_path):
+    path = next(p for p in synthetic_corpus(str(tmp_path)) if p.endswith("2col_1p.pdf"))
+    text = _layout(path)
+    # The whole left column comes before the right one
+    assert text.index(LEFT[-1]) < text.index(RIGHT[0])
@@ -0,0 +1,82 @@
+"""The response cache must serve repeated deterministic calls, starting from an empty cache."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# The backend answers instantly; don't wait on the real quota
+os.environ.setdefault("GEMINI_RPM", "6000")
+os.environ.setdefault("GEMINI_BURST", "100")
+
+import pytest  # noqa: E402
+
+from ats import gemini, response_cache  # noqa: E402
+from ats.llm import registry  # noqa: E402
+from ats.llm_stub import StubBackend, StubModel, StubResponse  # noqa: E402
+from ats.structured import MATCH_SCHEMA, StructuredOutputError, generate_structured  # noqa: E402
+
+
+class CountingBackend(StubBackend):
+    def __init__(self, broken=False):
+        self.calls = 0
+        self.broken = broken
+
+    def model(self, model_name, generation_config=None):
+        backend = self
+
+        class Model(StubModel):
+            def generate_content(self, contents, stream=False, **kwargs):
+                backend.calls += 1
+                if backend.broken:
+                    return StubResponse("not json", 2)
+                return super().generate_content(contents, stream=stream, **kwargs)
+
+        return Model(model_name, generation_config, latency_ms=0, tokens_per_sec=0, output_tokens=50)
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    monkeypatch.setattr(response_cache, "_default_cache",
+                        response_cache.ResponseCache(str(tmp_path / "responses.sqlite")))
+    counting = CountingBackend()
+    registry.use(counting)
+    yield counting
+    registry.use(StubBackend())
+
+
+def test_second_deterministic_call_is_served_from_cache(backend):
+    assert len(response_cache.get_response_cache()) == 0
+    first = gemini.get_gemini_response("Explain binary search.", action="Test", deterministic=True)
+    second = gemini.get_gemini_response("Explain binary search.", action="Test", deterministic=True)
+    assert second == first
+    assert backend.calls == 1
+    assert len(response_cache.get_response_cache()) == 1
+
+
+def test_streamed_answer_is_cached(backend):
+    streamed = "".join(gemini.stream_gemini_response("Explain quicksort.", action="Test", deterministic=True))
+    again = "".join(gemini.stream_gemini_response("Explain quicksort.", action="Test", deterministic=True))
+    assert again == streamed
+    assert backend.calls == 1
+
+
+def test_invalid_json_is_not_replayed_from_cache(backend):
+    backend.broken = True
+    for attempt in range(3):
+        with pytest.raises(StructuredOutputError):
+            generate_structured(gemini.get_gemini_response, "Score this resume.", MATCH_SCHEMA, action="Test")
+    # Each attempt makes the first call and the repair call again
+    assert backend.calls == 6
+    assert len(response_cache.get_response_cache()) == 0
+
+
+def test_stream_failing_midway_is_flagged_and_not_cached(backend, monkeypatch):
+    def broken_stream(self, text, prompt_tokens):
+        yield StubResponse(text[:20], prompt_tokens)
+        raise RuntimeError("connection reset")
+
+    monkeypatch.setattr(StubModel, "_stream", broken_stream)
+    status = {}
+    text = "".join(gemini.stream_gemini_response("Explain heaps.", action="Test", deterministic=True, status=status))
+    assert status["error"].startswith("API Error:")
+    assert text.endswith(status["error"])
+    assert len(response_cache.get_response_cache()) == 0
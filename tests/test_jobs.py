@@ -0,0 +1,56 @@
+"""JobQueue: identical in-flight jobs share one id; failures are stored as failed."""
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ats.concurrency import FairExecutor  # noqa: E402
+from ats.jobs import DONE, FAILED, JobQueue  # noqa: E402
+
+
+def finished(queue, job_id, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = queue.get(job_id)
+        if job.finished:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+def test_identical_job_in_flight_is_not_started_twice(tmp_path):
+    release = threading.Event()
+    calls = []
+
+    def runner(prompt, action, **kwargs):
+        calls.append(prompt)
+        release.wait(5)
+        return f"answer to {prompt}"
+
+    queue = JobQueue(runner, str(tmp_path / "jobs.sqlite"), FairExecutor(max_workers=2))
+    first = queue.submit("plan", "Learning_Path", duration="3 Months")
+    assert queue.submit("plan", "Learning_Path", duration="3 Months") == first
+    other = queue.submit("plan", "Learning_Path", duration="6 Months")
+    assert other != first
+    release.set()
+    job = finished(queue, first)
+    assert (job.status, job.result) == (DONE, "answer to plan")
+    finished(queue, other)
+    assert len(calls) == 2
+    # Once finished, the same request is a new generation
+    assert queue.submit("plan", "Learning_Path", duration="3 Months") != first
+
+
+def test_failures_are_recorded(tmp_path):
+    def runner(prompt, action, **kwargs):
+        if prompt == "raise":
+            raise RuntimeError("quota exceeded")
+        return "API Error: 500"
+
+    queue = JobQueue(runner, str(tmp_path / "jobs.sqlite"), FairExecutor(max_workers=2))
+    raised = finished(queue, queue.submit("raise", "Test"))
+    assert (raised.status, raised.error, raised.result) == (FAILED, "quota exceeded", None)
+    returned = finished(queue, queue.submit("error string", "Test"))
+    assert (returned.status, returned.error) == (FAILED, "API Error: 500")
@@ -0,0 +1,44 @@
+"""BM25 ranking and the instant keyword match."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ats.ranking import ResumeIndex, extract_keywords, keyword_match, tokenize  # noqa: E402
+
+JD = ("Data Scientist with Python, SQL and machine learning. Machine learning models deployed with Docker. "
+      "Experience with C++ is a plus.")
+
+
+def test_tokens_keep_skill_spellings_and_drop_noise():
+    tokens = tokenize("Strong C++, C# and Node.js; R and a 5 year degree.")
+    assert {"c++", "c#", "node.js", "r"} <= set(tokens)
+    assert not {"strong", "a", "5", "year", "degree"} & set(tokens)
+
+
+def test_repeated_pairs_become_keywords():
+    keywords = extract_keywords(JD)
+    assert "machine learning" in keywords
+    assert keywords["machine"] > keywords["docker"]
+    assert "python sql" not in keywords
+
+
+def test_rank_orders_by_relevance():
+    index = ResumeIndex([
+        ("unrelated", "Chef with pastry and catering background."),
+        ("partial", "Analyst using SQL and Excel."),
+        ("strong", "Python developer doing machine learning, SQL, Docker and C++."),
+    ])
+    ranking = index.rank(JD)
+    assert [name for name, _, _ in ranking] == ["strong", "partial", "unrelated"]
+    assert ranking[-1][1] == 0 and ranking[-1][2] == 0
+    assert 0 < ranking[1][2] < ranking[0][2] <= 100
+    assert [name for name, _, _ in index.rank(JD, top_k=1)] == ["strong"]
+
+
+def test_keyword_match_splits_matched_and_missing():
+    percentage, matched, missing = keyword_match(JD, "Python and SQL, machine learning in production.")
+    assert {"python", "sql", "machine learning"} <= set(matched)
+    assert {"docker", "c++"} <= set(missing)
+    assert 0 < percentage < 100
+    assert keyword_match("", "anything") == (0.0, [], [])
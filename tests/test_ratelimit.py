@@ -0,0 +1,81 @@
+"""TokenBucket spacing and Coalescer single-flight."""
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest  # noqa: E402
+
+from ats.ratelimit import Coalescer, TokenBucket  # noqa: E402
+
+
+def test_bucket_allows_a_burst_then_waits_for_refill():
+    bucket = TokenBucket(rate=20, capacity=3)
+    started = time.monotonic()
+    for _ in range(3):
+        assert bucket.acquire(timeout=0)
+    assert not bucket.acquire(timeout=0)
+    assert bucket.acquire(timeout=1)
+    # The fourth token needed about 1/20 s of refill
+    assert 0.03 < time.monotonic() - started < 0.5
+
+
+def test_bucket_gives_up_after_its_timeout():
+    bucket = TokenBucket(rate=0.1, capacity=1)
+    assert bucket.acquire()
+    started = time.monotonic()
+    assert not bucket.acquire(timeout=0.1)
+    assert time.monotonic() - started < 0.5
+
+
+def test_concurrent_callers_with_one_key_share_one_call():
+    coalescer = Coalescer()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        release.wait(5)
+        return "answer"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(coalescer.do("key", slow))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert results == ["answer"] * 4
+    assert len(calls) == 1
+
+
+def test_failures_reach_every_waiter_and_are_not_kept():
+    coalescer = Coalescer()
+    release = threading.Event()
+    errors = []
+
+    def broken():
+        release.wait(5)
+        raise ConnectionError("reset")
+
+    def call():
+        try:
+            coalescer.do("key", broken)
+        except ConnectionError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert len(errors) == 3
+    # The next call with the same key runs again instead of replaying the error
+    assert coalescer.do("key", lambda: "fresh") == "fresh"
+    with pytest.raises(ValueError):
+        coalescer.do("other", lambda: int("x"))
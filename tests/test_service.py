@@ -0,0 +1,30 @@
+"""The streaming pipeline keeps one row per file, named so duplicates can be told apart."""
+import io
+import os
+import sys
+import zipfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from app_flows import sample_resume  # noqa: E402
+from ats.batch import collect_pdfs  # noqa: E402
+from ats.service import process_resumes  # noqa: E402
+
+
+def echo(prompt, **kwargs):
+    return f"Updated: {prompt[-40:]}"
+
+
+def test_same_name_in_two_zip_folders_gets_two_rows():
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("a/resume.pdf", sample_resume(1))
+        zf.writestr("b/resume.pdf", sample_resume(2))
+        zf.writestr("b/notes.pdf", b"not a pdf")
+    items = collect_pdfs([("team.zip", archive.getvalue())])
+    rows = {row.name: row for row in process_resumes(items, "Data Scientist", ("updated_resume",), echo)}
+    assert sorted(rows) == ["notes.pdf", "resume.pdf", "resume.pdf (2)"]
+    assert rows["resume.pdf"].results["updated_resume"] != rows["resume.pdf (2)"].results["updated_resume"]
+    assert rows["notes.pdf"].error.startswith("Failed to read PDF")
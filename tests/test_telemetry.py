@@ -0,0 +1,30 @@
+"""Usage summary: counts, rates and percentiles per action, buffered records included."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ats.telemetry import Telemetry  # noqa: E402
+
+
+def test_summary_per_action(tmp_path):
+    telemetry = Telemetry(str(tmp_path / "telemetry.sqlite"), flush_interval=3600)
+    for ms in range(100, 0, -1):
+        telemetry.record("Match", latency_ms=ms, first_token_ms=ms / 2, prompt_tokens=10, response_tokens=ms,
+                         cache="hit" if ms % 4 == 0 else "miss", error="API Error" if ms % 10 == 0 else "")
+    telemetry.flush()
+    # Still in the buffer when the summary is asked for
+    telemetry.record("Teach", latency_ms=7, cache="off")
+
+    match, teach = telemetry.summary()
+    assert match == {"action": "Match", "calls": 100, "errors": 10, "cache_hit_rate": 0.25,
+                     "p50_ms": 50, "p95_ms": 95, "p99_ms": 99, "p50_first_token_ms": 25,
+                     "avg_prompt_tokens": 10, "avg_response_tokens": 50}
+    assert (teach["action"], teach["calls"], teach["p99_ms"], teach["cache_hit_rate"]) == ("Teach", 1, 7, 0)
+
+
+def test_summary_respects_since_and_empty_store(tmp_path):
+    telemetry = Telemetry(str(tmp_path / "telemetry.sqlite"), flush_interval=3600)
+    assert telemetry.summary() == []
+    telemetry.record("Match", latency_ms=5)
+    assert telemetry.summary(since=4102444800) == []
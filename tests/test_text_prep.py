@@ -0,0 +1,46 @@
+"""Resume compaction and trimming to a budget."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ats.text_prep import normalize_pages, trim_sections  # noqa: E402
+
+
+def test_repeated_headers_footers_and_page_numbers_are_dropped():
+    pages = [
+        "Jane Doe  |  jane@example.com\nEXPERIENCE\nData   Scientist, Acme\n\n\n\nPage 1 of 2",
+        "Jane Doe  |  jane@example.com\nAnalyst, Globex\nAnalyst, Globex\n2",
+    ]
+    assert normalize_pages(pages) == "EXPERIENCE\nData Scientist, Acme\n\nAnalyst, Globex"
+
+
+def test_single_page_keeps_every_line():
+    assert normalize_pages(["Jane Doe\n\tPython \t SQL\n\n\nEDUCATION"]) == "Jane Doe\nPython SQL\n\nEDUCATION"
+
+
+SKILLS = ", ".join(f"Skill{i}" for i in range(200))
+
+
+def test_long_line_is_cut_at_a_comma_not_dropped():
+    text = f"SKILLS\n{SKILLS}\n\nEDUCATION\nBSc Computer Science, 2018"
+    trimmed = trim_sections(text, len(text) // 4)
+    skills = trimmed.splitlines()[1]
+    assert skills.startswith("Skill0, Skill1, Skill2")
+    assert skills.endswith(" …") and skills[:-2].split(", ")[-1].startswith("Skill")
+    assert len(skills) < len(SKILLS) // 2
+    assert "BSc Computer Science, 2018" in trimmed
+
+
+def test_every_section_keeps_its_heading_and_opening():
+    experience = "\n".join(f"Built pipeline number {i} for the analytics team." for i in range(60))
+    text = f"EXPERIENCE\n{experience}\nPROJECTS\n{experience}"
+    trimmed = trim_sections(text, len(text) // 5)
+    assert len(trimmed) < len(text) // 3
+    lines = trimmed.splitlines()
+    assert lines[:2] == ["EXPERIENCE", "Built pipeline number 0 for the analytics team."]
+    assert "PROJECTS" in lines and lines.count("…") + sum(line.endswith(" …") for line in lines) == 2
+
+
+def test_short_text_is_unchanged():
+    assert trim_sections("SKILLS\nPython", 100) == "SKILLS\nPython"